@@ -3,7 +3,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.translation import gettext_lazy as _
 
-from .models import Like, Post, User
+from .models import BlacklistedToken, Like, LikeDailyStat, Post, StatisticCounter, User
 
 
 class CustomUserAdmin(UserAdmin):
@@ -39,6 +39,7 @@ class PostAdmin(admin.ModelAdmin):
 
     list_display = ("id", "user", "message", "created_at")
     list_display_links = ("id", "user", "message")
+    list_select_related = ("user",)
 
 
 class LikeAdmin(admin.ModelAdmin):
@@ -46,8 +47,32 @@ class LikeAdmin(admin.ModelAdmin):
 
     list_display = ("id", "user", "message", "eval")
     list_display_links = ("id", "user", "message")
+    list_select_related = ("user", "message__user")
+
+
+class LikeDailyStatAdmin(admin.ModelAdmin):
+    """LikeDailyStat model admin site settings."""
+
+    list_display = ("id", "date", "shard", "likes")
+    list_display_links = ("id", "date")
+
+
+class StatisticCounterAdmin(admin.ModelAdmin):
+    """StatisticCounter model admin site settings."""
+
+    list_display = ("id", "users", "posts", "likes")
+
+
+class BlacklistedTokenAdmin(admin.ModelAdmin):
+    """BlacklistedToken model admin site settings."""
+
+    list_display = ("id", "jti", "expires_at")
+    list_display_links = ("id", "jti")
 
 
 admin.site.register(User, CustomUserAdmin)
 admin.site.register(Post, PostAdmin)
 admin.site.register(Like, LikeAdmin)
+admin.site.register(LikeDailyStat, LikeDailyStatAdmin)
+admin.site.register(StatisticCounter, StatisticCounterAdmin)
+admin.site.register(BlacklistedToken, BlacklistedTokenAdmin)
@@ -0,0 +1,140 @@
+"""Async views for 'api' app, served natively under ASGI."""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.serializers import Serializer
+
+from .authentication import CachedJWTAuthentication
+from .models import Post
+from .serializers import LikeSerializer, PostSerializer
+from .services.activity import activity_tracker
+from .services.model_operations import (
+    delete_like,
+    get_analitic_like_values,
+    upsert_like,
+)
+from .services.utils import (
+    get_like,
+    get_request_data,
+    process_date_input,
+    to_positive_int,
+)
+
+
+class AsyncAPIView(View):
+    """
+    Class for async JSON view for authenticated users.
+
+    Request is authenticated with CachedJWTAuthentication, which queries
+    database only on user cache miss, and user activity is recorded in
+    write-behind activity tracker, like in sync views.
+    """
+
+    authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+
+    @classmethod
+    def as_view(cls, **initkwargs: Any) -> Callable:
+        """Get view function exempt from CSRF check, as token auth is used."""
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """Authenticate request, record user activity and call handler."""
+        try:
+            result: Optional[Tuple] = await self.authentication.aauthenticate(request)
+        except AuthenticationFailed as error:
+            return JsonResponse(
+                error.detail
+                if isinstance(error.detail, dict)
+                else {"detail": error.detail},
+                status=error.status_code,
+            )
+        if result is None:
+            return JsonResponse(
+                {"detail": "Authentication credentials were not provided."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+        request.user = result[0]
+        if activity_tracker.record(request.user.pk):
+            await sync_to_async(activity_tracker.flush)()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncPostCreateView(AsyncAPIView):
+    """Class with only POST method for creating message (post) asynchronously."""
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        """Validate input data and create Post instance."""
+        serializer: Serializer = PostSerializer(data=get_request_data(request))
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        post: Post = await Post.objects.acreate(
+            user=request.user, **serializer.validated_data
+        )
+        return JsonResponse(PostSerializer(post).data, status=status.HTTP_201_CREATED)
+
+
+class AsyncLikeView(AsyncAPIView):
+    """Class with POST and DELETE methods for processing Likes asynchronously."""
+
+    async def post(self, request: HttpRequest) -> JsonResponse:
+        """
+        Create Like instance or change its evaluation.
+
+        Input and responses are the same as in LikeView.
+        """
+        data: Dict = get_request_data(request)
+        if (like := get_like(str(data.get("eval", "")).lower())) is None:
+            return JsonResponse(
+                {"result": "Invalid input data."}, status=status.HTTP_406_NOT_ACCEPTABLE
+            )
+        message_id: Any = data.get("message_id")
+        post_id: Optional[int] = to_positive_int(message_id)
+        result: Optional[Tuple] = None
+        if post_id is not None:
+            result = await sync_to_async(upsert_like)(request.user.pk, post_id, like)
+        if result is None:
+            return JsonResponse(
+                {"message": [f'Invalid pk "{message_id}" - object does not exist.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return JsonResponse(LikeSerializer(result[0]).data)
+
+    async def delete(self, request: HttpRequest) -> JsonResponse:
+        """Delete Like instance."""
+        post_id: Optional[int] = to_positive_int(
+            get_request_data(request).get("message_id")
+        )
+        deleted: bool = False
+        if post_id is not None:
+            deleted = await sync_to_async(delete_like)(request.user.pk, post_id)
+        if deleted:
+            return JsonResponse({"result": "Like was successfully deleted."})
+        return JsonResponse(
+            {"result": "Like was not found"}, status=status.HTTP_404_NOT_FOUND
+        )
+
+
+class AsyncAnaliticView(AsyncAPIView):
+    """Class for async view with like analitic."""
+
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        """
+        Handle input and return analitics data.
+
+        Input and responses are the same as in AnaliticView.
+        """
+        if (input_data := process_date_input(request.GET)) is None:
+            return JsonResponse(
+                {"result": "Invalid input format."},
+                status=status.HTTP_406_NOT_ACCEPTABLE,
+            )
+        return JsonResponse(
+            {"analitics": [item async for item in get_analitic_like_values(input_data)]}
+        )
@@ -0,0 +1,111 @@
+"""Authentication classes for 'api' app."""
+import hashlib
+import time
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from .models import User
+from .services.cache import TTLCache
+
+# Ordered as model concrete fields, as Model.from_db expects.
+USER_CACHE_FIELDS: Tuple[str, ...] = tuple(
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname in ("id", "is_active", "is_staff")
+)
+
+user_cache: TTLCache = TTLCache(
+    settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TTL
+)
+
+token_cache: TTLCache = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, ttl=0)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    Class for JWT authentication with per-process caches of tokens and users.
+
+    Validated tokens are cached by raw token digest until their expiration,
+    so a repeated token is not decoded and verified again.
+    Only id, is_active and is_staff are cached, other User fields are
+    deferred and loaded on access. Entries are dropped on User save and
+    delete signals of the same process, changes made by other processes or
+    by queryset updates are picked up after AUTH_USER_CACHE_TTL seconds.
+    """
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """Get validated token from cache or validate and cache it till exp."""
+        key: bytes = hashlib.sha256(raw_token).digest()
+        token: Optional[Token] = token_cache.get(key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            if "exp" in token:
+                token_cache.set(key, token, ttl=token["exp"] - time.time())
+        return token
+
+    def get_user(self, validated_token: Token) -> User:
+        """Get token user from cache or database and check it is active."""
+        user_id = self.get_token_user_id(validated_token)
+        values: Optional[Tuple] = user_cache.get(user_id)
+        if values is None:
+            values = self.get_user_values_queryset(user_id).first()
+            self.cache_user_values(user_id, values)
+        return self.build_user(values)
+
+    async def aget_user(self, validated_token: Token) -> User:
+        """Get token user from cache or with async query and check it is active."""
+        user_id = self.get_token_user_id(validated_token)
+        values: Optional[Tuple] = user_cache.get(user_id)
+        if values is None:
+            values = await self.get_user_values_queryset(user_id).afirst()
+            self.cache_user_values(user_id, values)
+        return self.build_user(values)
+
+    async def aauthenticate(self, request: HttpRequest) -> Optional[Tuple[User, Token]]:
+        """Authenticate Django request in async view."""
+        header: Optional[bytes] = self.get_header(request)
+        if header is None:
+            return None
+        raw_token: Optional[bytes] = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token: Token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    @staticmethod
+    def get_token_user_id(validated_token: Token) -> Any:
+        """Get user id claim of token."""
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+    @staticmethod
+    def get_user_values_queryset(user_id: Any) -> QuerySet:
+        """Get queryset with cached fields values of user."""
+        return User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values_list(
+            *USER_CACHE_FIELDS
+        )
+
+    @staticmethod
+    def cache_user_values(user_id: Any, values: Optional[Tuple]) -> None:
+        """Cache user fields values or raise AuthenticationFailed, if not found."""
+        if values is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        user_cache.set(user_id, values)
+
+    @staticmethod
+    def build_user(values: Tuple) -> User:
+        """Build User instance from cached values and check it is active."""
+        user: User = User.from_db("default", USER_CACHE_FIELDS, values)
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,61 @@
+"""Authentication backends for 'api' app."""
+from typing import Any, Optional
+
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import identify_hasher
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest
+from rest_framework.request import Request
+
+from .models import User
+from .services.hashing import HashingPoolSaturated, password_hashing_pool
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    Class for model authentication with password checked on hashing pool.
+
+    Unknown usernames are answered after hashing the given password too,
+    so response time does not reveal whether user exists. Saturated hashing
+    pool fails DRF requests with 503 response, other callers, like admin
+    login form, get failed authentication instead of server error.
+    """
+
+    def authenticate(
+        self,
+        request: Optional[HttpRequest],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs: Any
+    ) -> Optional[User]:
+        """Authenticate user by username and password."""
+        try:
+            return self.authenticate_on_pool(request, username, password, **kwargs)
+        except HashingPoolSaturated:
+            if isinstance(request, Request):
+                raise
+            raise PermissionDenied
+
+    def authenticate_on_pool(
+        self,
+        request: Optional[HttpRequest],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs: Any
+    ) -> Optional[User]:
+        """Authenticate user with password checked on hashing pool."""
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user: User = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            password_hashing_pool.make_password(password)
+            return None
+        if not password_hashing_pool.check_password(password, user.password):
+            return None
+        if identify_hasher(user.password).must_update(user.password):
+            user.password = password_hashing_pool.make_password(password)
+            user.save(update_fields=["password"])
+        return user if self.user_can_authenticate(user) else None
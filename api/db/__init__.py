@@ -0,0 +1 @@
+"""Init module for api.db database backend package."""
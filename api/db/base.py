@@ -0,0 +1,166 @@
+"""
+PostgreSQL database backend for 'api' app with per-process connection guard.
+
+Connections are persistent and health-checked by Django (CONN_MAX_AGE,
+CONN_HEALTH_CHECKS), this backend adds maximum number of open connections
+per process and counters reported by diagnostics endpoint.
+"""
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from django.db import OperationalError
+from django.db.backends.postgresql import base
+
+DEFAULT_POOL_MAX_SIZE: int = 10
+DEFAULT_POOL_TIMEOUT: float = 10.0
+
+
+class ConnectionPool:
+    """
+    Class for limiting and measuring open connections of one alias in process.
+
+    Opening connection waits for free slot up to timeout seconds. Slot is
+    released, when connection is closed or its wrapper is garbage collected.
+    """
+
+    def __init__(self, max_size: int, timeout: float) -> None:
+        """Initialize pool with maximum open connections and wait timeout."""
+        self.max_size: int = max_size
+        self.timeout: float = timeout
+        self._slots: threading.BoundedSemaphore = threading.BoundedSemaphore(max_size)
+        self._lock: threading.Lock = threading.Lock()
+        self._wrappers: weakref.WeakSet = weakref.WeakSet()
+        self.opened: int = 0
+        self.closed: int = 0
+        self.timeouts: int = 0
+        self.health_check_failures: int = 0
+        self.acquire_count: int = 0
+        self.acquire_total: float = 0.0
+        self.acquire_max: float = 0.0
+
+    def acquire(self, wrapper: "DatabaseWrapper") -> float:
+        """Wait for free slot for wrapper connection and return waited seconds."""
+        started_at: float = time.perf_counter()
+        if not self._slots.acquire(timeout=self.timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise OperationalError(
+                f"Connection pool of {self.max_size} connections is exhausted."
+            )
+        with self._lock:
+            self._wrappers.add(wrapper)
+        return time.perf_counter() - started_at
+
+    def release(self) -> None:
+        """Release connection slot."""
+        with self._lock:
+            self.closed += 1
+        self._slots.release()
+
+    def record_connect(self, seconds: float) -> None:
+        """Record connection acquire latency, including slot wait."""
+        with self._lock:
+            self.opened += 1
+            self.acquire_count += 1
+            self.acquire_total += seconds
+            self.acquire_max = max(self.acquire_max, seconds)
+
+    def record_health_check_failure(self) -> None:
+        """Count connection found unusable by health check."""
+        with self._lock:
+            self.health_check_failures += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get open, idle and in use connections and acquire latency."""
+        with self._lock:
+            wrappers = [
+                wrapper for wrapper in self._wrappers if wrapper.connection is not None
+            ]
+            in_use: int = sum(wrapper.in_use for wrapper in wrappers)
+            return {
+                "max_size": self.max_size,
+                "open": len(wrappers),
+                "in_use": in_use,
+                "idle": len(wrappers) - in_use,
+                "opened": self.opened,
+                "closed": self.closed,
+                "timeouts": self.timeouts,
+                "health_check_failures": self.health_check_failures,
+                "acquire_latency_ms": {
+                    "count": self.acquire_count,
+                    "avg": round(1000 * self.acquire_total / self.acquire_count, 3)
+                    if self.acquire_count
+                    else 0.0,
+                    "max": round(1000 * self.acquire_max, 3),
+                },
+            }
+
+
+pools: Dict[str, ConnectionPool] = dict()
+pools_lock: threading.Lock = threading.Lock()
+
+
+def get_pool(alias: str, settings_dict: Dict) -> ConnectionPool:
+    """Get connection pool of alias, creating it from POOL settings."""
+    with pools_lock:
+        if alias not in pools:
+            options: Dict = settings_dict.get("POOL") or dict()
+            pools[alias] = ConnectionPool(
+                options.get("MAX_SIZE", DEFAULT_POOL_MAX_SIZE),
+                options.get("TIMEOUT", DEFAULT_POOL_TIMEOUT),
+            )
+        return pools[alias]
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL database wrapper with connection slots and usage tracking."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize wrapper, connection is idle till cursor is created."""
+        super().__init__(*args, **kwargs)
+        self.in_use: bool = False
+        self._pool_slot: Optional[weakref.finalize] = None
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Get connection pool of wrapper alias."""
+        return get_pool(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params: Dict) -> Any:
+        """Open connection, once number of open connections allows it."""
+        pool: ConnectionPool = self.pool
+        started_at: float = time.perf_counter()
+        pool.acquire(self)
+        slot: weakref.finalize = weakref.finalize(self, pool.release)
+        try:
+            connection: Any = super().get_new_connection(conn_params)
+        except Exception:
+            slot()
+            raise
+        self._pool_slot = slot
+        pool.record_connect(time.perf_counter() - started_at)
+        return connection
+
+    def create_cursor(self, name: Optional[str] = None) -> Any:
+        """Create cursor and mark connection as in use."""
+        self.in_use = True
+        return super().create_cursor(name)
+
+    def is_usable(self) -> bool:
+        """Check connection and count failed health checks."""
+        usable: bool = super().is_usable()
+        if not usable:
+            self.pool.record_health_check_failure()
+        return usable
+
+    def _close(self) -> None:
+        """Close connection and release its slot."""
+        try:
+            super()._close()
+        finally:
+            self.in_use = False
+            if self._pool_slot is not None:
+                self._pool_slot()
+                self._pool_slot = None
@@ -0,0 +1,32 @@
+"""Module for deleting duplicated likes command."""
+from typing import Any
+
+from django.core.management import BaseCommand
+
+from api.services.model_operations import (
+    delete_duplicated_likes,
+    is_like_deduplication_needed,
+)
+
+
+class Command(BaseCommand):
+    """Class for deleting duplicated likes functionality."""
+
+    help = (
+        "Delete all but the latest Like of every user and post pair. "
+        "Run it before migration adding Like unique constraint, it is skipped "
+        "once the constraint exists."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Delete duplicated likes and report their number."""
+        if not is_like_deduplication_needed():
+            print("Likes are unique by constraint, deduplication is skipped.")
+            return
+        likes_number: int = delete_duplicated_likes()
+        print(f"{likes_number} duplicated likes were deleted.")
+        if likes_number:
+            print(
+                "Run rebuild_like_daily_stats, reconcile_post_like_counters and "
+                "rebuild_statistic_counter commands after migration."
+            )
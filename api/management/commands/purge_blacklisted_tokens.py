@@ -0,0 +1,17 @@
+"""Module for purging expired blacklisted tokens command."""
+from typing import Any
+
+from django.core.management import BaseCommand
+
+from api.services.blacklist import purge_blacklisted_tokens
+
+
+class Command(BaseCommand):
+    """Class for deleting expired blacklisted tokens functionality."""
+
+    help = "Delete blacklisted refresh tokens that have already expired."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Purge expired blacklisted tokens."""
+        deleted: int = purge_blacklisted_tokens()
+        print(f"{deleted} expired blacklisted tokens were purged.")
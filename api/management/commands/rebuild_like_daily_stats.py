@@ -0,0 +1,31 @@
+"""Module for rebuilding daily likes rollup command."""
+from typing import Any
+
+from django.core.management import BaseCommand, CommandParser
+
+from api.services.model_operations import (
+    is_like_daily_stats_backfill_needed,
+    rebuild_like_daily_stats,
+)
+
+
+class Command(BaseCommand):
+    """Class for backfilling and rebuilding daily likes rollup functionality."""
+
+    help = "Recalculate LikeDailyStat rows from Like table."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add if missing argument."""
+        parser.add_argument(
+            "--if-missing",
+            action="store_true",
+            help="Backfill rollup only if it is empty, while likes exist.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild daily likes rollup in one transaction."""
+        if options["if_missing"] and not is_like_daily_stats_backfill_needed():
+            print("Daily likes rollup exists, backfill is skipped.")
+            return
+        days_number: int = rebuild_like_daily_stats()
+        print(f"Daily likes rollup was rebuilt for {days_number} days.")
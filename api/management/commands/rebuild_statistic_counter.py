@@ -0,0 +1,20 @@
+"""Module for rebuilding statistic counter command."""
+from typing import Any, Dict
+
+from django.core.management import BaseCommand
+
+from api.services.model_operations import rebuild_statistic_counter
+
+
+class Command(BaseCommand):
+    """Class for recalculating users, posts and likes counter functionality."""
+
+    help = "Recalculate StatisticCounter shards with exact table numbers."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild statistic counter shards."""
+        numbers: Dict[str, int] = rebuild_statistic_counter()
+        print(
+            f"Statistic counter was rebuilt: users - {numbers['users']}, "
+            f"posts - {numbers['posts']}, likes - {numbers['likes']}."
+        )
@@ -0,0 +1,37 @@
+"""Module for reconciling Post likes and dislikes counters command."""
+from typing import Any
+
+from django.core.management import BaseCommand, CommandParser
+
+from api.services.model_operations import (
+    is_post_like_counters_backfill_needed,
+    reconcile_post_like_counters,
+)
+
+
+class Command(BaseCommand):
+    """Class for fixing drifted Post likes and dislikes counters functionality."""
+
+    help = "Recalculate Post likes and dislikes counters by chunks of posts."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add chunk size and if missing arguments."""
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of posts processed in one transaction.",
+        )
+        parser.add_argument(
+            "--if-missing",
+            action="store_true",
+            help="Backfill counters only if all are zero, while likes exist.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Reconcile Post like counters."""
+        if options["if_missing"] and not is_post_like_counters_backfill_needed():
+            print("Post like counters exist, backfill is skipped.")
+            return
+        fixed: int = reconcile_post_like_counters(options["chunk_size"])
+        print(f"Post like counters were reconciled, {fixed} posts fixed.")
@@ -0,0 +1,153 @@
+"""Middleware module for 'api' app."""
+import json
+import logging
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.http import HttpRequest, HttpResponse
+
+from .services.metrics import metrics_registry
+from .services.timing import RequestTimings, current_timings
+
+logger: logging.Logger = logging.getLogger("api.timing")
+
+
+class ServerTimingMiddleware:
+    """
+    Class for measuring request processing stages.
+
+    Total, view, database, serializer and render durations and database
+    queries number are sent in Server-Timing response header and logged
+    by 'api.timing' logger as JSON line tagged with URL name. Request is
+    also recorded in process metrics, served by metrics endpoint. For
+    streamed responses header covers time to response start, while log
+    line and metrics are written after the last chunk and cover the whole
+    stream.
+    """
+
+    sync_capable: bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Initialize middleware with next handler in chain."""
+        self.get_response: Callable = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Time request processing."""
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings: RequestTimings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response: HttpResponse = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.process_timings(request, response, timings)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        """Time request processing in async mode."""
+        timings: RequestTimings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response: HttpResponse = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.process_timings(request, response, timings)
+
+    def process_template_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        """Start measuring rendering of DRF response."""
+        timings: Optional[RequestTimings] = current_timings.get()
+        if timings is not None:
+            timings.start_render()
+            response.add_post_render_callback(timings.finish_render)
+        return response
+
+    def process_timings(
+        self, request: HttpRequest, response: HttpResponse, timings: RequestTimings
+    ) -> HttpResponse:
+        """Add Server-Timing header and log timings, once response is done."""
+        timings.finish()
+        response["Server-Timing"] = timings.get_server_timing()
+        if response.streaming and response.is_async:
+            response.streaming_content = self.astream_content(
+                response.streaming_content, request, response, timings
+            )
+        elif response.streaming:
+            response.streaming_content = self.stream_content(
+                response.streaming_content, request, response, timings
+            )
+        else:
+            self.report_timings(request, response, timings)
+        return response
+
+    def stream_content(
+        self,
+        content: Iterable[bytes],
+        request: HttpRequest,
+        response: HttpResponse,
+        timings: RequestTimings,
+    ) -> Iterator[bytes]:
+        """Yield response chunks, counting queries run while streaming."""
+        current_timings.set(timings)
+        try:
+            yield from content
+        finally:
+            current_timings.set(None)
+            timings.finish()
+            self.report_timings(request, response, timings)
+
+    async def astream_content(
+        self,
+        content: AsyncIterable[bytes],
+        request: HttpRequest,
+        response: HttpResponse,
+        timings: RequestTimings,
+    ) -> AsyncIterator[bytes]:
+        """Yield async response chunks, counting queries run while streaming."""
+        current_timings.set(timings)
+        try:
+            async for chunk in content:
+                yield chunk
+        finally:
+            current_timings.set(None)
+            timings.finish()
+            self.report_timings(request, response, timings)
+
+    @staticmethod
+    def report_timings(
+        request: HttpRequest, response: HttpResponse, timings: RequestTimings
+    ) -> None:
+        """Record timings in metrics and log them as JSON line."""
+        url_name: Optional[str] = getattr(request.resolver_match, "url_name", None)
+        milliseconds: Dict[str, float] = timings.get_milliseconds()
+        metrics_registry.observe_request(
+            url_name or "unresolved",
+            response.status_code,
+            milliseconds["total"] / 1000,
+            timings.db_queries,
+            milliseconds["db"] / 1000,
+        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        record: Dict[str, Any] = {
+            "url_name": url_name,
+            "method": request.method,
+            "status": response.status_code,
+            "streaming": response.streaming,
+            "db_queries": timings.db_queries,
+        }
+        record.update({f"{name}_ms": value for name, value in milliseconds.items()})
+        logger.info(json.dumps(record))
@@ -1,9 +1,25 @@
 """Module for 'api' app models."""
+from typing import Any, Dict, Tuple
+
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
+
+
+class AtomicSaveMixin:
+    """
+    Class for saving model instance with its signal receivers atomically.
+
+    Statistic receivers of saved instance run in the same transaction as
+    its write, so no one sees the write committed without its deltas.
+    """
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save instance and run its signal receivers in one transaction."""
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            super().save(*args, **kwargs)
 
 
-class User(AbstractUser):
+class User(AtomicSaveMixin, AbstractUser):
     """Custom User model."""
 
     last_request_at = models.DateTimeField(
@@ -11,27 +27,137 @@ class User(AbstractUser):
     )
 
 
-class Post(models.Model):
+class Post(AtomicSaveMixin, models.Model):
     """Model for 'api' posts."""
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="Post author")
     message = models.CharField(max_length=255, verbose_name="Post message")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
+    likes_count = models.IntegerField(default=0, verbose_name="Likes number")
+    dislikes_count = models.IntegerField(default=0, verbose_name="Dislikes number")
 
     def __str__(self) -> str:
         """Represent model instance."""
         return f"Posted by {self.user} {self.created_at}"
 
 
-class Like(models.Model):
+class LikeQuerySet(models.QuerySet):
+    """
+    QuerySet class for Like model.
+
+    Likes are deleted with one DELETE statement updating their statistic,
+    so Like model has no delete signal receivers and stays fast deleted
+    on Post and User cascades. Saved Likes update statistic by signal
+    receivers, update() does not, so Likes are changed by upsert_like(s)
+    or save().
+    """
+
+    def delete(self) -> Tuple[int, Dict[str, int]]:
+        """Delete Likes of queryset with their statistic."""
+        from .services.model_operations import delete_likes
+
+        if self.query.is_sliced:
+            raise TypeError("Cannot use 'limit' or 'offset' with delete().")
+        deleted: int = delete_likes(self)
+        return deleted, {self.model._meta.label: deleted}
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class Like(AtomicSaveMixin, models.Model):
     """Model for post like."""
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name="Like author")
-    message = models.ForeignKey(Post, on_delete=models.CASCADE, verbose_name="Post")
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, db_index=False, verbose_name="Like author"
+    )
+    message = models.ForeignKey(
+        Post, on_delete=models.CASCADE, db_index=False, verbose_name="Post"
+    )
     eval = models.BooleanField(default=False, verbose_name="Evaluation")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
 
+    objects = LikeQuerySet.as_manager()
+
+    class Meta:
+        """Class Meta for Like model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "message"], name="unique_like_user_message"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["message"], include=["eval"], name="like_message_eval_idx"
+            ),
+        ]
+
     def __str__(self) -> str:
         """Represent model instance."""
         return f"Like by {self.user} {self.created_at}"
+
+    def delete(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, int]]:
+        """Delete Like with its statistic."""
+        return Like.objects.filter(pk=self.pk).delete()
+
+
+class LikeDailyStat(models.Model):
+    """
+    Model for shard of likes number rollup per day.
+
+    Day likes number is sum over its shards. Every created or deleted like
+    adds its delta to row of its day and random shard, so concurrent like
+    writes of the current day do not queue on one row lock. Batch likes
+    fold their updates into one per day.
+    """
+
+    date = models.DateField(verbose_name="Date")
+    shard = models.PositiveSmallIntegerField(default=1, verbose_name="Shard")
+    likes = models.IntegerField(default=0, verbose_name="Likes")
+
+    class Meta:
+        """Class Meta for LikeDailyStat model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "shard"], name="unique_like_daily_stat_date_shard"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Represent model instance."""
+        return f"{self.likes} likes at {self.date}"
+
+
+class StatisticCounter(models.Model):
+    """
+    Model for shard of users, posts and likes numbers.
+
+    Numbers are sums over STATISTIC_COUNTER_SHARDS rows. Every write adds
+    its delta to random shard, so concurrent writes do not queue on one row
+    lock. Deltas are written in the same transaction as users, posts and
+    likes, by signal receivers of their atomic saves and deletes or by
+    the writing statement itself. Drift, e.g. after raw SQL writes, is
+    fixed by rebuild_statistic_counter command.
+    """
+
+    users = models.BigIntegerField(default=0, verbose_name="Users number")
+    posts = models.BigIntegerField(default=0, verbose_name="Posts number")
+    likes = models.BigIntegerField(default=0, verbose_name="Likes number")
+
+    def __str__(self) -> str:
+        """Represent model instance."""
+        return f"Users - {self.users}, posts - {self.posts}, likes - {self.likes}"
+
+
+class BlacklistedToken(models.Model):
+    """Model for blacklisted refresh token JTI."""
+
+    jti = models.CharField(max_length=255, unique=True, verbose_name="Token JTI")
+    expires_at = models.DateTimeField(db_index=True, verbose_name="Expires at")
+
+    def __str__(self) -> str:
+        """Represent model instance."""
+        return f"Token {self.jti} till {self.expires_at}"
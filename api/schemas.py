@@ -30,6 +30,23 @@ user_register_schema = AutoSchema(
 )
 
 
+post_bulk_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            name="posts",
+            required=True,
+            location="body",
+            schema=coreschema.Array(
+                items=coreschema.Object(
+                    properties={"message": coreschema.String(description="Message.")}
+                ),
+                description="List of posts. Length is limited by settings.",
+            ),
+        ),
+    ]
+)
+
+
 class LikeSchema(AutoSchema):
     """Class for Like operation schema."""
 
@@ -59,6 +76,28 @@ class LikeSchema(AutoSchema):
         return self._manual_fields + custom_fields
 
 
+like_batch_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            name="likes",
+            required=True,
+            location="body",
+            schema=coreschema.Array(
+                items=coreschema.Object(
+                    properties={
+                        "message_id": coreschema.Integer(description="Message id."),
+                        "eval": coreschema.String(
+                            description="Can only be 'Like' or 'Dislike'."
+                        ),
+                    }
+                ),
+                description="List of likes. Length is limited by settings.",
+            ),
+        ),
+    ]
+)
+
+
 analitics_schema = AutoSchema(
     manual_fields=[
         coreapi.Field(
@@ -77,13 +116,39 @@ analitics_schema = AutoSchema(
 )
 
 
+statistic_schema = AutoSchema(
+    manual_fields=[
+        coreapi.Field(
+            name="estimated",
+            required=False,
+            location="query",
+            schema=coreschema.Boolean(
+                description="Return approximate numbers from planner statistics."
+            ),
+        ),
+    ]
+)
+
+
 last_posts_schema = AutoSchema(
     manual_fields=[
         coreapi.Field(
             name="posts_number",
-            required=True,
+            required=False,
             location="query",
-            schema=coreschema.Integer(description="Last posts number."),
+            schema=coreschema.Integer(description="Last posts number per page."),
+        ),
+        coreapi.Field(
+            name="cursor",
+            required=False,
+            location="query",
+            schema=coreschema.String(description="Cursor from 'next' url."),
+        ),
+        coreapi.Field(
+            name="stream",
+            required=False,
+            location="query",
+            schema=coreschema.Boolean(description="Stream all items as JSON array."),
         ),
     ]
 )
@@ -93,9 +158,21 @@ last_likes_schema = AutoSchema(
     manual_fields=[
         coreapi.Field(
             name="likes_number",
-            required=True,
+            required=False,
+            location="query",
+            schema=coreschema.Integer(description="Last likes number per page."),
+        ),
+        coreapi.Field(
+            name="cursor",
+            required=False,
+            location="query",
+            schema=coreschema.String(description="Cursor from 'next' url."),
+        ),
+        coreapi.Field(
+            name="stream",
+            required=False,
             location="query",
-            schema=coreschema.Integer(description="Last likes number."),
+            schema=coreschema.Boolean(description="Stream all items as JSON array."),
         ),
     ]
 )
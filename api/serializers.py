@@ -1,11 +1,22 @@
 """Serializers for 'api' app."""
 
+from typing import Dict, Set
+
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 
 from .models import Like, Post, User
+from .services.activity import activity_tracker
+from .services.hashing import password_hashing_pool
+from .services.mixins import TimedSerializerMixin
+from .services.utils import get_like
+from .tokens import RefreshToken
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """User model serializer class."""
 
     class Meta:
@@ -14,15 +25,15 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "email", "username", "password"]
 
-    def create(self, validated_data):
-        """Create user with validated_data."""
-        user = User.objects.create(**validated_data)
-        user.set_password(validated_data["password"])
-        user.save()
-        return user
+    def create(self, validated_data: Dict) -> User:
+        """Create user with password hashed on hashing pool by one INSERT."""
+        validated_data["password"] = password_hashing_pool.make_password(
+            validated_data["password"]
+        )
+        return User.objects.create(**validated_data)
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Post model serializer class."""
 
     class Meta:
@@ -30,10 +41,16 @@ class PostSerializer(serializers.ModelSerializer):
 
         model = Post
         fields = "__all__"
-        read_only_fields = ("user", "created_at", "updated_at")
+        read_only_fields = (
+            "user",
+            "created_at",
+            "updated_at",
+            "likes_count",
+            "dislikes_count",
+        )
 
 
-class LikeSerializer(serializers.ModelSerializer):
+class LikeSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Like model serializer class."""
 
     class Meta:
@@ -42,3 +59,82 @@ class LikeSerializer(serializers.ModelSerializer):
         model = Like
         fields = ("user", "message", "eval", "created_at")
         read_only_fields = ("created_at",)
+
+
+class LikeBatchItemSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    Serializer class for one item of likes batch.
+
+    Items of one batch share "message_ids" set in context, so item with
+    message_id of earlier valid item is rejected.
+    """
+
+    message_id = serializers.IntegerField(min_value=1)
+    eval = serializers.CharField()
+
+    def validate_message_id(self, value: int) -> int:
+        """Reject message_id, which is already used in batch."""
+        message_ids: Set[int] = self.context.setdefault("message_ids", set())
+        if value in message_ids:
+            raise serializers.ValidationError("Post is already liked in batch.")
+        return value
+
+    def validate(self, attrs: Dict) -> Dict:
+        """Remember message_id of valid item."""
+        self.context.setdefault("message_ids", set()).add(attrs["message_id"])
+        return attrs
+
+    @staticmethod
+    def validate_eval(value: str) -> bool:
+        """Convert 'Like' or 'Dislike' value to boolean."""
+        if (like := get_like(value.lower())) is None:
+            raise serializers.ValidationError("Value must be 'Like' or 'Dislike'.")
+        return like
+
+
+class TokenObtainPairSerializer(
+    TimedSerializerMixin, jwt_serializers.TokenObtainPairSerializer
+):
+    """Token obtain pair serializer with write-behind last_login update."""
+
+    token_class = RefreshToken
+
+    def validate(self, attrs: Dict) -> Dict:
+        """Validate credentials, issue tokens and record user last_login."""
+        data: Dict = jwt_serializers.TokenObtainSerializer.validate(self, attrs)
+        refresh = self.get_token(self.user)
+        data["refresh"] = str(refresh)
+        data["access"] = str(refresh.access_token)
+        if api_settings.UPDATE_LAST_LOGIN:
+            activity_tracker.touch(self.user.pk, "last_login")
+        return data
+
+
+class TokenRefreshSerializer(
+    TimedSerializerMixin, jwt_serializers.TokenRefreshSerializer
+):
+    """Token refresh serializer rejecting reuse of rotated refresh tokens."""
+
+    token_class = RefreshToken
+
+    def validate(self, attrs: Dict) -> Dict:
+        """
+        Validate refresh token, blacklist it and issue new tokens.
+
+        Blacklisting is one INSERT ... ON CONFLICT DO NOTHING, so if
+        the same token is refreshed concurrently, only one request succeeds.
+        """
+        refresh: RefreshToken = self.token_class(attrs["refresh"])
+        if (
+            api_settings.ROTATE_REFRESH_TOKENS
+            and api_settings.BLACKLIST_AFTER_ROTATION
+            and not refresh.blacklist()
+        ):
+            raise TokenError(_("Token is blacklisted"))
+        data: Dict = {"access": str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
@@ -0,0 +1,161 @@
+"""Module for 'api' app write-behind user activity tracking."""
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from api.models import User
+
+TRACKED_FIELDS: Tuple[str, ...] = ("last_request_at", "last_login")
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ActivityTracker:
+    """
+    Class for buffering user activity timestamps in process.
+
+    Timestamps are kept per user and field and written with one bulk_update
+    per field once flush_interval seconds have passed since the last flush.
+    Repeated activity of the same user inside that window is coalesced into
+    a single row update. With background flush, daemon thread of process
+    flushes buffer every flush_interval seconds, so idle process does not
+    keep timestamps longer than that. Timestamps of failed flush are put
+    back to buffer. Buffer is lost, if process is killed.
+    """
+
+    def __init__(self, flush_interval: float, background: bool = False) -> None:
+        """Initialize tracker with flush interval in seconds."""
+        self.flush_interval: float = flush_interval
+        self.background: bool = background and flush_interval > 0
+        self._pending: Dict[str, Dict[int, datetime]] = {
+            field: dict() for field in TRACKED_FIELDS
+        }
+        self._lock: threading.Lock = threading.Lock()
+        self._last_flush: float = time.monotonic()
+        self._flusher_pid: Optional[int] = None
+
+    def touch(self, user_id: int, field: str = "last_request_at") -> None:
+        """Record user activity now and flush buffer if window has passed."""
+        if self.record(user_id, field):
+            self.flush()
+
+    def record(self, user_id: int, field: str = "last_request_at") -> bool:
+        """Record user activity now and return whether flush is due."""
+        with self._lock:
+            self._pending[field][user_id] = timezone.now()
+            if self.background and self._flusher_pid != os.getpid():
+                self.start_flusher()
+            return time.monotonic() - self._last_flush >= self.flush_interval
+
+    def start_flusher(self) -> None:
+        """Start background flush thread of current process."""
+        self._flusher_pid = os.getpid()
+        threading.Thread(
+            target=self.run_flusher, name="activity-flusher", daemon=True
+        ).start()
+
+    def run_flusher(self) -> None:
+        """Flush buffer every flush interval, closing thread connection after."""
+        while True:
+            time.sleep(self.flush_interval)
+            if not self.has_pending():
+                continue
+            try:
+                self.flush()
+            except DatabaseError:
+                logger.exception("Buffered activity flush failed.")
+            finally:
+                connection.close()
+
+    def has_pending(self) -> bool:
+        """Check if buffer has timestamps."""
+        with self._lock:
+            return any(self._pending.values())
+
+    def get_pending(self, user_id: int) -> Dict[str, datetime]:
+        """Get not yet flushed activity timestamps of user."""
+        with self._lock:
+            return {
+                field: values[user_id]
+                for field, values in self._pending.items()
+                if user_id in values
+            }
+
+    def flush(self) -> int:
+        """
+        Write buffered timestamps to database and return updated rows number.
+
+        If writing fails, not written timestamps are put back to buffer,
+        unless newer ones were recorded meanwhile, and error is raised.
+        """
+        with self._lock:
+            pending: Dict[str, Dict[int, datetime]] = self._pending
+            self._pending = {field: dict() for field in TRACKED_FIELDS}
+            self._last_flush = time.monotonic()
+        updated: int = 0
+        for field, values in pending.items():
+            if not values:
+                continue
+            users: List[User] = [
+                User(id=pk, **{field: at}) for pk, at in values.items()
+            ]
+            try:
+                updated += User.objects.bulk_update(users, [field])
+            except DatabaseError:
+                self.restore(pending)
+                raise
+            pending[field] = dict()
+        return updated
+
+    def restore(self, pending: Dict[str, Dict[int, datetime]]) -> None:
+        """Put not written timestamps back to buffer, keeping newer ones."""
+        with self._lock:
+            for field, values in pending.items():
+                for user_id, at in values.items():
+                    self._pending[field].setdefault(user_id, at)
+
+    def reset(self) -> None:
+        """Drop buffered timestamps without writing them."""
+        with self._lock:
+            self._pending = {field: dict() for field in TRACKED_FIELDS}
+            self._last_flush = time.monotonic()
+
+
+activity_tracker: ActivityTracker = ActivityTracker(
+    settings.ACTIVITY_FLUSH_INTERVAL, settings.ACTIVITY_BACKGROUND_FLUSH
+)
+
+
+def get_user_activity(user: User) -> Dict[str, Optional[datetime]]:
+    """
+    Get user activity data with not yet flushed timestamps applied.
+
+    Only buffer of current process is applied, activity recorded by other
+    worker processes is seen after their next flush, at most flush
+    interval later.
+    """
+    activity: Dict[str, Optional[datetime]] = {
+        "last_login": user.last_login,
+        "last_request_at": user.last_request_at,
+    }
+    activity.update(activity_tracker.get_pending(user.pk))
+    return activity
+
+
+def flush_activity_at_exit() -> None:
+    """Flush buffered activity on interpreter exit, ignoring database errors."""
+    try:
+        activity_tracker.flush()
+    except DatabaseError:
+        pass
+
+
+atexit.register(flush_activity_at_exit)
@@ -0,0 +1,100 @@
+"""Module for 'api' app refresh token blacklist."""
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from api.models import BlacklistedToken
+from api.services.bloom import BloomFilter
+
+BLOOM_ERROR_RATE: float = 0.001
+BLOOM_MIN_CAPACITY: int = 1000
+
+
+class TokenBlacklist:
+    """
+    Class for checking refresh token JTIs against blacklist table.
+
+    Every process keeps Bloom filter of not expired blacklisted JTIs,
+    rebuilt from database each rebuild_interval seconds, so checks of not
+    blacklisted tokens do not query database. Tokens blacklisted by other
+    processes become known to filter after its next rebuild.
+    """
+
+    def __init__(self, rebuild_interval: float) -> None:
+        """Initialize blacklist with filter rebuild interval in seconds."""
+        self.rebuild_interval: float = rebuild_interval
+        self._filter: Optional[BloomFilter] = None
+        self._built_at: float = 0.0
+        self._added: List[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def rebuild(self) -> int:
+        """Rebuild Bloom filter from not expired JTIs and return their number."""
+        with self._lock:
+            self._added = []
+        jtis: List[str] = list(
+            BlacklistedToken.objects.filter(expires_at__gt=timezone.now()).values_list(
+                "jti", flat=True
+            )
+        )
+        bloom: BloomFilter = BloomFilter(
+            max(2 * len(jtis), BLOOM_MIN_CAPACITY), BLOOM_ERROR_RATE
+        )
+        for jti in jtis:
+            bloom.add(jti)
+        with self._lock:
+            for jti in self._added:
+                bloom.add(jti)
+            self._filter = bloom
+            self._built_at = time.monotonic()
+        return len(jtis)
+
+    def contains(self, jti: str) -> bool:
+        """Check whether JTI is blacklisted, querying database on filter hit."""
+        if (
+            self._filter is None
+            or time.monotonic() - self._built_at >= self.rebuild_interval
+        ):
+            self.rebuild()
+        if jti not in self._filter:
+            return False
+        return BlacklistedToken.objects.filter(jti=jti).exists()
+
+    def add(self, jti: str, expires_at: datetime) -> bool:
+        """Blacklist JTI and return False, if it had already been blacklisted."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {BlacklistedToken._meta.db_table} (jti, expires_at) "
+                "VALUES (%s, %s) ON CONFLICT (jti) DO NOTHING RETURNING id",
+                [jti, expires_at],
+            )
+            created: bool = cursor.fetchone() is not None
+        with self._lock:
+            self._added.append(jti)
+            if self._filter is not None:
+                self._filter.add(jti)
+        return created
+
+    def reset(self) -> None:
+        """Drop Bloom filter, so it is rebuilt on next check."""
+        with self._lock:
+            self._filter = None
+            self._added = []
+
+
+token_blacklist: TokenBlacklist = TokenBlacklist(
+    settings.TOKEN_BLACKLIST_REBUILD_INTERVAL
+)
+
+
+def purge_blacklisted_tokens() -> int:
+    """Delete expired blacklisted tokens and return their number."""
+    deleted, _ = BlacklistedToken.objects.filter(
+        expires_at__lte=timezone.now()
+    ).delete()
+    return deleted
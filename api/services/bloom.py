@@ -0,0 +1,44 @@
+"""Module for 'api' app Bloom filter."""
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Class for probabilistic set membership of strings.
+
+    Bits number and hash functions number are derived from expected
+    capacity and false positive rate. Items are never reported missing
+    after they were added, while not added items are reported present
+    with error_rate probability, if capacity is not exceeded.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize empty filter for capacity items and error rate."""
+        capacity = max(capacity, 1)
+        self.size: int = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes: int = max(1, round(self.size / capacity * math.log(2)))
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def _get_positions(self, item: str) -> Iterator[int]:
+        """Get bit positions of item with double hashing."""
+        digest: bytes = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+        for number in range(self.hashes):
+            yield (first + number * second) % self.size
+
+    def add(self, item: str) -> None:
+        """Add item to filter."""
+        for position in self._get_positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether item may have been added to filter."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(item)
+        )
@@ -0,0 +1,74 @@
+"""Module for 'api' app in-process caches."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Class for bounded in-process cache with time to live and LRU eviction.
+
+    Entries expire ttl seconds after they were set. If maxsize is reached,
+    the least recently used entry is evicted. Lookups are counted in hits
+    and misses attributes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize cache with maximum size and time to live in seconds."""
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get not expired value by key or None."""
+        with self._lock:
+            item: Optional[Tuple[float, Any]] = self._data.get(key)
+            if item is not None and item[0] <= time.monotonic():
+                del self._data[key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Set value by key, evicting least recently used entries if full."""
+        if self.maxsize <= 0 or (ttl is not None and ttl <= 0):
+            return
+        expires_at: float = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Delete value by key, if it exists."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Delete all values and reset lookup counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and lookup counters."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self) -> int:
+        """Get stored entries number, including expired ones."""
+        return len(self._data)
@@ -0,0 +1,97 @@
+"""Module for 'api' app password hashing with bounded concurrency."""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class HashingPoolSaturated(APIException):
+    """Exception for password hashing pool without free slots."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Password hashing is busy, retry later."
+    default_code = "hashing_pool_saturated"
+
+    def __init__(self, wait: Optional[int] = None) -> None:
+        """Initialize exception with seconds to wait, sent as Retry-After."""
+        super().__init__()
+        self.wait: Optional[int] = wait
+
+
+class PasswordHashingPool:
+    """
+    Class for running password hashing with bounded concurrency.
+
+    Hashing runs in calling thread, at most workers calls at once, and up
+    to queue_size more calls wait for their turn. Calls over this limit
+    fail fast with HashingPoolSaturated. PBKDF2 releases GIL while hashing,
+    so threads of one process hash in parallel, and handing hashing over to
+    other threads or processes would only add overhead, as calling thread
+    waits for result anyway. Zero workers means one call at once.
+    """
+
+    def __init__(self, workers: int, queue_size: int, retry_after: int) -> None:
+        """Initialize pool with workers number, queue size and retry delay."""
+        self.workers: int = workers
+        self.capacity: int = max(workers, 1) + queue_size
+        self.retry_after: int = retry_after
+        self._slots: threading.BoundedSemaphore = threading.BoundedSemaphore(
+            self.capacity
+        )
+        self._running: threading.BoundedSemaphore = threading.BoundedSemaphore(
+            max(workers, 1)
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self.in_flight: int = 0
+        self.peak_in_flight: int = 0
+        self.completed: int = 0
+        self.rejected: int = 0
+
+    def run(self, function: Callable, *args: Any) -> Any:
+        """Run hashing function in turn or raise HashingPoolSaturated if full."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HashingPoolSaturated(wait=self.retry_after)
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            with self._running:
+                return function(*args)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def make_password(self, password: str) -> str:
+        """Hash password with default hasher."""
+        return self.run(hashers.make_password, password)
+
+    def check_password(self, password: str, encoded: str) -> bool:
+        """Check password against encoded hash."""
+        return self.run(hashers.check_password, password, encoded)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool size and utilisation counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.capacity,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "utilisation": round(self.in_flight / self.capacity, 3),
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+password_hashing_pool: PasswordHashingPool = PasswordHashingPool(
+    settings.PASSWORD_HASHING_WORKERS,
+    settings.PASSWORD_HASHING_QUEUE_SIZE,
+    settings.PASSWORD_HASHING_RETRY_AFTER,
+)
@@ -0,0 +1,315 @@
+"""
+Module for 'api' app request metrics shared by worker processes.
+
+Every process adds its counters to its own memory mapped file in
+METRICS_DIR, metrics endpoint sums counters of all files. Counters of
+exited gunicorn workers are folded into aggregate file by master process,
+so numbers cover recycled workers too, while files number stays bounded.
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+
+BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Labels]
+
+
+class MmapCounters:
+    """
+    Class for float counters stored in memory mapped file.
+
+    File starts with 8 bytes of used size, followed by entries of 4 bytes
+    key length, UTF-8 key padded to 8 bytes boundary and 8 bytes double
+    value. Entry is written before used size is increased, so readers of
+    other processes never see partial entry.
+    """
+
+    header: struct.Struct = struct.Struct("Q")
+    initial_size: int = 64 * 1024
+
+    def __init__(self, path: str) -> None:
+        """Initialize counters with file path, opening or creating file."""
+        self.path: str = path
+        self._positions: Dict[str, int] = dict()
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size < self.initial_size:
+            self._file.truncate(self.initial_size)
+        self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0)
+        self._used: int = self.header.unpack_from(self._map, 0)[0] or self.header.size
+        for key, _, position in self.read_entries(self._map, self._used):
+            self._positions[key] = position
+
+    @staticmethod
+    def get_entry_size(key: bytes) -> int:
+        """Get entry size with key padded to 8 bytes boundary."""
+        return 4 + len(key) + (8 - (4 + len(key)) % 8) % 8 + 8
+
+    @classmethod
+    def read_entries(
+        cls, data: mmap.mmap, used: int
+    ) -> Iterator[Tuple[str, float, int]]:
+        """Read keys, values and value positions of entries."""
+        offset: int = cls.header.size
+        while offset < used:
+            length: int = struct.unpack_from("i", data, offset)[0]
+            key: bytes = struct.unpack_from(f"{length}s", data, offset + 4)[0]
+            position: int = offset + cls.get_entry_size(key) - 8
+            if position + 8 > used:
+                return
+            yield key.decode(), struct.unpack_from("d", data, position)[0], position
+            offset = position + 8
+
+    @classmethod
+    def read(cls, path: str) -> Iterator[Tuple[str, float]]:
+        """Read keys and values of counters file."""
+        with open(path, "rb") as file:
+            if not os.fstat(file.fileno()).st_size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                used: int = min(cls.header.unpack_from(data, 0)[0], len(data))
+                for key, value, _ in cls.read_entries(data, used):
+                    yield key, value
+
+    def add(self, key: str, amount: float) -> None:
+        """Add amount to counter by key, creating it if needed."""
+        position: Optional[int] = self._positions.get(key)
+        if position is None:
+            position = self.create(key)
+        value: float = struct.unpack_from("d", self._map, position)[0]
+        struct.pack_into("d", self._map, position, value + amount)
+
+    def create(self, key: str) -> int:
+        """Write zero counter entry and return its value position."""
+        encoded: bytes = key.encode()
+        size: int = self.get_entry_size(encoded)
+        while self._used + size > len(self._map):
+            self.resize(2 * len(self._map))
+        struct.pack_into(
+            f"i{len(encoded)}s", self._map, self._used, len(encoded), encoded
+        )
+        position: int = self._used + size - 8
+        struct.pack_into("d", self._map, position, 0.0)
+        self._used += size
+        self.header.pack_into(self._map, 0, self._used)
+        self._positions[key] = position
+        return position
+
+    def resize(self, size: int) -> None:
+        """Grow file and its memory map."""
+        self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def close(self) -> None:
+        """Close memory map and file."""
+        self._map.close()
+        self._file.close()
+
+
+class MetricsRegistry:
+    """
+    Class for recording request metrics of process and collecting all of them.
+
+    Counters file of process is opened on first record and reopened in
+    forked processes.
+    """
+
+    aggregate_filename: str = "metrics_aggregate.db"
+
+    def __init__(self, directory: str) -> None:
+        """Initialize registry with counters files directory."""
+        self.directory: str = directory
+        self._counters: Optional[MmapCounters] = None
+        self._pid: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def get_counters(self) -> MmapCounters:
+        """Get counters of current process, opening its file if needed."""
+        if self._counters is None or self._pid != os.getpid():
+            os.makedirs(self.directory, exist_ok=True)
+            self._counters = MmapCounters(self.get_path(os.getpid()))
+            self._pid = os.getpid()
+        return self._counters
+
+    @staticmethod
+    def get_key(name: str, **labels: str) -> str:
+        """Get counter key of metric sample."""
+        return json.dumps([name, sorted(labels.items())])
+
+    def observe_request(
+        self,
+        view: str,
+        status_code: int,
+        seconds: float,
+        db_queries: int,
+        db_seconds: float,
+    ) -> None:
+        """Record request of view with its duration and database queries."""
+        status: str = f"{status_code // 100}xx"
+        bucket: str = next(
+            (str(bound) for bound in BUCKETS if seconds <= bound), "+Inf"
+        )
+        with self._lock:
+            counters: MmapCounters = self.get_counters()
+            counters.add(
+                self.get_key("api_requests_total", view=view, status=status), 1
+            )
+            counters.add(
+                self.get_key(
+                    "api_request_duration_seconds_bucket", view=view, le=bucket
+                ),
+                1,
+            )
+            counters.add(
+                self.get_key("api_request_duration_seconds_sum", view=view), seconds
+            )
+            counters.add(self.get_key("api_db_queries_total", view=view), db_queries)
+            counters.add(
+                self.get_key("api_db_duration_seconds_total", view=view), db_seconds
+            )
+
+    def get_path(self, pid: int) -> str:
+        """Get counters file path of process."""
+        return os.path.join(self.directory, f"metrics_{pid}.db")
+
+    def mark_process_dead(self, pid: int) -> None:
+        """
+        Add counters of exited process to aggregate file and delete its file.
+
+        Called by gunicorn master only, so aggregate file has one writer.
+        """
+        path: str = self.get_path(pid)
+        if not os.path.exists(path):
+            return
+        aggregate: MmapCounters = MmapCounters(
+            os.path.join(self.directory, self.aggregate_filename)
+        )
+        try:
+            for key, value in MmapCounters.read(path):
+                aggregate.add(key, value)
+        finally:
+            aggregate.close()
+        os.remove(path)
+
+    def collect(self) -> Dict[Sample, float]:
+        """Get counters summed over files of all processes."""
+        samples: DefaultDict[Sample, float] = defaultdict(float)
+        if not os.path.isdir(self.directory):
+            return samples
+        for filename in os.listdir(self.directory):
+            if not filename.startswith("metrics_"):
+                continue
+            path: str = os.path.join(self.directory, filename)
+            try:
+                for key, value in MmapCounters.read(path):
+                    name, labels = json.loads(key)
+                    samples[(name, tuple(map(tuple, labels)))] += value
+            except FileNotFoundError:
+                continue
+        return samples
+
+    def render(self) -> str:
+        """Get collected metrics in Prometheus text format."""
+        samples: Dict[Sample, float] = self.collect()
+        lines: List[str] = []
+        for name, kind, description in (
+            ("api_requests_total", "counter", "Requests by view and status class."),
+            (
+                "api_request_duration_seconds",
+                "histogram",
+                "Request duration by view.",
+            ),
+            ("api_db_queries_total", "counter", "Database queries by view."),
+            (
+                "api_db_duration_seconds_total",
+                "counter",
+                "Database queries duration by view.",
+            ),
+        ):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                lines.extend(self.render_histogram(name, samples))
+                continue
+            for (sample_name, labels), value in sorted(samples.items()):
+                if sample_name == name:
+                    lines.append(self.render_sample(name, labels, value))
+        return "\n".join(lines) + "\n"
+
+    def render_histogram(self, name: str, samples: Dict[Sample, float]) -> List[str]:
+        """Get cumulative buckets, sum and count lines of histogram."""
+        buckets: DefaultDict[Labels, Dict[str, float]] = defaultdict(dict)
+        sums: Dict[Labels, float] = dict()
+        for (sample_name, labels), value in samples.items():
+            if sample_name == f"{name}_bucket":
+                bound: str = dict(labels)["le"]
+                buckets[tuple(pair for pair in labels if pair[0] != "le")][
+                    bound
+                ] = value
+            elif sample_name == f"{name}_sum":
+                sums[labels] = value
+        lines: List[str] = []
+        for labels in sorted(buckets):
+            total: float = 0.0
+            for bound in [str(bound) for bound in BUCKETS] + ["+Inf"]:
+                total += buckets[labels].get(bound, 0.0)
+                lines.append(
+                    self.render_sample(
+                        f"{name}_bucket", labels + (("le", bound),), total
+                    )
+                )
+            lines.append(self.render_sample(f"{name}_sum", labels, sums.get(labels, 0)))
+            lines.append(self.render_sample(f"{name}_count", labels, total))
+        return lines
+
+    @staticmethod
+    def render_sample(name: str, labels: Labels, value: float) -> str:
+        """Get sample line with escaped label values."""
+        rendered: str = ",".join(
+            '{}="{}"'.format(
+                label,
+                str(label_value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for label, label_value in labels
+        )
+        return f"{name}{{{rendered}}} {float(value)!r}"
+
+    def clear(self) -> None:
+        """Close counters file of process and delete files of all processes."""
+        with self._lock:
+            if self._counters is not None and self._pid == os.getpid():
+                self._counters.close()
+            self._counters = None
+            if not os.path.isdir(self.directory):
+                return
+            for filename in os.listdir(self.directory):
+                if filename.startswith("metrics_"):
+                    os.remove(os.path.join(self.directory, filename))
+
+
+metrics_registry: MetricsRegistry = MetricsRegistry(settings.METRICS_DIR)
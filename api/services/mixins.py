@@ -1,15 +1,98 @@
 """Mixins module for 'api' app."""
+from typing import Any, Iterator, List, Union
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
 
 from api.models import User
 
+from .activity import activity_tracker
+from .renderers import JSONStreamRenderer
+from .timing import measure
+from .utils import get_positive_int, is_flag_set, iterate_async, stream_json_array
+
 
 class UpdateRequestFieldMixin:
     """Class for adding functionality for updating user last_request_at field."""
 
     @staticmethod
     def perform_authentication(request: Request) -> None:
-        """Add additional save operation for updating User last_request_at field."""
+        """Record User last_request_at update in write-behind activity tracker."""
         user: User = request.user
         if user.is_authenticated:
-            user.save()
+            activity_tracker.touch(user.pk)
+
+
+class TimedSerializerMixin:
+    """Class for adding serializer duration to timed request stages."""
+
+    def run_validation(self, *args: Any, **kwargs: Any) -> Any:
+        """Validate data, measuring serializer stage."""
+        with measure("serializer"):
+            return super().run_validation(*args, **kwargs)
+
+    def to_representation(self, *args: Any, **kwargs: Any) -> Any:
+        """Represent instance, measuring serializer stage."""
+        with measure("serializer"):
+            return super().to_representation(*args, **kwargs)
+
+
+class StreamingListMixin:
+    """
+    Class for adding streaming JSON output to last instances list views.
+
+    Streaming is selected by 'stream' query parameter or by Accept header
+    with JSONStreamRenderer media type. Last n instances are read through
+    server-side cursor and written as JSON array by chunks. Under ASGI
+    chunks are sent as async iterator, so memory stays flat there too.
+    """
+
+    number_query_param: str = ""
+
+    def get_renderers(self) -> List:
+        """Get view renderers with streaming JSON renderer added."""
+        return super().get_renderers() + [JSONStreamRenderer()]
+
+    def list(
+        self, request: Request, *args: Any, **kwargs: Any
+    ) -> Union[Response, StreamingHttpResponse]:
+        """List instances as streaming JSON array, if streaming is requested."""
+        if not self.is_streaming_requested(request):
+            return super().list(request, *args, **kwargs)
+        number: int = get_positive_int(
+            request.query_params, self.number_query_param, settings.LAST_ITEMS_PAGE_SIZE
+        )
+        queryset: QuerySet = self.filter_queryset(self.get_queryset())
+        content: Iterator[bytes] = self.stream_instances(
+            queryset.order_by("-id")[:number]
+        )
+        return StreamingHttpResponse(
+            iterate_async(content)
+            if isinstance(request._request, ASGIRequest)
+            else content,
+            content_type="application/json",
+        )
+
+    @staticmethod
+    def is_streaming_requested(request: Request) -> bool:
+        """Check whether streaming output is requested."""
+        return is_flag_set(request.query_params, "stream") or isinstance(
+            request.accepted_renderer, JSONStreamRenderer
+        )
+
+    def stream_instances(self, queryset: QuerySet) -> Iterator[bytes]:
+        """Serialize instances one by one and yield encoded JSON chunks."""
+        chunk_size: int = settings.STREAM_CHUNK_SIZE
+        serializer: Serializer = self.get_serializer()
+        return stream_json_array(
+            (
+                serializer.to_representation(instance)
+                for instance in queryset.iterator(chunk_size=chunk_size)
+            ),
+            chunk_size,
+        )
@@ -1,9 +1,20 @@
 """Module for 'api' app model operations."""
+import random
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from django.db.models import Count, F, QuerySet
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.utils import CursorWrapper
+from django.db.models import Count, F, Q, QuerySet, Sum
+from django.utils import timezone
 
-from api.models import Like, Post, User
+from api.models import Like, LikeDailyStat, Post, StatisticCounter, User
+
+
+def get_counter_shard() -> int:
+    """Get random statistic counter shard row pk."""
+    return random.randint(1, settings.STATISTIC_COUNTER_SHARDS)
 
 
 def get_like_instance(user: User, message_id: int) -> QuerySet:
@@ -11,18 +22,401 @@ def get_like_instance(user: User, message_id: int) -> QuerySet:
     return Like.objects.filter(user=user, message=message_id)
 
 
+LikeChange = Tuple[int, datetime, int, int, int]
+
+
+def execute_like_statement(
+    cursor: CursorWrapper, sources: str, changes: str, result: str, params: List
+) -> None:
+    """
+    Execute statement writing Likes and applying their changes to statistic.
+
+    sources are CTEs writing or reading Likes, changes is SELECT over them
+    of message_id, created_at, likes, dislikes and number columns: Post
+    likes and dislikes counters deltas and likes number delta of every
+    changed Like. Post counters, random daily likes rollup shard (by Like
+    created_at) and random statistic counter shard are updated by the same
+    statement. This is the only place where they are maintained. result is
+    final SELECT.
+    params are sources and changes parameters.
+    """
+    post_table: str = Post._meta.db_table
+    stat_table: str = LikeDailyStat._meta.db_table
+    cursor.execute(
+        f"WITH {sources}changes AS ({changes}), "
+        f"post_counters AS (UPDATE {post_table} SET "
+        "likes_count = likes_count + delta.likes, "
+        "dislikes_count = dislikes_count + delta.dislikes "
+        "FROM (SELECT message_id, sum(likes) AS likes, sum(dislikes) AS dislikes "
+        "FROM changes GROUP BY message_id) AS delta "
+        f"WHERE {post_table}.id = delta.message_id "
+        "AND (delta.likes <> 0 OR delta.dislikes <> 0)), "
+        f"daily_stat AS (INSERT INTO {stat_table} (date, shard, likes) "
+        "SELECT (created_at AT TIME ZONE %s)::date, %s, sum(number) "
+        "FROM changes GROUP BY 1 HAVING sum(number) <> 0 "
+        "ON CONFLICT (date, shard) DO UPDATE "
+        f"SET likes = {stat_table}.likes + EXCLUDED.likes), "
+        f"counter AS (UPDATE {StatisticCounter._meta.db_table} "
+        "SET likes = likes + (SELECT sum(number) FROM changes) "
+        "WHERE id = %s AND (SELECT sum(number) FROM changes) <> 0) "
+        f"{result}",
+        [
+            *params,
+            timezone.get_current_timezone_name(),
+            get_counter_shard(),
+            get_counter_shard(),
+        ],
+    )
+
+
+def get_like_change(like: Like) -> LikeChange:
+    """Get statistic change of created Like."""
+    return like.message_id, like.created_at, int(like.eval), int(not like.eval), 1
+
+
+def get_saved_like(like: Like) -> Optional[Tuple[int, bool]]:
+    """
+    Lock Posts of Like being saved and get its stored message_id and eval.
+
+    Both the stored and the new Post are locked, so stored values are not
+    changed by concurrent Like writes till commit. Return None, if Like is
+    not stored yet.
+    """
+    lock_posts(
+        Post.objects.filter(
+            Q(id=like.message_id)
+            | Q(id__in=Like.objects.filter(pk=like.pk).values("message_id"))
+        )
+    )
+    return Like.objects.filter(pk=like.pk).values_list("message_id", "eval").first()
+
+
+def get_like_update_changes(
+    like: Like, message_id: int, evaluation: bool
+) -> List[LikeChange]:
+    """Get Post counters changes of Like updated from stored message_id and eval."""
+    if (message_id, evaluation) == (like.message_id, like.eval):
+        return []
+    return [
+        (message_id, like.created_at, -int(evaluation), -int(not evaluation), 0),
+        (like.message_id, like.created_at, int(like.eval), int(not like.eval), 0),
+    ]
+
+
+def apply_like_changes(changes: List[LikeChange]) -> None:
+    """Apply changes of Likes written by ORM to statistic with one statement."""
+    changes = [change for change in changes if any(change[2:])]
+    if not changes:
+        return
+    values: str = ", ".join(
+        ["(%s::bigint, %s::timestamptz, %s::int, %s::int, %s::int)"] * len(changes)
+    )
+    with connection.cursor() as cursor:
+        execute_like_statement(
+            cursor,
+            "",
+            f"SELECT * FROM (VALUES {values}) "
+            "AS values (message_id, created_at, likes, dislikes, number)",
+            "SELECT 1",
+            [value for change in changes for value in change],
+        )
+
+
+def lock_posts(posts: QuerySet) -> int:
+    """
+    Lock Posts of queryset in id order against concurrent Like writes.
+
+    Every function writing Likes of Post locks it first, so Likes read
+    after lock are not changed till commit and counters deltas are exact.
+    Return locked Posts number.
+    """
+    sql, params = (
+        posts.select_for_update(no_key=True)
+        .order_by("id")
+        .values("id")
+        .query.sql_with_params()
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM ({sql}) AS locked", params)
+        return cursor.fetchone()[0]
+
+
+def upsert_like(user_id: int, message_id: int, like: bool) -> Optional[Tuple]:
+    """
+    Create Like or set its eval with one INSERT ... ON CONFLICT statement.
+
+    Post is locked before, so previous eval read by the statement is the
+    latest one. Post likes and dislikes counters are adjusted by the same
+    statement. Daily likes rollup and statistic counter are updated too,
+    if Like was created.
+    Return Like instance and created flag or None, if Post does not exist.
+    """
+    like_table: str = Like._meta.db_table
+    with transaction.atomic(savepoint=False):
+        if not lock_posts(Post.objects.filter(id=message_id)):
+            return None
+        with connection.cursor() as cursor:
+            execute_like_statement(
+                cursor,
+                f"previous AS (SELECT eval FROM {like_table} "
+                "WHERE user_id = %s AND message_id = %s), "
+                f"upserted AS (INSERT INTO {like_table} "
+                "(user_id, message_id, eval, created_at) VALUES (%s, %s, %s, %s) "
+                "ON CONFLICT (user_id, message_id) DO UPDATE "
+                "SET eval = EXCLUDED.eval "
+                "RETURNING id, message_id, created_at, xmax = 0 AS created), ",
+                "SELECT message_id, created_at, "
+                "%s::int - COALESCE((SELECT eval::int FROM previous), 0) AS likes, "
+                "(NOT %s)::int - COALESCE((SELECT (NOT eval)::int FROM previous), 0) "
+                "AS dislikes, created::int AS number FROM upserted",
+                "SELECT id, created_at, created FROM upserted",
+                [
+                    user_id,
+                    message_id,
+                    user_id,
+                    message_id,
+                    like,
+                    timezone.now(),
+                    like,
+                    like,
+                ],
+            )
+            pk, created_at, created = cursor.fetchone()
+    instance: Like = Like(
+        id=pk, user_id=user_id, message_id=message_id, eval=like, created_at=created_at
+    )
+    return instance, created
+
+
+def delete_likes(likes: QuerySet) -> int:
+    """
+    Delete Likes of queryset with one DELETE statement.
+
+    Posts of Likes are locked before. Post likes and dislikes counters,
+    daily likes rollup and statistic counter are decremented by the same
+    statement, so Likes are not loaded.
+    Return deleted Likes number.
+    """
+    sql, params = likes.values("id").query.sql_with_params()
+    with transaction.atomic(savepoint=False):
+        lock_posts(Post.objects.filter(id__in=likes.values("message_id")))
+        with connection.cursor() as cursor:
+            execute_like_statement(
+                cursor,
+                f"deleted AS (DELETE FROM {Like._meta.db_table} WHERE id IN ({sql}) "
+                "RETURNING message_id, eval, created_at), ",
+                "SELECT message_id, created_at, -(eval::int) AS likes, "
+                "-((NOT eval)::int) AS dislikes, -1 AS number FROM deleted",
+                "SELECT count(*) FROM deleted",
+                params,
+            )
+            return cursor.fetchone()[0]
+
+
+def delete_like(user_id: int, message_id: int) -> bool:
+    """Delete user Like of Post, return True, if Like was deleted."""
+    return bool(
+        delete_likes(Like.objects.filter(user_id=user_id, message_id=message_id))
+    )
+
+
+def upsert_likes(user_id: int, likes: Dict[int, bool]) -> Dict[int, bool]:
+    """
+    Create or update user Likes with one bulk INSERT ... ON CONFLICT statement.
+
+    Existing Posts are locked before previous Likes are read, so concurrent
+    writes of the same Likes wait and counters deltas are not stale.
+    Daily likes rollup gets created Likes by their created_at.
+    Return created flag by Post id for existing posts only.
+    """
+    with transaction.atomic():
+        posts: List[int] = list(
+            Post.objects.select_for_update(no_key=True)
+            .filter(id__in=likes)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not posts:
+            return {}
+        previous_evals: Dict[int, bool] = dict(
+            Like.objects.filter(user_id=user_id, message_id__in=posts).values_list(
+                "message_id", "eval"
+            )
+        )
+        instances: List[Like] = Like.objects.bulk_create(
+            [Like(user_id=user_id, message_id=pk, eval=likes[pk]) for pk in posts],
+            update_conflicts=True,
+            unique_fields=["user", "message"],
+            update_fields=["eval"],
+        )
+        apply_like_changes(
+            [
+                (
+                    instance.message_id,
+                    instance.created_at,
+                    *get_like_counters_delta(
+                        previous_evals.get(instance.message_id), instance.eval
+                    ),
+                    int(instance.message_id not in previous_evals),
+                )
+                for instance in instances
+            ]
+        )
+    return {pk: pk not in previous_evals for pk in posts}
+
+
+def get_like_counters_delta(
+    previous: Optional[bool], current: Optional[bool]
+) -> Tuple[int, int]:
+    """Get Post likes and dislikes counters delta for Like eval change."""
+    return (
+        int(current is True) - int(previous is True),
+        int(current is False) - int(previous is False),
+    )
+
+
+def is_like_deduplication_needed() -> bool:
+    """
+    Check if Like table exists without its user and Post unique constraint.
+
+    Catalogs are read only, so the check is cheap on every start.
+    """
+    table: str = Like._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT to_regclass(%s) IS NOT NULL AND NOT EXISTS (SELECT 1 "
+            "FROM pg_constraint WHERE conrelid = to_regclass(%s) AND conname = %s)",
+            [table, table, Like._meta.constraints[0].name],
+        )
+        return cursor.fetchone()[0]
+
+
+def delete_duplicated_likes() -> int:
+    """
+    Delete all but the latest Like of every user and Post pair.
+
+    Raw SQL is used, so it works before migration adding unique constraint
+    is applied. Likes are self-joined, so it is run only if
+    is_like_deduplication_needed. Return deleted Likes number.
+    """
+    table: str = Like._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {table} AS duplicate USING {table} AS latest "
+            "WHERE duplicate.user_id = latest.user_id "
+            "AND duplicate.message_id = latest.message_id "
+            "AND duplicate.id < latest.id"
+        )
+        return cursor.rowcount
+
+
+def is_post_like_counters_backfill_needed() -> bool:
+    """
+    Check if Likes exist, but all Post likes and dislikes counters are zero.
+
+    Every Like adds to one of its Post counters, so it is the case only
+    when counters were just added to existing Posts.
+    """
+    return (
+        Like.objects.exists()
+        and not Post.objects.exclude(likes_count=0, dislikes_count=0).exists()
+    )
+
+
+def reconcile_post_like_counters(chunk_size: int) -> int:
+    """
+    Fix drifted Post likes and dislikes counters by chunks of posts.
+
+    Every chunk is read and fixed in its own transaction.
+    Return fixed posts number.
+    """
+    fixed: int = 0
+    last_id: int = 0
+    while True:
+        with transaction.atomic():
+            posts: List[Post] = list(
+                Post.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .only("id", "likes_count", "dislikes_count")
+                .annotate(
+                    actual_likes=Count("like", filter=Q(like__eval=True)),
+                    actual_dislikes=Count("like", filter=Q(like__eval=False)),
+                )[:chunk_size]
+            )
+            if not posts:
+                return fixed
+            drifted: List[Post] = [
+                post
+                for post in posts
+                if (post.likes_count, post.dislikes_count)
+                != (post.actual_likes, post.actual_dislikes)
+            ]
+            for post in drifted:
+                post.likes_count = post.actual_likes
+                post.dislikes_count = post.actual_dislikes
+            Post.objects.bulk_update(drifted, ["likes_count", "dislikes_count"])
+        fixed += len(drifted)
+        last_id = posts[-1].pk
+
+
 def get_analitic_like_queryset(input_data: Tuple) -> List[Dict]:
-    """Get Like queryset for analitic view and return as a list."""
+    """
+    Get daily likes rollup for analitic view and return as a list.
+
+    Days from date_from up to, but not including, date_to are returned.
+    """
+    return list(get_analitic_like_values(input_data))
+
+
+def get_analitic_like_values(input_data: Tuple) -> QuerySet:
+    """Get not evaluated daily likes rollup values queryset for date range."""
     date_from, date_to = input_data
-    return list(
-        Like.objects.filter(created_at__range=(date_from, date_to))
-        .annotate(date=F("created_at__date"))
-        .values("date")
+    return get_like_daily_stats().filter(
+        date__gte=date_from.date(), date__lt=date_to.date(), likes__gt=0
+    )
+
+
+def get_like_daily_stats() -> QuerySet:
+    """Get not evaluated daily likes numbers summed over rollup shards queryset."""
+    return (
+        LikeDailyStat.objects.values("date")
+        .annotate(likes=Sum("likes"))
+        .values("date", "likes")
         .order_by("date")
-        .annotate(likes=Count("eval"))
     )
 
 
+def is_like_daily_stats_backfill_needed() -> bool:
+    """Check if Likes exist, but daily likes rollup is empty, e.g. after deploy."""
+    return Like.objects.exists() and not LikeDailyStat.objects.exists()
+
+
+def rebuild_like_daily_stats() -> int:
+    """
+    Recalculate daily likes rollup from Like table and return days number.
+
+    Every day gets its number in the first shard. Rollup table is locked
+    in EXCLUSIVE mode till commit, so likes written meanwhile wait and
+    apply their deltas to rebuilt rows, instead of being overwritten.
+    Likes are read after lock is taken.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {LikeDailyStat._meta.db_table} IN EXCLUSIVE MODE"
+            )
+        stats: List[LikeDailyStat] = [
+            LikeDailyStat(**item)
+            for item in Like.objects.annotate(date=F("created_at__date"))
+            .values("date")
+            .order_by("date")
+            .annotate(likes=Count("id"))
+        ]
+        LikeDailyStat.objects.all().delete()
+        LikeDailyStat.objects.bulk_create(stats)
+    return len(stats)
+
+
 def get_user_instance_data(pk: int) -> Optional[User]:
     """Get User instance last_login and last_request_at by pk."""
     return User.objects.filter(id=pk).only("last_login", "last_request_at").first()
@@ -33,6 +427,16 @@ def get_post_queryset() -> QuerySet:
     return Post.objects.all()
 
 
+def create_posts(user: User, posts_data: List[Dict]) -> List[int]:
+    """Create user Post instances with one bulk INSERT and return their ids."""
+    with transaction.atomic():
+        posts: List[Post] = Post.objects.bulk_create(
+            [Post(user=user, **data) for data in posts_data]
+        )
+        update_statistic_counter(posts=len(posts))
+    return [post.pk for post in posts]
+
+
 def get_users_number() -> int:
     """Get users number."""
     return User.objects.count()
@@ -48,6 +452,79 @@ def get_likes_number() -> int:
     return Like.objects.count()
 
 
+def get_statistic_numbers() -> Dict[str, int]:
+    """
+    Get users, posts and likes numbers summed over counter shards.
+
+    Counter shards are initialized with exact numbers on the first read.
+    """
+    numbers: Dict = StatisticCounter.objects.aggregate(
+        users=Sum("users"), posts=Sum("posts"), likes=Sum("likes")
+    )
+    if numbers["users"] is None:
+        return rebuild_statistic_counter()
+    return numbers
+
+
+def rebuild_statistic_counter() -> Dict[str, int]:
+    """
+    Recalculate counter shards with exact users, posts and likes numbers.
+
+    First shard gets the numbers, others are zeroed. Counter table is
+    locked in EXCLUSIVE mode till commit before rows are counted. Writers
+    add their deltas in the same transaction as their rows, so a writer,
+    which has added delta, is waited for and counted, and a writer, which
+    has not, is not counted and adds its delta to rebuilt shards.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {StatisticCounter._meta.db_table} IN EXCLUSIVE MODE"
+            )
+        numbers: Dict[str, int] = {
+            "users": get_users_number(),
+            "posts": get_posts_number(),
+            "likes": get_likes_number(),
+        }
+        StatisticCounter.objects.all().delete()
+        StatisticCounter.objects.bulk_create(
+            [StatisticCounter(pk=1, **numbers)]
+            + [
+                StatisticCounter(pk=pk)
+                for pk in range(2, settings.STATISTIC_COUNTER_SHARDS + 1)
+            ]
+        )
+    return numbers
+
+
+def update_statistic_counter(**deltas: int) -> None:
+    """
+    Add deltas to random counter shard fields, if shards are initialized.
+
+    Deltas are skipped without shards, as their rows are counted, when
+    shards are initialized.
+    """
+    StatisticCounter.objects.filter(pk=get_counter_shard()).update(
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+def get_estimated_statistic_numbers() -> Dict[str, int]:
+    """Get approximate users, posts and likes numbers from planner statistics."""
+    tables: Dict[str, str] = {
+        User._meta.db_table: "users",
+        Post._meta.db_table: "posts",
+        Like._meta.db_table: "likes",
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname, GREATEST(reltuples, 0)::bigint FROM pg_class "
+            "WHERE oid IN (%s::regclass, %s::regclass, %s::regclass)",
+            list(tables),
+        )
+        return {tables[name]: number for name, number in cursor.fetchall()}
+
+
 def get_likes_queryset() -> QuerySet:
     """Get likes queryset."""
     return Like.objects.all()
@@ -0,0 +1,27 @@
+"""Pagination module for 'api' app."""
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class LastItemsPagination(CursorPagination):
+    """
+    Class for keyset pagination of last instances by descending id.
+
+    Opaque 'next' and 'previous' cursors keep every page at constant cost.
+    """
+
+    ordering: str = "-id"
+    page_size: int = settings.LAST_ITEMS_PAGE_SIZE
+    max_page_size: int = settings.LAST_ITEMS_MAX_PAGE_SIZE
+
+
+class LastPostsPagination(LastItemsPagination):
+    """Class for keyset pagination of last posts."""
+
+    page_size_query_param: str = "posts_number"
+
+
+class LastLikesPagination(LastItemsPagination):
+    """Class for keyset pagination of last likes."""
+
+    page_size_query_param: str = "likes_number"
@@ -0,0 +1,14 @@
+"""Renderers module for 'api' app."""
+from rest_framework.renderers import JSONRenderer
+
+
+class JSONStreamRenderer(JSONRenderer):
+    """
+    Class for selecting streaming JSON output by Accept header.
+
+    Views with this renderer write JSON array elements incrementally when
+    it is negotiated.
+    """
+
+    media_type: str = "application/stream+json"
+    format: str = "json-stream"
@@ -0,0 +1,124 @@
+"""Module for 'api' app request processing stages timing."""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+class RequestTimings:
+    """
+    Class for collecting durations of one request processing stages.
+
+    Durations are summed by stage name, nested measurements of the same
+    stage are counted once, by the outermost one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize timings, request processing starts now."""
+        self.started_at: float = time.perf_counter()
+        self.render_started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.durations: Dict[str, float] = dict()
+        self.db_queries: int = 0
+        self._depth: Dict[str, int] = dict()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add seconds to stage duration."""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Measure duration of stage, run in context."""
+        depth: int = self._depth.get(name, 0)
+        self._depth[name] = depth + 1
+        started_at: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth[name] = depth
+            if not depth:
+                self.add(name, time.perf_counter() - started_at)
+
+    def record_query(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Dict
+    ) -> Any:
+        """Execute database query, counting it and its duration."""
+        self.db_queries += 1
+        with self.measure("db"):
+            return execute(sql, params, many, context)
+
+    def start_render(self) -> None:
+        """Mark view finished and response rendering started."""
+        self.render_started_at = time.perf_counter()
+
+    def finish_render(self, response: Any) -> None:
+        """Add response rendering duration."""
+        if self.render_started_at is not None:
+            self.add("render", time.perf_counter() - self.render_started_at)
+
+    def finish(self) -> None:
+        """Mark request processing finished."""
+        self.finished_at = time.perf_counter()
+
+    def get_milliseconds(self) -> Dict[str, float]:
+        """Get total, view and stage durations in milliseconds."""
+        finished_at: float = self.finished_at or time.perf_counter()
+        durations: Dict[str, float] = {
+            "total": finished_at - self.started_at,
+            "view": (self.render_started_at or finished_at) - self.started_at,
+            "db": 0.0,
+            "serializer": 0.0,
+            "render": 0.0,
+        }
+        durations.update(self.durations)
+        return {name: round(1000 * value, 3) for name, value in durations.items()}
+
+    def get_server_timing(self) -> str:
+        """Get durations as Server-Timing header value."""
+        metrics = []
+        for name, value in self.get_milliseconds().items():
+            metric: str = f"{name};dur={value}"
+            if name == "db":
+                metric += f';desc="{self.db_queries} queries"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+@contextmanager
+def measure(name: str) -> Iterator[None]:
+    """Measure stage duration of current request, if it is timed."""
+    timings: Optional[RequestTimings] = current_timings.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(name):
+        yield
+
+
+def record_query(
+    execute: Callable, sql: str, params: Any, many: bool, context: Dict
+) -> Any:
+    """Execute database query, counting it for current request, if it is timed."""
+    timings: Optional[RequestTimings] = current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    return timings.record_query(execute, sql, params, many, context)
+
+
+def install_query_timer(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Add query timer to connection execute wrappers.
+
+    Timer is installed on every connection, not only for duration of
+    request, so queries of async views run in executor threads and of
+    streamed responses are counted too.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
@@ -1,9 +1,14 @@
 """Module for 'api' app utilities."""
+import json
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, QueryDict
 from django.utils.timezone import make_aware
 from pytz import utc
+from rest_framework.utils.encoders import JSONEncoder
 
 
 def get_like(eval_data: str) -> Optional[bool]:
@@ -16,6 +21,11 @@ def get_like(eval_data: str) -> Optional[bool]:
     return like
 
 
+def is_flag_set(query_params: Dict, name: str) -> bool:
+    """Check whether query parameter is set to true-like value."""
+    return str(query_params.get(name, "")).lower() in ("1", "true", "yes")
+
+
 def process_date_input(query_params: Dict) -> Optional[Tuple]:
     """
     Try to convert input data to datetime values.
@@ -33,3 +43,59 @@ def process_date_input(query_params: Dict) -> Optional[Tuple]:
     except ValueError:
         return None
     return date_from, date_to
+
+
+def to_positive_int(value: Any) -> Optional[int]:
+    """Convert value to positive integer, return None if it is not possible."""
+    try:
+        number: int = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def get_positive_int(query_params: Dict, name: str, default: int) -> int:
+    """Get positive integer query parameter or default value."""
+    number: Optional[int] = to_positive_int(query_params.get(name))
+    return default if number is None else number
+
+
+def stream_json_array(items: Iterable[Dict], chunk_size: int) -> Iterator[bytes]:
+    """Encode items as JSON array and yield it by chunks of chunk_size items."""
+    iterator: Iterator[Dict] = iter(items)
+    separator: bytes = b"["
+    while chunk := list(islice(iterator, chunk_size)):
+        encoded: List[str] = [
+            json.dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+            for item in chunk
+        ]
+        yield separator + ",".join(encoded).encode()
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+async def iterate_async(iterator: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yield chunks of sync iterator, fetching every chunk with sync_to_async.
+
+    Under ASGI sync iterator of streaming response is read to list before
+    the first chunk is sent, so streamed content is wrapped by this one.
+    Chunks are fetched in the thread of sync view, with its connection.
+    """
+    get_next = sync_to_async(next)
+    end: bytes = b""
+    while chunk := await get_next(iterator, end):
+        yield chunk
+
+
+def get_request_data(request: HttpRequest) -> Dict:
+    """Get JSON or form encoded body of Django request as dict."""
+    if request.content_type == "application/json":
+        try:
+            data: Any = json.loads(request.body or b"{}")
+        except ValueError:
+            return dict()
+        return data if isinstance(data, dict) else dict()
+    if request.method == "POST":
+        return request.POST.dict()
+    return QueryDict(request.body).dict()
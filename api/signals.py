@@ -0,0 +1,95 @@
+"""Signal receivers for 'api' app."""
+from typing import Any
+
+from django.core.signals import request_finished
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .authentication import user_cache
+from .db.base import DatabaseWrapper
+from .models import Like, Post, User
+from .services.model_operations import (
+    apply_like_changes,
+    delete_likes,
+    get_like_change,
+    get_like_update_changes,
+    get_saved_like,
+    update_statistic_counter,
+)
+from .services.timing import install_query_timer
+
+
+@receiver(pre_save, sender=Like)
+def remember_saved_like(sender: Any, instance: Like, **kwargs: Any) -> None:
+    """Lock Posts of updated Like and remember its stored Post and eval."""
+    instance._saved_like = None
+    if instance.pk is not None and not kwargs.get("raw"):
+        instance._saved_like = get_saved_like(instance)
+
+
+@receiver(post_save, sender=Like)
+def add_like_to_statistic(
+    sender: Any, instance: Like, created: bool, **kwargs: Any
+) -> None:
+    """Apply created or updated Like to likes statistic and Post counters."""
+    if created:
+        apply_like_changes([get_like_change(instance)])
+    elif getattr(instance, "_saved_like", None) is not None:
+        apply_like_changes(get_like_update_changes(instance, *instance._saved_like))
+
+
+@receiver(pre_delete, sender=Post)
+def remove_post_likes(sender: Any, instance: Post, **kwargs: Any) -> None:
+    """Delete Likes of deleted Post with statistic before cascade."""
+    delete_likes(Like.objects.filter(message_id=instance.pk))
+
+
+@receiver(pre_delete, sender=User)
+def remove_user_likes(sender: Any, instance: User, **kwargs: Any) -> None:
+    """Delete Likes of deleted user with statistic before cascade."""
+    delete_likes(Like.objects.filter(user_id=instance.pk))
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=User)
+def add_instance_to_statistic(
+    sender: Any, instance: Any, created: bool, **kwargs: Any
+) -> None:
+    """Increment posts or users counter on instance creation."""
+    if created:
+        update_statistic_counter(**{get_counter_field(sender): 1})
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=User)
+def remove_instance_from_statistic(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Decrement posts or users counter on instance deletion."""
+    update_statistic_counter(**{get_counter_field(sender): -1})
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender: Any, instance: User, **kwargs: Any) -> None:
+    """Drop cached authentication state of saved or deleted user."""
+    user_cache.delete(instance.pk)
+
+
+def get_counter_field(sender: Any) -> str:
+    """Get StatisticCounter field name for model class."""
+    return "posts" if sender is Post else "users"
+
+
+@receiver(request_finished)
+def mark_connections_idle(sender: Any, **kwargs: Any) -> None:
+    """Mark database connections of finished request as idle."""
+    for connection in connections.all(initialized_only=True):
+        if isinstance(connection, DatabaseWrapper):
+            connection.in_use = False
+
+
+@receiver(connection_created)
+def add_query_timer(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """Add request query timer to created database connection."""
+    install_query_timer(connection)
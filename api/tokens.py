@@ -0,0 +1,29 @@
+"""Token classes for 'api' app."""
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import tokens as jwt_tokens
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .services.blacklist import token_blacklist
+
+
+class RefreshToken(jwt_tokens.RefreshToken):
+    """Refresh token class checked against token blacklist."""
+
+    def verify(self) -> None:
+        """Verify token claims and check it is not blacklisted."""
+        super().verify()
+        self.check_blacklist()
+
+    def check_blacklist(self) -> None:
+        """Raise TokenError, if token is blacklisted."""
+        if token_blacklist.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    def blacklist(self) -> bool:
+        """Blacklist token and return False, if it had already been blacklisted."""
+        return token_blacklist.add(
+            self.payload[api_settings.JTI_CLAIM],
+            datetime_from_epoch(self.payload["exp"]),
+        )
@@ -2,11 +2,17 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from .async_views import AsyncAnaliticView, AsyncLikeView, AsyncPostCreateView
 from .views import (
     AnaliticView,
+    DatabasePoolStatsView,
+    HashingPoolStatsView,
     LastLikesView,
     LastPostsView,
+    LikeBatchView,
     LikeView,
+    MetricsView,
+    PostBulkCreateView,
     PostCreateView,
     RegisterView,
     StatisticView,
@@ -18,10 +24,26 @@ urlpatterns = [
     path("auth/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("auth/signup/", RegisterView.as_view(), name="sign_up"),
     path("post/", PostCreateView.as_view(), name="create_post"),
+    path("post/bulk/", PostBulkCreateView.as_view(), name="create_posts_bulk"),
     path("post/last/", LastPostsView.as_view(), name="last_posts"),
     path("like/", LikeView.as_view(), name="like"),
+    path("like/batch/", LikeBatchView.as_view(), name="like_batch"),
     path("like/last/", LastLikesView.as_view(), name="last_likes"),
     path("analitics/", AnaliticView.as_view(), name="analitics"),
     path("analitics/activity/<int:pk>/", UserActivityView.as_view(), name="activity"),
     path("analitics/statistic/", StatisticView.as_view(), name="statistic"),
+    path(
+        "diagnostics/hashing/",
+        HashingPoolStatsView.as_view(),
+        name="diagnostics_hashing",
+    ),
+    path(
+        "diagnostics/database/",
+        DatabasePoolStatsView.as_view(),
+        name="diagnostics_database",
+    ),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("async/post/", AsyncPostCreateView.as_view(), name="async_create_post"),
+    path("async/like/", AsyncLikeView.as_view(), name="async_like"),
+    path("async/analitics/", AsyncAnaliticView.as_view(), name="async_analitics"),
 ]
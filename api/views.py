@@ -1,37 +1,60 @@
 """Class and function views for 'api' app."""
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from django.conf import settings
+from django.db import connection
 from django.db.models import QuerySet
+from django.http import HttpResponse
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.schemas import AutoSchema
 from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from .authentication import CachedJWTAuthentication
 from .models import User
 from .schemas import (
     LikeSchema,
     analitics_schema,
     last_likes_schema,
     last_posts_schema,
+    like_batch_schema,
+    post_bulk_schema,
+    statistic_schema,
     user_register_schema,
 )
-from .serializers import LikeSerializer, PostSerializer, UserSerializer
-from .services.mixins import UpdateRequestFieldMixin
+from .serializers import (
+    LikeBatchItemSerializer,
+    LikeSerializer,
+    PostSerializer,
+    UserSerializer,
+)
+from .services.activity import get_user_activity
+from .services.hashing import password_hashing_pool
+from .services.metrics import PROMETHEUS_CONTENT_TYPE, metrics_registry
+from .services.mixins import StreamingListMixin, UpdateRequestFieldMixin
 from .services.model_operations import (
+    create_posts,
+    delete_like,
     get_analitic_like_queryset,
-    get_like_instance,
-    get_likes_number,
+    get_estimated_statistic_numbers,
     get_likes_queryset,
     get_post_queryset,
-    get_posts_number,
+    get_statistic_numbers,
     get_user_instance_data,
-    get_users_number,
+    upsert_like,
+    upsert_likes,
+)
+from .services.pagination import LastLikesPagination, LastPostsPagination
+from .services.utils import (
+    get_like,
+    is_flag_set,
+    process_date_input,
+    to_positive_int,
 )
-from .services.utils import get_like, process_date_input
 
 
 class RegisterView(APIView):
@@ -59,27 +82,58 @@ class PostCreateView(UpdateRequestFieldMixin, generics.CreateAPIView):
     queryset: QuerySet = get_post_queryset()
     serializer_class: Serializer = PostSerializer
     permission_classes: List = [IsAuthenticated]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
 
     def perform_create(self, serializer: Serializer) -> None:
         """Add user to serializer and save Post instance."""
         serializer.save(user=self.request.user)
 
 
+class PostBulkCreateView(UpdateRequestFieldMixin, APIView):
+    """Class with only POST method for creating many messages (posts)."""
+
+    permission_classes: List = [IsAuthenticated]
+    authentication_classes: List = [CachedJWTAuthentication]
+    schema: AutoSchema = post_bulk_schema
+
+    def post(self, request: Request) -> Response:
+        """
+        Create Post instances from list of items with one INSERT.
+
+        Every item has "message". List length is limited by POST_BULK_MAX_SIZE
+        setting. Return created posts ids in input order.
+        """
+        ids: List[int] = self.perform_create(request.data, request.user)
+        return Response({"ids": ids}, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def perform_create(data: List, user: User) -> List[int]:
+        """Validate input list and save Post instances."""
+        serializer: Serializer = PostSerializer(
+            data=data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.POST_BULK_MAX_SIZE,
+        )
+        serializer.is_valid(raise_exception=True)
+        return create_posts(user, serializer.validated_data)
+
+
 class LikeView(UpdateRequestFieldMixin, APIView):
     """Class with only POST method for creating Like with eval = True."""
 
     permission_classes: List = [IsAuthenticated]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
     schema: AutoSchema = LikeSchema()
 
     def post(self, request) -> Response:
         """
-        Create Like instance.
+        Create Like instance or change its evaluation.
 
         If "eval" has value "Like", instance saves "eval" field with True.
         "Dislike" - False.
         Otherwise - Response with "Invalid input data.".
+        One user can have only one Like per post, repeated requests update it.
         """
         message_id: int = request.data.get("message_id")
         user: User = request.user
@@ -93,38 +147,86 @@ class LikeView(UpdateRequestFieldMixin, APIView):
 
     @staticmethod
     def perform_create(message_id: int, user: User, like: bool) -> Dict:
-        """Process input data and save Like instance."""
-        serializer: Serializer = LikeSerializer(
-            data={
-                "user": user.pk,
-                "message": message_id,
-                "eval": like,
-            }
-        )
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        return serializer.data
+        """Process input data and upsert Like instance with one statement."""
+        post_id: Optional[int] = to_positive_int(message_id)
+        if post_id is None or (result := upsert_like(user.pk, post_id, like)) is None:
+            raise ValidationError(
+                {"message": [f'Invalid pk "{message_id}" - object does not exist.']}
+            )
+        return LikeSerializer(result[0]).data
 
     def delete(self, request: Request) -> Response:
         """Delete Like instance."""
-        if like := get_like_instance(request.user, request.data.get("message_id")):
-            self.perform_delete(like)
+        if self.perform_delete(request.user, request.data.get("message_id")):
             return Response({"result": "Like was successfully deleted."})
         return Response(
             {"result": "Like was not found"}, status=status.HTTP_404_NOT_FOUND
         )
 
     @staticmethod
-    def perform_delete(like: QuerySet) -> None:
-        """Delete fetched instances."""
-        like.delete()
+    def perform_delete(user: User, message_id: int) -> bool:
+        """Delete Like instance and adjust counters with one statement."""
+        post_id: Optional[int] = to_positive_int(message_id)
+        return post_id is not None and delete_like(user.pk, post_id)
+
+
+class LikeBatchView(UpdateRequestFieldMixin, APIView):
+    """Class with only POST method for creating many Likes per request."""
+
+    permission_classes: List = [IsAuthenticated]
+    authentication_classes: List = [CachedJWTAuthentication]
+    schema: AutoSchema = like_batch_schema
+
+    def post(self, request: Request) -> Response:
+        """
+        Create or update Like instances from list of items.
+
+        Every item has "message_id" and "eval" with value "Like" or "Dislike".
+        List length is limited by LIKE_BATCH_MAX_SIZE setting.
+        Return result for every item in input order.
+        """
+        items: List = request.data
+        max_size: int = settings.LIKE_BATCH_MAX_SIZE
+        if not isinstance(items, list) or not 0 < len(items) <= max_size:
+            return Response(
+                {"result": f"Input must be a list of 1 to {max_size} items."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"results": self.perform_create(items, request.user)})
+
+    @staticmethod
+    def perform_create(items: List, user: User) -> List[Dict]:
+        """Validate items, upsert Like instances and get result per item."""
+        context: Dict = {"message_ids": set()}
+        item_serializers: List[Serializer] = [
+            LikeBatchItemSerializer(data=item, context=context) for item in items
+        ]
+        likes: Dict[int, bool] = {
+            serializer.validated_data["message_id"]: serializer.validated_data["eval"]
+            for serializer in item_serializers
+            if serializer.is_valid()
+        }
+        created: Dict[int, bool] = upsert_likes(user.pk, likes) if likes else {}
+        results: List[Dict] = []
+        for serializer in item_serializers:
+            if serializer.errors:
+                results.append({"result": "Invalid input data."})
+                continue
+            message_id: int = serializer.validated_data["message_id"]
+            result: Dict = {"message_id": message_id, "eval": likes[message_id]}
+            if message_id not in created:
+                result["result"] = "Post was not found"
+            else:
+                result["result"] = "created" if created[message_id] else "updated"
+            results.append(result)
+        return results
 
 
 class AnaliticView(UpdateRequestFieldMixin, APIView):
     """Class for view with like analitic."""
 
     permission_classes: List = [IsAuthenticated]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
     schema: AutoSchema = analitics_schema
 
     @staticmethod
@@ -147,7 +249,7 @@ class UserActivityView(APIView):
     """Class for fetching user activity data."""
 
     permission_classes: List = [IsAdminUser]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
 
     @staticmethod
     def get(request: Request, pk: int) -> Response:
@@ -159,14 +261,7 @@ class UserActivityView(APIView):
         """
         user: User = get_user_instance_data(pk)
         if user:
-            return Response(
-                {
-                    "activity": {
-                        "last_login": user.last_login,
-                        "last_request_at": user.last_request_at,
-                    }
-                }
-            )
+            return Response({"activity": get_user_activity(user)})
         return Response(
             {"result": f"User with pk {pk} does not exist."},
             status=status.HTTP_404_NOT_FOUND,
@@ -177,53 +272,113 @@ class StatisticView(APIView):
     """Class for fetching statistic data."""
 
     permission_classes: List = [IsAdminUser]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
+    schema: AutoSchema = statistic_schema
 
     @staticmethod
     def get(request: Request) -> Response:
         """
         Get user, post and like quantity.
 
+        Query parameter 'estimated' - return approximate numbers from
+        planner statistics instead of maintained counters.
         This endpoint only for admin user.
         """
-        users_number: int = get_users_number()
-        posts_number: int = get_posts_number()
-        likes_number: int = get_likes_number()
+        if is_flag_set(request.query_params, "estimated"):
+            numbers: Dict = get_estimated_statistic_numbers()
+        else:
+            numbers = get_statistic_numbers()
         return Response(
             {
-                "statistic data": f"Users - {users_number}, posts - "
-                f"{posts_number}, likes - {likes_number}"
+                "statistic data": f"Users - {numbers['users']}, posts - "
+                f"{numbers['posts']}, likes - {numbers['likes']}"
             }
         )
 
 
-class LastPostsView(generics.ListAPIView):
-    """Class for getting last n posts."""
+class HashingPoolStatsView(APIView):
+    """Class for fetching password hashing pool utilisation."""
+
+    permission_classes: List = [IsAdminUser]
+    authentication_classes: List = [CachedJWTAuthentication]
+
+    @staticmethod
+    def get(request: Request) -> Response:
+        """
+        Get password hashing pool size and utilisation counters.
+
+        This endpoint only for admin user.
+        """
+        return Response({"hashing_pool": password_hashing_pool.get_stats()})
+
+
+class DatabasePoolStatsView(APIView):
+    """Class for fetching database connection pool utilisation."""
 
     permission_classes: List = [IsAdminUser]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
+
+    @staticmethod
+    def get(request: Request) -> Response:
+        """
+        Get open, idle and in use database connections of current process.
+
+        This endpoint only for admin user.
+        """
+        return Response({"database_pool": connection.pool.get_stats()})
+
+
+class MetricsView(APIView):
+    """Class for fetching request metrics of all worker processes."""
+
+    permission_classes: List = [IsAdminUser]
+    authentication_classes: List = [CachedJWTAuthentication]
+
+    @staticmethod
+    def get(request: Request) -> HttpResponse:
+        """
+        Get request counts, latency histograms and database queries by view.
+
+        Metrics are in Prometheus text format. This endpoint only for admin user.
+        """
+        return HttpResponse(
+            metrics_registry.render(), content_type=PROMETHEUS_CONTENT_TYPE
+        )
+
+
+class LastPostsView(StreamingListMixin, generics.ListAPIView):
+    """
+    Class for getting last n posts. Only for admin users.
+
+    Query parameter 'posts_number' - page size, capped by
+    LAST_ITEMS_MAX_PAGE_SIZE setting. Next pages are fetched by 'next' url.
+    With 'stream' query parameter or 'application/stream+json' Accept header
+    last 'posts_number' posts are streamed as one JSON array without cap.
+    """
+
+    permission_classes: List = [IsAdminUser]
+    authentication_classes: List = [CachedJWTAuthentication]
     serializer_class = PostSerializer
+    pagination_class = LastPostsPagination
+    number_query_param = "posts_number"
     queryset = get_post_queryset()
     schema = last_posts_schema
 
-    def get_queryset(self):
-        """Get queryset with Post instances. Only for admin users."""
-        number: int = int(self.request.query_params.get("posts_number"))
-        queryset = super().get_queryset()
-        return queryset.order_by("-id")[:number]
 
+class LastLikesView(StreamingListMixin, generics.ListAPIView):
+    """
+    Class for getting last n likes. Only for admin users.
 
-class LastLikesView(generics.ListAPIView):
-    """Class for getting last n likes."""
+    Query parameter 'likes_number' - page size, capped by
+    LAST_ITEMS_MAX_PAGE_SIZE setting. Next pages are fetched by 'next' url.
+    With 'stream' query parameter or 'application/stream+json' Accept header
+    last 'likes_number' likes are streamed as one JSON array without cap.
+    """
 
     permission_classes: List = [IsAdminUser]
-    authentication_classes: List = [JWTAuthentication]
+    authentication_classes: List = [CachedJWTAuthentication]
     serializer_class = LikeSerializer
+    pagination_class = LastLikesPagination
+    number_query_param = "likes_number"
     queryset = get_likes_queryset()
     schema = last_likes_schema
-
-    def get_queryset(self):
-        """Get queryset with Like instances. Only for admin users."""
-        number: int = int(self.request.query_params.get("likes_number"))
-        queryset = super().get_queryset()
-        return queryset.order_by("-id")[:number]
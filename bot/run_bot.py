@@ -1,5 +1,10 @@
 """Module for bot running."""
-from services.bot import Bot
+from typing import Dict, Type
 
-bot = Bot()
+from services.bot import AsyncBot, Bot, RateBot
+from services.config import Config
+
+BOTS: Dict[str, Type[Bot]] = {"sequential": Bot, "pipelines": AsyncBot, "rate": RateBot}
+
+bot = BOTS.get(Config().get_var("mode"), AsyncBot)()
 bot.run_bot()
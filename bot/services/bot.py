@@ -1,12 +1,20 @@
 """Module for bot functionality."""
+import asyncio
 import logging.config
+import math
 import random
-from typing import Dict, List
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from faker import Faker
 
 from .config import Config, LogConfig
 from .handlers import create_like, create_post, get_user_tokens, register_user
+from .stats import RequestStats, request_stats, schedule
+from .utils import http_client
 
 fake = Faker(["en_US"])
 logconfig = LogConfig()
@@ -25,31 +33,56 @@ class Bot:
         """Initialize bot instance creation."""
         logger.info("Bot is in initialization process...")
         self.config: Config = Config()
+        self.configure_http_client()
         self.post_tasks: Dict = dict()
         self.like_tasks: Dict = dict()
         self.users_data: List = []
         self.posts_ids: List = []
         self.user_tokens: List = []
 
+    def configure_http_client(self, pool_size: int = 0) -> None:
+        """Configure http client pool size, retries and timeout from config."""
+        http_client.configure(
+            pool_size=max(self.config.get_var("pool_size") or 10, pool_size),
+            retries=self.config.get_var("retries") or 0,
+            backoff=self.config.get_var("backoff") or 0.1,
+            backoff_max=self.config.get_var("backoff_max") or 5.0,
+            timeout=self.config.get_var("timeout") or 30.0,
+        )
+
+    def get_summary(self) -> Dict:
+        """Get run summary of requests statistics and errors."""
+        return request_stats.get_summary(http_client.errors.get_counts())
+
+    def report(self) -> None:
+        """Log run summary and write it to report file."""
+        summary: Dict = self.get_summary()
+        request_stats.log_summary(summary)
+        request_stats.write_summary(
+            summary, self.config.get_var("report_file") or "bot_report.json"
+        )
+
     def create_users_and_tasks(self) -> None:
         """Create given in config data number of users."""
         logger.info("Creating user and tasks.")
         number_of_users = self.config.get_var("number_of_users")
         for index in range(number_of_users):
-            username: str = fake.unique.first_name() + "_" + fake.last_name()
-            password: str = fake.pystr(min_chars=50, max_chars=60)
-            post_number: int = self.add_task(
-                index, "max_posts_per_user", self.post_tasks
-            )
-            like_number: int = self.add_task(
-                index, "max_likes_per_user", self.like_tasks
-            )
-            self.users_data.append({"username": username, "password": password})
-            register_user(username, password)
-            logger.info(
-                f"Created user {username} with tasks to create {post_number}"
-                f" posts and {like_number} likes."
-            )
+            user_data: Dict = self.create_user_data(index)
+            register_user(user_data["username"], user_data["password"])
+
+    def create_user_data(self, index: int) -> Dict:
+        """Create user credentials and its posts and likes tasks."""
+        username: str = fake.unique.first_name() + "_" + fake.last_name()
+        password: str = fake.pystr(min_chars=50, max_chars=60)
+        post_number: int = self.add_task(index, "max_posts_per_user", self.post_tasks)
+        like_number: int = self.add_task(index, "max_likes_per_user", self.like_tasks)
+        user_data: Dict = {"username": username, "password": password}
+        self.users_data.append(user_data)
+        logger.info(
+            f"Created user {username} with tasks to create {post_number}"
+            f" posts and {like_number} likes."
+        )
+        return user_data
 
     def add_task(self, index: int, var_name: str, container: Dict) -> int:
         """Add task to its container."""
@@ -82,6 +115,9 @@ class Bot:
     def perform_like_tasks(self) -> None:
         """Create likes in accordance with like_tasks list."""
         likes_number: int = sum(value for value in self.like_tasks.values())
+        if not self.posts_ids:
+            logger.warning(f"No posts exist, {likes_number} likes are skipped.")
+            return
         while self.like_tasks:
             index: int = random.choice(list(self.like_tasks.keys()))
             token: str = self.user_tokens[index].get("access")
@@ -95,8 +131,265 @@ class Bot:
 
     def run_bot(self) -> None:
         """Run bot functionality."""
+        request_stats.clear()
         self.create_users_and_tasks()
         self.get_users_tokens()
         self.perform_post_tasks()
         self.perform_like_tasks()
+        self.report()
         logger.info("All tasks are successfully performed!")
+
+
+class AsyncBot(Bot):
+    """
+    Class for creating bot running users pipelines concurrently.
+
+    Every user registers, logs in, creates its posts and likes in its own
+    pipeline, pipelines overlap. Blocking handlers run in thread pool, at
+    most 'concurrency' config value requests are in flight at once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize bot instance with concurrency limit."""
+        super().__init__()
+        self.concurrency: int = self.config.get_var("concurrency") or 1
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(self.concurrency)
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.counts: Counter = Counter()
+
+    async def call(self, handler: Callable, *args: Any) -> Any:
+        """Run blocking handler in thread pool, waiting for free slot."""
+        async with self.semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, partial(handler, *args)
+            )
+
+    async def run_user_pipeline(self, index: int, user_data: Dict) -> None:
+        """Register user, fetch its tokens, perform its post and like tasks."""
+        likes_number: int = self.like_tasks.pop(index)
+        posts_number: int = self.post_tasks.pop(index)
+        await self.call(register_user, user_data["username"], user_data["password"])
+        token_data: Optional[Dict] = await self.call(get_user_tokens, user_data)
+        token: Optional[str] = (token_data or dict()).get("access")
+        if token is None:
+            logger.warning(
+                f"User {user_data['username']} has not got token, its "
+                f"{posts_number} posts and {likes_number} likes are skipped."
+            )
+            self.counts["skipped_posts"] += posts_number
+            self.counts["skipped_likes"] += likes_number
+            return
+        posts: List[Optional[Dict]] = await asyncio.gather(
+            *(
+                self.call(create_post, token, fake.pystr(min_chars=1, max_chars=255))
+                for _ in range(posts_number)
+            )
+        )
+        self.posts_ids.extend(post["id"] for post in posts if post and "id" in post)
+        self.counts["posts"] += sum(bool(post and "id" in post) for post in posts)
+        if not self.posts_ids:
+            logger.warning(
+                f"No posts exist yet, {likes_number} likes of user "
+                f"{user_data['username']} are skipped."
+            )
+            self.counts["skipped_likes"] += likes_number
+            return
+        likes: List[Optional[Dict]] = await asyncio.gather(
+            *(
+                self.call(
+                    create_like,
+                    token,
+                    random.choice(self.posts_ids),
+                    random.choice(["Like", "Dislike"]),
+                )
+                for _ in range(likes_number)
+            )
+        )
+        self.counts["likes"] += sum(like is not None for like in likes)
+
+    async def run(self) -> None:
+        """Create users and run their pipelines concurrently."""
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        logger.info("Creating user and tasks.")
+        number_of_users: int = self.config.get_var("number_of_users")
+        users_data: List[Dict] = [
+            self.create_user_data(index) for index in range(number_of_users)
+        ]
+        await asyncio.gather(
+            *(
+                self.run_user_pipeline(index, user_data)
+                for index, user_data in enumerate(users_data)
+            )
+        )
+        logger.info(
+            f"Bot has created {self.counts['posts']} posts and "
+            f"{self.counts['likes']} likes with concurrency {self.concurrency}, "
+            f"{self.counts['skipped_posts']} posts and "
+            f"{self.counts['skipped_likes']} likes were skipped."
+        )
+
+    def run_bot(self) -> None:
+        """Run bot functionality."""
+        request_stats.clear()
+        try:
+            asyncio.run(self.run())
+        finally:
+            self.executor.shutdown()
+        self.report()
+        logger.info("All tasks are successfully performed!")
+
+
+class RateBot(AsyncBot):
+    """
+    Class for creating bot issuing requests on fixed schedule (open loop).
+
+    Users are registered and logged in first, then posts and likes are
+    sent at rate growing in 'ramp_up_steps' steps of 'step_duration'
+    seconds up to 'target_rps', which is held for 'hold_duration' seconds.
+    Threads and connections are sized for requests, which may be in flight
+    at target rate within timeout, so requests do not wait for each other
+    before that. Latency is measured from intended send time, so server
+    queuing is not hidden by late sending, and delay of actual send is
+    recorded as dispatch lag. Every stage is reported separately.
+    """
+
+    def __init__(self) -> None:
+        """Initialize bot instance with load schedule."""
+        super().__init__()
+        load: Dict = self.config.get_var("load") or dict()
+        self.target_rps: float = load.get("target_rps", 10)
+        self.ramp_up_steps: int = load.get("ramp_up_steps", 0)
+        self.step_duration: float = load.get("step_duration", 10)
+        self.hold_duration: float = load.get("hold_duration", 30)
+        self.like_share: float = load.get("like_share", 0.5)
+        self.check_load()
+        self.stages: List[Tuple[float, RequestStats]] = []
+        self.max_in_flight: int = max(
+            self.concurrency,
+            math.ceil(self.target_rps * (self.config.get_var("timeout") or 30.0)),
+        )
+        self.dispatch_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            self.max_in_flight
+        )
+        self.configure_http_client(self.max_in_flight)
+
+    def check_load(self) -> None:
+        """Check load schedule options, raise ValueError if any is invalid."""
+        if not self.target_rps > 0:
+            raise ValueError("Load 'target_rps' must be positive.")
+        if self.ramp_up_steps < 0:
+            raise ValueError("Load 'ramp_up_steps' must not be negative.")
+        if self.ramp_up_steps and not self.step_duration > 0:
+            raise ValueError("Load 'step_duration' must be positive.")
+        if not self.hold_duration > 0:
+            raise ValueError("Load 'hold_duration' must be positive.")
+        if not 0 <= self.like_share <= 1:
+            raise ValueError("Load 'like_share' must be between 0 and 1.")
+
+    def get_stages(self) -> List[Tuple[float, float]]:
+        """Get rates and durations of ramp-up steps and hold stage."""
+        stages: List[Tuple[float, float]] = [
+            (self.target_rps * step / (self.ramp_up_steps + 1), self.step_duration)
+            for step in range(1, self.ramp_up_steps + 1)
+        ]
+        stages.append((self.target_rps, self.hold_duration))
+        return stages
+
+    async def prepare_user(self, user_data: Dict) -> Optional[str]:
+        """Register user, fetch its access token and create its first post."""
+        await self.call(register_user, user_data["username"], user_data["password"])
+        token_data: Optional[Dict] = await self.call(get_user_tokens, user_data)
+        token: Optional[str] = (token_data or dict()).get("access")
+        if token is None:
+            logger.warning(f"User {user_data['username']} has not got token.")
+            return None
+        post: Optional[Dict] = await self.call(
+            create_post, token, fake.pystr(min_chars=1, max_chars=255)
+        )
+        if post and "id" in post:
+            self.posts_ids.append(post["id"])
+        return token
+
+    def perform_scheduled(
+        self, scheduled_at: float, stats: RequestStats, token: str
+    ) -> None:
+        """Create post or like, measuring latency from scheduled time."""
+        lag: float = time.perf_counter() - scheduled_at
+        request_stats.record_dispatch_lag(lag)
+        stats.record_dispatch_lag(lag)
+        schedule.scheduled_at, schedule.stage_stats = scheduled_at, stats
+        try:
+            if self.posts_ids and random.random() < self.like_share:
+                create_like(
+                    token,
+                    random.choice(self.posts_ids),
+                    random.choice(["Like", "Dislike"]),
+                )
+            else:
+                post: Optional[Dict] = create_post(
+                    token, fake.pystr(min_chars=1, max_chars=255)
+                )
+                if post and "id" in post:
+                    self.posts_ids.append(post["id"])
+        finally:
+            schedule.scheduled_at, schedule.stage_stats = None, None
+
+    async def run(self) -> None:
+        """Prepare users and send their requests on schedule."""
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        logger.info("Creating users.")
+        number_of_users: int = self.config.get_var("number_of_users")
+        tokens: List[str] = [
+            token
+            for token in await asyncio.gather(
+                *(
+                    self.prepare_user(self.create_user_data(index))
+                    for index in range(number_of_users)
+                )
+            )
+            if token
+        ]
+        if not tokens:
+            logger.warning("No user has got token, load is not started.")
+            return
+        loop = asyncio.get_running_loop()
+        futures: List[asyncio.Future] = []
+        started_at: float = time.perf_counter()
+        for rate, duration in self.get_stages():
+            logger.info(f"Sending {rate:.1f} requests per second for {duration}s.")
+            stats: RequestStats = RequestStats()
+            stats.started_at = started_at
+            stats.finish(started_at + duration)
+            self.stages.append((rate, stats))
+            for number in range(round(rate * duration)):
+                scheduled_at: float = started_at + number / rate
+                delay: float = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                futures.append(
+                    loop.run_in_executor(
+                        self.dispatch_executor,
+                        self.perform_scheduled,
+                        scheduled_at,
+                        stats,
+                        random.choice(tokens),
+                    )
+                )
+            started_at += duration
+        await asyncio.gather(*futures)
+
+    def get_summary(self) -> Dict:
+        """Get run summary with summaries of schedule stages."""
+        summary: Dict = super().get_summary()
+        summary["stages"] = [
+            {"target_rps": round(rate, 1), **stats.get_summary()}
+            for rate, stats in self.stages
+        ]
+        return summary
+
+    def report(self) -> None:
+        """Log stages summaries, then run summary."""
+        for rate, stats in self.stages:
+            logger.info(f"Stage with target {rate:.1f} requests per second:")
+            request_stats.log_summary(stats.get_summary())
+        super().report()
@@ -11,7 +11,7 @@ def register_user(username: str, password: str) -> None:
     method: str = "post"
     headers: Dict = dict()
     data: Dict = {"username": username, "password": password}
-    make_request(url, method, headers, data)
+    make_request(url, method, headers, data, "sign_up")
 
 
 def get_user_tokens(user_data: Dict) -> Dict:
@@ -19,7 +19,7 @@ def get_user_tokens(user_data: Dict) -> Dict:
     url: str = urls.get_tokens_url()
     method: str = "post"
     headers: Dict = dict()
-    return make_request(url, method, headers, user_data)
+    return make_request(url, method, headers, user_data, "token")
 
 
 def create_post(token: str, message: str) -> Optional[Dict]:
@@ -28,13 +28,13 @@ def create_post(token: str, message: str) -> Optional[Dict]:
     method: str = "post"
     headers: Dict = {"Authorization": f"Bearer {token}"}
     data: Dict = {"message": message}
-    return make_request(url, method, headers, data)
+    return make_request(url, method, headers, data, "create_post")
 
 
-def create_like(token: str, message_id: int, like: str) -> None:
+def create_like(token: str, message_id: int, like: str) -> Optional[Dict]:
     """Create like by user."""
     url: str = urls.get_like_create_url()
     method: str = "post"
     headers: Dict = {"Authorization": f"Bearer {token}"}
     data: Dict = {"message_id": message_id, "eval": like}
-    make_request(url, method, headers, data)
+    return make_request(url, method, headers, data, "like")
@@ -0,0 +1,213 @@
+"""Module for bot requests statistics."""
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """
+    Class for HDR-style histogram of latencies in microseconds.
+
+    Values are counted in log-linear buckets: every power of two range is
+    split into 2 ** (precision_bits - 1) equal buckets, so any recorded
+    value is reproduced with relative error below 2 ** (1 - precision_bits),
+    while memory does not depend on number of recorded values.
+    """
+
+    def __init__(self, precision_bits: int = 8) -> None:
+        """Initialize empty histogram with buckets precision."""
+        self.precision_bits: int = precision_bits
+        self.counts: Counter = Counter()
+        self.total: int = 0
+        self.max: int = 0
+
+    def get_bucket(self, value: int) -> int:
+        """Get bucket index of value, indexes grow with values."""
+        shift: int = max(value.bit_length() - self.precision_bits, 0)
+        return (shift << self.precision_bits) + (value >> shift)
+
+    def get_bucket_value(self, bucket: int) -> int:
+        """Get highest value counted in bucket."""
+        shift: int = bucket >> self.precision_bits
+        mantissa: int = bucket - (shift << self.precision_bits)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Count value."""
+        self.counts[self.get_bucket(value)] += 1
+        self.total += 1
+        self.max = max(self.max, value)
+
+    def get_value_at_percentile(self, percentile: float) -> int:
+        """Get value, which percentile of recorded values do not exceed."""
+        if not self.total:
+            return 0
+        rank: float = max(percentile / 100 * self.total, 1)
+        seen: int = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self.get_bucket_value(bucket), self.max)
+        return self.max
+
+
+class RequestStats:
+    """
+    Class for collecting latencies and statuses of bot requests by endpoint.
+
+    Status is response status code or error kind of request, which got
+    no response. Dispatch lag of scheduled requests (actual send time minus
+    intended one) is recorded separately. Recording is thread safe.
+    """
+
+    percentiles = (50, 90, 99)
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._lock: threading.Lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop recorded requests and start measuring run duration."""
+        with self._lock:
+            self.histograms: Dict[str, Histogram] = dict()
+            self.statuses: Dict[str, Counter] = dict()
+            self.dispatch_lags: Histogram = Histogram()
+            self.started_at: float = time.perf_counter()
+            self.finished_at: Optional[float] = None
+            self.started: datetime = datetime.now()
+
+    def finish(self, finished_at: Optional[float] = None) -> None:
+        """Set end of measured duration, current time by default."""
+        self.finished_at = finished_at or time.perf_counter()
+
+    def record(self, endpoint: str, seconds: float, status: Union[int, str]) -> None:
+        """Record request to endpoint with its latency and status."""
+        with self._lock:
+            if endpoint not in self.histograms:
+                self.histograms[endpoint] = Histogram()
+                self.statuses[endpoint] = Counter()
+            self.histograms[endpoint].record(round(seconds * 1_000_000))
+            self.statuses[endpoint][str(status)] += 1
+
+    def record_dispatch_lag(self, seconds: float) -> None:
+        """Record delay of scheduled request send after its intended time."""
+        with self._lock:
+            self.dispatch_lags.record(round(max(seconds, 0) * 1_000_000))
+
+    @staticmethod
+    def get_percentiles(histogram: Histogram) -> Dict[str, float]:
+        """Get histogram percentiles and max in milliseconds."""
+        percentiles: Dict[str, float] = {
+            f"p{percentile}_ms": histogram.get_value_at_percentile(percentile) / 1000
+            for percentile in RequestStats.percentiles
+        }
+        percentiles["max_ms"] = histogram.max / 1000
+        return percentiles
+
+    @staticmethod
+    def get_endpoint_summary(
+        histogram: Histogram, statuses: Counter, seconds: float
+    ) -> Dict:
+        """Get endpoint requests number, rate, latency percentiles and statuses."""
+        summary: Dict = {
+            "requests": histogram.total,
+            "rps": round(histogram.total / seconds, 1),
+            **RequestStats.get_percentiles(histogram),
+        }
+        summary["statuses"] = dict(sorted(statuses.items()))
+        return summary
+
+    def get_summary(self, errors: Optional[Dict[str, int]] = None) -> Dict:
+        """Get run summary with endpoints summaries and error counts."""
+        with self._lock:
+            seconds: float = max(
+                (self.finished_at or time.perf_counter()) - self.started_at, 1e-6
+            )
+            endpoints: Dict[str, Dict] = {
+                endpoint: self.get_endpoint_summary(
+                    self.histograms[endpoint], self.statuses[endpoint], seconds
+                )
+                for endpoint in sorted(self.histograms)
+            }
+            started: str = self.started.isoformat()
+            dispatch_lag: Optional[Dict[str, float]] = (
+                self.get_percentiles(self.dispatch_lags)
+                if self.dispatch_lags.total
+                else None
+            )
+        requests: int = sum(summary["requests"] for summary in endpoints.values())
+        summary: Dict = {
+            "started_at": started,
+            "duration_s": round(seconds, 3),
+            "requests": requests,
+            "rps": round(requests / seconds, 1),
+            "endpoints": endpoints,
+            "errors": errors or dict(),
+        }
+        if dispatch_lag is not None:
+            summary["dispatch_lag"] = dispatch_lag
+        return summary
+
+    @staticmethod
+    def log_summary(summary: Dict) -> None:
+        """Log summary as table of endpoints."""
+        logger.info(
+            f"{summary['requests']} requests in {summary['duration_s']}s, "
+            f"{summary['rps']} requests per second."
+        )
+        logger.info(
+            f"{'endpoint':<12} {'requests':>8} {'rps':>8} {'p50 ms':>9} "
+            f"{'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}  statuses"
+        )
+        for endpoint, data in summary["endpoints"].items():
+            statuses: str = ", ".join(
+                f"{status} {count}" for status, count in data["statuses"].items()
+            )
+            logger.info(
+                f"{endpoint:<12} {data['requests']:>8} {data['rps']:>8} "
+                f"{data['p50_ms']:>9} {data['p90_ms']:>9} {data['p99_ms']:>9} "
+                f"{data['max_ms']:>9}  {statuses}"
+            )
+        if "dispatch_lag" in summary:
+            lag: Dict = summary["dispatch_lag"]
+            logger.info(
+                f"Dispatch lag: p50 {lag['p50_ms']} ms, p90 {lag['p90_ms']} ms, "
+                f"p99 {lag['p99_ms']} ms, max {lag['max_ms']} ms."
+            )
+        if not summary["errors"]:
+            return
+        logger.info(
+            "Request errors: "
+            + ", ".join(f"{kind} {count}" for kind, count in summary["errors"].items())
+        )
+
+    @staticmethod
+    def write_summary(summary: Dict, file_path: str) -> None:
+        """Write summary to JSON file."""
+        with open(file_path, "w") as report:
+            json.dump(summary, report, indent=2)
+        logger.info(f"Report is written to {file_path}.")
+
+
+class Schedule(threading.local):
+    """
+    Class for intended send time and stage statistics of scheduled request.
+
+    Values are set by thread, which performs request, so latency is
+    measured from intended send time, not from actual one, delay of actual
+    send is recorded as dispatch lag.
+    """
+
+    scheduled_at: Optional[float] = None
+    stage_stats: Optional[RequestStats] = None
+
+
+request_stats: RequestStats = RequestStats()
+schedule: Schedule = Schedule()
@@ -1,14 +1,25 @@
 """Module for bot utils."""
-from typing import Dict, Optional
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 from yaml import load
 
+from .stats import request_stats, schedule
+
 try:
     from yaml import CLoader as Loader
 except ImportError:
     from yaml import Loader
 
+logger = logging.getLogger(__name__)
+
 
 def load_config_data_from_file(file_path: str) -> Dict:
     """Load config file data and create config data dict."""
@@ -16,12 +27,192 @@ def load_config_data_from_file(file_path: str) -> Dict:
     return load(stream, Loader)
 
 
+class RequestErrors:
+    """
+    Class for counting failed requests by error kind.
+
+    Kinds are 'connection' (connection was not established or was dropped),
+    'timeout', 'http_4xx', 'http_5xx' and 'invalid_json' (response body is
+    not JSON). Retried attempts are counted as 'retries'.
+    """
+
+    KINDS = ("connection", "timeout", "http_4xx", "http_5xx", "invalid_json")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._counts: Counter = Counter()
+        self._lock: threading.Lock = threading.Lock()
+
+    def add(self, kind: str) -> None:
+        """Count error of kind."""
+        with self._lock:
+            self._counts[kind] += 1
+
+    def get_counts(self) -> Dict[str, int]:
+        """Get counts of all error kinds and retries."""
+        with self._lock:
+            return {kind: self._counts[kind] for kind in self.KINDS + ("retries",)}
+
+    def clear(self) -> None:
+        """Reset counters."""
+        with self._lock:
+            self._counts.clear()
+
+
+class HttpClient:
+    """
+    Class for requesting 'network' api with pooled keep-alive session.
+
+    Connections are reused, so requests do not pay TCP handshake and DNS
+    lookup. Failures are retried with jittered exponential backoff only if
+    retry is safe: request that never reached server (connection error
+    before sending, 503 response) is retried for any method, timeouts,
+    dropped connections, 502 and 504 responses are retried for idempotent
+    methods only, as server may have already processed request.
+    """
+
+    IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+    RETRY_STATUSES = frozenset((502, 503, 504))
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff: float = 0.1,
+        backoff_max: float = 5.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize client with pool size, retry and timeout options."""
+        self.errors: RequestErrors = RequestErrors()
+        self.session: Optional[requests.Session] = None
+        self.configure(pool_size, retries, backoff, backoff_max, timeout)
+
+    def configure(
+        self,
+        pool_size: int = 10,
+        retries: int = 3,
+        backoff: float = 0.1,
+        backoff_max: float = 5.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """Set options and create new session with pool_size connections."""
+        self.retries: int = retries
+        self.backoff: float = backoff
+        self.backoff_max: float = backoff_max
+        self.timeout: float = timeout
+        if self.session is not None:
+            self.session.close()
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, pool_block=True
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Get full jitter backoff delay, not shorter than Retry-After header."""
+        delay: float = random.uniform(
+            0, min(self.backoff_max, self.backoff * 2**attempt)
+        )
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.backoff_max))
+        return delay
+
+    def is_retry_safe(
+        self,
+        method: str,
+        status_code: Optional[int] = None,
+        error: Optional[requests.RequestException] = None,
+    ) -> bool:
+        """Check if request failed with status code or error may be repeated."""
+        if status_code == 503 or isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError):
+            reason = getattr(error.args[0] if error.args else None, "reason", None)
+            if isinstance(reason, NewConnectionError):
+                return True
+        return method in self.IDEMPOTENT_METHODS
+
+    @staticmethod
+    def get_error_kind(error: requests.RequestException) -> str:
+        """Get error kind of request exception."""
+        if isinstance(error, requests.exceptions.Timeout):
+            return "timeout"
+        return "connection"
+
+    def request(
+        self, url: str, method: str, headers: Dict, data: Optional[Dict] = None
+    ) -> Union[requests.Response, str]:
+        """Request url, retrying safe failures, return error kind if all failed."""
+        method = method.upper()
+        for attempt in range(self.retries + 1):
+            retry_after: Optional[str] = None
+            try:
+                response: requests.Response = self.session.request(
+                    method, url, headers=headers, json=data, timeout=self.timeout
+                )
+            except requests.RequestException as error:
+                kind: str = self.get_error_kind(error)
+                if attempt == self.retries or not self.is_retry_safe(
+                    method, error=error
+                ):
+                    self.errors.add(kind)
+                    logger.warning(f"{method} {url} failed with {kind} error: {error}")
+                    return kind
+            else:
+                if response.status_code not in self.RETRY_STATUSES or (
+                    attempt == self.retries
+                    or not self.is_retry_safe(method, response.status_code)
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+            self.errors.add("retries")
+            time.sleep(self.get_delay(attempt, retry_after))
+        return "connection"
+
+
+http_client: HttpClient = HttpClient()
+
+
 def make_request(
-    url: str, method: str, headers: Dict, data: Optional[Dict] = None
+    url: str,
+    method: str,
+    headers: Dict,
+    data: Optional[Dict] = None,
+    endpoint: str = "other",
 ) -> Optional[Dict]:
-    """Request url with method, headers and data."""
+    """
+    Request url with method, headers and data.
+
+    Return response JSON, even of error response, or None if request
+    failed or response is not JSON. Failures are counted by http_client,
+    latency with retries and status are recorded in endpoint statistics.
+    Latency of scheduled request is measured from its intended send time.
+    """
     headers.update({"Content-Type": "application/json"})
-    handler = getattr(requests, method.lower())
-    response = handler(url=url, headers=headers, json=data)
-    if hasattr(response, "json"):
-        return response.json()
+    started_at: float = schedule.scheduled_at or time.perf_counter()
+    response: Union[requests.Response, str] = http_client.request(
+        url, method, headers, data
+    )
+    status: Union[int, str] = (
+        response if isinstance(response, str) else response.status_code
+    )
+    seconds: float = time.perf_counter() - started_at
+    request_stats.record(endpoint, seconds, status)
+    if schedule.stage_stats is not None:
+        schedule.stage_stats.record(endpoint, seconds, status)
+    if isinstance(response, str):
+        return None
+    result: Optional[Dict] = None
+    try:
+        result = response.json()
+    except ValueError:
+        http_client.errors.add("invalid_json")
+    if response.status_code >= 400:
+        http_client.errors.add(f"http_{response.status_code // 100}xx")
+    if response.status_code >= 400 or result is None:
+        logger.warning(
+            f"{method.upper()} {url} responded {response.status_code}: "
+            f"{response.text[:200]!r}"
+        )
+    return result
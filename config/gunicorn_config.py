@@ -0,0 +1,141 @@
+"""
+Gunicorn configuration for config project.
+
+Usage:
+    gunicorn -c config/gunicorn_config.py
+
+Worker class is chosen by GUNICORN_WORKER_CLASS environment variable:
+'gthread' (default) serves WSGI application with thread pool per worker,
+'asgi' serves ASGI application with uvicorn event loop per worker. Worker
+and thread numbers are derived from available CPUs unless GUNICORN_WORKERS
+and GUNICORN_THREADS are set. Application is preloaded in master process,
+so workers share its memory copy-on-write.
+"""
+import os
+import time
+from typing import Any, Dict, Tuple
+
+WORKER_CLASSES: Dict[str, Tuple[str, str]] = {
+    "gthread": ("gthread", "config.wsgi:application"),
+    "asgi": ("uvicorn.workers.UvicornWorker", "config.asgi:application"),
+}
+
+
+def get_cpu_count() -> int:
+    """Get number of CPUs available to current process."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_rss() -> int:
+    """Get resident set size of current process in KiB."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def get_worker_numbers(kind: str, cpus: int) -> Tuple[int, int]:
+    """
+    Get default workers and threads number for worker class kind.
+
+    Thread workers are CPU bound in Python code only partially, request
+    time is mostly spent in database, so every CPU gets one process with
+    four threads plus one spare process. Event loop workers get one process
+    per CPU with single thread.
+    """
+    if kind == "asgi":
+        return cpus, 1
+    return cpus + 1, 4
+
+
+worker_kind: str = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+worker_class, wsgi_app = WORKER_CLASSES.get(
+    worker_kind, (worker_kind, "config.wsgi:application")
+)
+default_workers, default_threads = get_worker_numbers(worker_kind, get_cpu_count())
+workers: int = int(os.getenv("GUNICORN_WORKERS", default_workers))
+threads: int = int(os.getenv("GUNICORN_THREADS", default_threads))
+
+bind: str = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+preload_app: bool = True
+max_requests: int = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter: int = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+timeout: int = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout: int = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive: int = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+accesslog: str = "-"
+
+started_at: float = time.monotonic()
+
+
+def when_ready(server: Any) -> None:
+    """Drop metrics of previous run, log master boot time and memory."""
+    from django.apps import apps
+
+    if apps.ready:
+        from api.services.metrics import metrics_registry
+
+        metrics_registry.clear()
+    server.log.info(
+        "Master booted in %.3fs, rss %d KiB, %d %s workers with %d threads",
+        time.monotonic() - started_at,
+        get_rss(),
+        server.cfg.workers,
+        server.cfg.worker_class_str,
+        server.cfg.threads,
+    )
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    """Close master database connections, so workers do not share sockets."""
+    from django.db import connections
+
+    connections.close_all()
+    worker.forked_at = time.monotonic()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Reset process local state inherited from master."""
+    from django.apps import apps
+
+    if not apps.ready:
+        return
+    from api.authentication import token_cache, user_cache
+    from api.services.activity import activity_tracker
+    from api.services.blacklist import token_blacklist
+
+    activity_tracker.reset()
+    token_blacklist.reset()
+    token_cache.clear()
+    user_cache.clear()
+
+
+def post_worker_init(worker: Any) -> None:
+    """Log worker boot time and memory."""
+    worker.log.info(
+        "Worker %s booted in %.3fs, rss %d KiB",
+        worker.pid,
+        time.monotonic() - worker.forked_at,
+        get_rss(),
+    )
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    """Log worker memory on exit, it grows with served requests."""
+    server.log.info("Worker %s exited, rss %d KiB", worker.pid, get_rss())
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Fold metrics of exited worker into aggregate file."""
+    from django.apps import apps
+
+    if apps.ready:
+        from api.services.metrics import metrics_registry
+
+        metrics_registry.mark_process_dead(worker.pid)
@@ -7,6 +7,13 @@ while ! python manage.py makemigrations api 2>&1; do
   sleep 3
 done
 
+echo "Delete duplicated likes, if unique constraint migration is not applied yet."
+
+while ! python manage.py deduplicate_likes 2>&1; do
+  echo "Deleting duplicated likes is in progress status."
+  sleep 3
+done
+
 echo "Migrate the database at startup of project."
 
 while ! python manage.py migrate 2>&1; do
@@ -14,6 +21,20 @@ while ! python manage.py migrate 2>&1; do
   sleep 3
 done
 
+echo "Backfill daily likes rollup of existing likes, if it is missing."
+
+while ! python manage.py rebuild_like_daily_stats --if-missing 2>&1; do
+  echo "Backfilling daily likes rollup is in progress status."
+  sleep 3
+done
+
+echo "Backfill Post like counters of existing likes, if they are missing."
+
+while ! python manage.py reconcile_post_like_counters --if-missing 2>&1; do
+  echo "Backfilling Post like counters is in progress status."
+  sleep 3
+done
+
 echo "Run collectstatic command."
 
 while ! python manage.py collectstatic --noinput 2>&1; do
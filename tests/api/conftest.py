@@ -1,17 +1,44 @@
 """Module for tests api fixtures."""
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import freezegun
 import pytest
-from django.test import Client
-from django.urls import reverse
 from faker import Faker
 
+from api.authentication import token_cache, user_cache
 from api.models import Post, User
+from api.services.activity import activity_tracker
+from api.services.blacklist import token_blacklist
+from api.services.metrics import metrics_registry
 from tests.api.factories import LikeFactory, PostFactory, UserFactory
 
 
+@pytest.fixture(autouse=True)
+def reset_activity_tracker() -> None:
+    """Drop activity buffered by previous tests."""
+    activity_tracker.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_authentication_caches() -> None:
+    """Drop authentication tokens and users cached by previous tests."""
+    token_cache.clear()
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_token_blacklist() -> None:
+    """Drop token blacklist filter built by previous tests."""
+    token_blacklist.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics() -> None:
+    """Drop request metrics recorded by previous tests."""
+    metrics_registry.clear()
+
+
 @pytest.fixture
 def get_like_data_for_analitic(faker: Faker, freezer: freezegun) -> Tuple[List, List]:
     """
@@ -30,19 +57,3 @@ def get_like_data_for_analitic(faker: Faker, freezer: freezegun) -> Tuple[List,
         post: Post = PostFactory()
         LikeFactory.create_batch(size=numbers[-1], user=user, message=post)
     return dates, numbers
-
-
-@pytest.fixture
-def get_authorized_admin_user_data(
-    faker: Faker, django_user_model: User, client: Client
-) -> Tuple[User, Dict]:
-    """Create and get authorized user data for testing."""
-    user = django_user_model.objects.create_superuser(
-        username="test", email="test@gmail.com", password="password"
-    )
-    token_url: str = reverse("token")
-    token_data: Dict = {"username": user.username, "password": "password"}
-    response = client.post(token_url, data=token_data)
-    access_token = response.json().get("access")
-    headers: Dict = {"Authorization": f"Bearer {access_token}"}
-    return user, headers
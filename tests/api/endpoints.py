@@ -0,0 +1,148 @@
+"""Module for requests to 'api' app endpoints, shared by tests and benchmarks."""
+import json
+import uuid
+from typing import Callable, Dict, List, NamedTuple
+
+from django.http import HttpResponse
+from django.test import Client
+from django.urls import reverse
+
+from api.models import Like, Post, User
+from api.tokens import RefreshToken
+
+
+class Dataset(NamedTuple):
+    """Class for seeded dataset and credentials of admin user."""
+
+    user: User
+    headers: Dict
+    posts: List[Post]
+
+
+def get_refresh_data(dataset: Dataset) -> Dict:
+    """Get new refresh token of admin user."""
+    return {"refresh": str(RefreshToken.for_user(dataset.user))}
+
+
+def get_new_user_data(dataset: Dataset) -> Dict:
+    """Get data of not registered user."""
+    number: str = uuid.uuid4().hex[:16]
+    return {
+        "username": f"new_{number}",
+        "email": f"new_{number}@gmail.com",
+        "password": "password",
+    }
+
+
+def get_like_data(dataset: Dataset) -> Dict:
+    """Get data for liking post of dataset."""
+    return {"message_id": dataset.posts[-1].pk, "eval": "like"}
+
+
+def like_dataset_post(dataset: Dataset) -> None:
+    """Like post of dataset by admin user, so like deletion requests find it."""
+    Like.objects.get_or_create(user=dataset.user, message=dataset.posts[-1])
+
+
+def get_unlike_data(dataset: Dataset) -> str:
+    """Get data for deleting Like of post of dataset."""
+    return json.dumps({"message_id": dataset.posts[-1].pk})
+
+
+def get_like_batch_data(dataset: Dataset) -> str:
+    """Get data for liking several posts of dataset."""
+    return json.dumps(
+        [{"message_id": post.pk, "eval": "dislike"} for post in dataset.posts[:5]]
+    )
+
+
+ENDPOINT_REQUESTS: Dict[str, Callable[[Client, Dataset], HttpResponse]] = {
+    "token": lambda client, dataset: client.post(
+        reverse("token"), data={"username": "test", "password": "password"}
+    ),
+    "token_refresh": lambda client, dataset: client.post(
+        reverse("token_refresh"), data=get_refresh_data(dataset)
+    ),
+    "sign_up": lambda client, dataset: client.post(
+        reverse("sign_up"), data=get_new_user_data(dataset)
+    ),
+    "create_post": lambda client, dataset: client.post(
+        reverse("create_post"), headers=dataset.headers, data={"message": "a"}
+    ),
+    "create_posts_bulk": lambda client, dataset: client.post(
+        reverse("create_posts_bulk"),
+        headers=dataset.headers,
+        data=json.dumps([{"message": "a"}, {"message": "b"}]),
+        content_type="application/json",
+    ),
+    "last_posts": lambda client, dataset: client.get(
+        reverse("last_posts"), headers=dataset.headers
+    ),
+    "last_posts_stream": lambda client, dataset: client.get(
+        reverse("last_posts"), headers=dataset.headers, data={"stream": "true"}
+    ),
+    "like": lambda client, dataset: client.post(
+        reverse("like"), headers=dataset.headers, data=get_like_data(dataset)
+    ),
+    "like_delete": lambda client, dataset: client.delete(
+        reverse("like"),
+        headers=dataset.headers,
+        data=get_unlike_data(dataset),
+        content_type="application/json",
+    ),
+    "like_batch": lambda client, dataset: client.post(
+        reverse("like_batch"),
+        headers=dataset.headers,
+        data=get_like_batch_data(dataset),
+        content_type="application/json",
+    ),
+    "last_likes": lambda client, dataset: client.get(
+        reverse("last_likes"), headers=dataset.headers
+    ),
+    "last_likes_stream": lambda client, dataset: client.get(
+        reverse("last_likes"), headers=dataset.headers, data={"stream": "true"}
+    ),
+    "analitics": lambda client, dataset: client.get(
+        reverse("analitics"),
+        headers=dataset.headers,
+        data={"date_from": "2023-01-01", "date_to": "2030-01-01"},
+    ),
+    "activity": lambda client, dataset: client.get(
+        reverse("activity", kwargs={"pk": dataset.posts[0].user_id}),
+        headers=dataset.headers,
+    ),
+    "statistic": lambda client, dataset: client.get(
+        reverse("statistic"), headers=dataset.headers
+    ),
+    "statistic_estimated": lambda client, dataset: client.get(
+        reverse("statistic"), headers=dataset.headers, data={"estimated": "true"}
+    ),
+    "diagnostics_hashing": lambda client, dataset: client.get(
+        reverse("diagnostics_hashing"), headers=dataset.headers
+    ),
+    "diagnostics_database": lambda client, dataset: client.get(
+        reverse("diagnostics_database"), headers=dataset.headers
+    ),
+    "metrics": lambda client, dataset: client.get(
+        reverse("metrics"), headers=dataset.headers
+    ),
+    "async_create_post": lambda client, dataset: client.post(
+        reverse("async_create_post"),
+        headers=dataset.headers,
+        data={"message": "a"},
+    ),
+    "async_like": lambda client, dataset: client.post(
+        reverse("async_like"), headers=dataset.headers, data=get_like_data(dataset)
+    ),
+    "async_like_delete": lambda client, dataset: client.delete(
+        reverse("async_like"),
+        headers=dataset.headers,
+        data=get_unlike_data(dataset),
+        content_type="application/json",
+    ),
+    "async_analitics": lambda client, dataset: client.get(
+        reverse("async_analitics"),
+        headers=dataset.headers,
+        data={"date_from": "2023-01-01", "date_to": "2030-01-01"},
+    ),
+}
@@ -0,0 +1,117 @@
+"""Module for testing 'api' app services activity."""
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pytest
+from django.db import DatabaseError
+from django.utils import timezone
+
+from api.models import User
+from api.services.activity import ActivityTracker, get_user_activity
+from tests.api.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestActivityTracker:
+    """Class for testing ActivityTracker."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_touch_buffers_inside_window(self) -> None:
+        """Test touch does not write to database inside flush window."""
+        user: User = UserFactory()
+        saved_at: datetime = user.last_request_at
+        tracker = ActivityTracker(flush_interval=3600)
+        tracker.touch(user.pk)
+        user.refresh_from_db()
+        assert user.last_request_at == saved_at
+        assert tracker.get_pending(user.pk).get("last_request_at") > saved_at
+
+    def test_touch_coalesces_updates(self, django_assert_num_queries) -> None:
+        """Test repeated touches of many users are written by one query."""
+        users = UserFactory.create_batch(size=3)
+        tracker = ActivityTracker(flush_interval=3600)
+        for _ in range(5):
+            for user in users:
+                tracker.touch(user.pk)
+        with django_assert_num_queries(1):
+            assert tracker.flush() == len(users)
+        for user in users:
+            assert not tracker.get_pending(user.pk)
+
+    def test_touch_flushes_after_window(self) -> None:
+        """Test touch writes buffered timestamps when window has passed."""
+        user: User = UserFactory()
+        tracker = ActivityTracker(flush_interval=0)
+        tracker.touch(user.pk, "last_login")
+        user.refresh_from_db()
+        assert user.last_login is not None
+        assert not tracker.get_pending(user.pk)
+
+    def test_record(self, django_assert_num_queries) -> None:
+        """Test record buffers timestamp and reports due flush without writing."""
+        tracker = ActivityTracker(flush_interval=0)
+        with django_assert_num_queries(0):
+            assert tracker.record(1) is True
+        assert ActivityTracker(flush_interval=3600).record(1) is False
+        assert "last_request_at" in tracker.get_pending(1)
+
+    def test_flush_empty(self, django_assert_num_queries) -> None:
+        """Test flush of empty buffer does not query database."""
+        tracker = ActivityTracker(flush_interval=3600)
+        with django_assert_num_queries(0):
+            assert tracker.flush() == 0
+
+    def test_flush_restores_buffer_on_error(self, mocker) -> None:
+        """Test failed flush puts timestamps back, keeping newer ones."""
+        tracker = ActivityTracker(flush_interval=3600)
+        tracker.touch(1)
+        tracker.touch(2)
+        mocker.patch(
+            "api.services.activity.User.objects.bulk_update",
+            side_effect=DatabaseError,
+        )
+        recorded_at: datetime = tracker.get_pending(1)["last_request_at"]
+        with pytest.raises(DatabaseError):
+            tracker.flush()
+        assert tracker.get_pending(1)["last_request_at"] == recorded_at
+        assert "last_request_at" in tracker.get_pending(2)
+
+    def test_background_flush(self, mocker) -> None:
+        """Test background thread flushes buffer of idle tracker."""
+        tracker = ActivityTracker(flush_interval=0.01, background=True)
+        flush = mocker.patch.object(tracker, "flush")
+        mocker.patch("api.services.activity.connection")
+        tracker.record(1)
+        deadline: float = time.monotonic() + 5
+        while not flush.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        tracker.reset()
+        assert flush.called
+
+    def test_reset(self) -> None:
+        """Test reset drops buffered timestamps."""
+        tracker = ActivityTracker(flush_interval=3600)
+        tracker.touch(1)
+        tracker.reset()
+        assert not tracker.get_pending(1)
+
+
+@pytest.mark.django_db
+class TestGetUserActivity:
+    """Class for testing get_user_activity function."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_get_user_activity(self, mocker) -> None:
+        """Test pending timestamps override stored ones."""
+        user: User = UserFactory()
+        pending_at: datetime = timezone.now() + timedelta(minutes=1)
+        mocker.patch(
+            "api.services.activity.activity_tracker.get_pending",
+            return_value={"last_request_at": pending_at},
+        )
+        result: Dict = get_user_activity(user)
+        assert result.get("last_request_at") == pending_at
+        assert result.get("last_login") == user.last_login
@@ -0,0 +1,68 @@
+"""Module for testing 'api' app refresh token blacklist."""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from faker import Faker
+
+from api.models import BlacklistedToken
+from api.services.blacklist import TokenBlacklist, purge_blacklisted_tokens
+
+
+@pytest.mark.django_db
+class TestTokenBlacklist:
+    """Class for testing TokenBlacklist."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_contains_not_blacklisted(
+        self, faker: Faker, django_assert_num_queries
+    ) -> None:
+        """Test not blacklisted JTI check skips database after filter rebuild."""
+        blacklist: TokenBlacklist = TokenBlacklist(rebuild_interval=60)
+        with django_assert_num_queries(1):
+            assert blacklist.contains(faker.uuid4()) is False
+        with django_assert_num_queries(0):
+            assert blacklist.contains(faker.uuid4()) is False
+
+    def test_add_and_contains(self, faker: Faker) -> None:
+        """Test added JTI is blacklisted and repeated adding returns False."""
+        blacklist: TokenBlacklist = TokenBlacklist(rebuild_interval=60)
+        jti: str = faker.uuid4()
+        expires_at = timezone.now() + timedelta(days=1)
+        blacklist.contains(jti)
+        assert blacklist.add(jti, expires_at) is True
+        assert blacklist.add(jti, expires_at) is False
+        assert blacklist.contains(jti) is True
+        assert BlacklistedToken.objects.get().jti == jti
+
+    def test_rebuild(self, faker: Faker) -> None:
+        """Test rebuild loads JTIs blacklisted by other processes."""
+        blacklist: TokenBlacklist = TokenBlacklist(rebuild_interval=60)
+        jti: str = faker.uuid4()
+        blacklist.contains(jti)
+        BlacklistedToken.objects.create(
+            jti=jti, expires_at=timezone.now() + timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(
+            jti=faker.uuid4(), expires_at=timezone.now() - timedelta(days=1)
+        )
+        assert blacklist.contains(jti) is False
+        assert blacklist.rebuild() == 1
+        assert blacklist.contains(jti) is True
+
+
+@pytest.mark.django_db
+class TestPurgeBlacklistedTokens:
+    """Class for testing purge_blacklisted_tokens function."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_purge_blacklisted_tokens(self, faker: Faker) -> None:
+        """Test purge_blacklisted_tokens deletes only expired tokens."""
+        for days in (-2, -1, 1):
+            BlacklistedToken.objects.create(
+                jti=faker.uuid4(), expires_at=timezone.now() + timedelta(days=days)
+            )
+        assert purge_blacklisted_tokens() == 2
+        assert BlacklistedToken.objects.count() == 1
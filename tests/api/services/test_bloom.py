@@ -0,0 +1,31 @@
+"""Module for testing 'api' app Bloom filter."""
+from typing import List
+
+from faker import Faker
+
+from api.services.bloom import BloomFilter
+
+
+class TestBloomFilter:
+    """Class for testing BloomFilter."""
+
+    def test_bloom_filter_added_items(self, faker: Faker) -> None:
+        """Test BloomFilter contains every added item."""
+        bloom: BloomFilter = BloomFilter(capacity=1000, error_rate=0.001)
+        items: List[str] = [faker.uuid4() for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+        assert all(item in bloom for item in items)
+
+    def test_bloom_filter_false_positive_rate(self, faker: Faker) -> None:
+        """Test BloomFilter false positives stay near error rate."""
+        bloom: BloomFilter = BloomFilter(capacity=1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(faker.uuid4())
+        false_positives: int = sum(faker.uuid4() in bloom for _ in range(10000))
+        assert false_positives < 300
+
+    def test_bloom_filter_empty(self, faker: Faker) -> None:
+        """Test empty BloomFilter contains nothing."""
+        bloom: BloomFilter = BloomFilter(capacity=0, error_rate=0.001)
+        assert faker.uuid4() not in bloom
@@ -0,0 +1,69 @@
+"""Module for testing 'api' app cache services."""
+import freezegun
+from faker import Faker
+
+from api.services.cache import TTLCache
+
+
+class TestTTLCache:
+    """Class for testing TTLCache."""
+
+    def test_ttl_cache_get_and_set(self, faker: Faker) -> None:
+        """Test TTLCache returns set values and None for missing keys."""
+        cache: TTLCache = TTLCache(maxsize=10, ttl=60)
+        value: str = faker.pystr()
+        cache.set(1, value)
+        assert cache.get(1) == value
+        assert cache.get(2) is None
+
+    def test_ttl_cache_expiration(self, freezer: freezegun) -> None:
+        """Test TTLCache drops expired values."""
+        cache: TTLCache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "value")
+        cache.set(2, "value", ttl=120)
+        freezer.tick(61)
+        assert cache.get(1) is None
+        assert cache.get(2) == "value"
+        assert len(cache) == 1
+
+    def test_ttl_cache_lru_eviction(self) -> None:
+        """Test TTLCache evicts least recently used value if full."""
+        cache: TTLCache = TTLCache(maxsize=2, ttl=60)
+        cache.set(1, "first")
+        cache.set(2, "second")
+        cache.get(1)
+        cache.set(3, "third")
+        assert cache.get(2) is None
+        assert (cache.get(1), cache.get(3)) == ("first", "third")
+
+    def test_ttl_cache_delete_and_clear(self) -> None:
+        """Test TTLCache delete and clear methods."""
+        cache: TTLCache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "first")
+        cache.set(2, "second")
+        cache.delete(1)
+        cache.delete(3)
+        assert cache.get(1) is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_ttl_cache_stats(self) -> None:
+        """Test TTLCache counts hits and misses."""
+        cache: TTLCache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "value")
+        cache.get(1)
+        cache.get(1)
+        cache.get(2)
+        assert cache.get_stats() == {"size": 1, "maxsize": 10, "hits": 2, "misses": 1}
+
+    def test_ttl_cache_disabled(self) -> None:
+        """Test TTLCache with zero maxsize stores nothing."""
+        cache: TTLCache = TTLCache(maxsize=0, ttl=60)
+        cache.set(1, "value")
+        assert cache.get(1) is None
+
+    def test_ttl_cache_not_positive_ttl(self) -> None:
+        """Test TTLCache does not store value with not positive ttl."""
+        cache: TTLCache = TTLCache(maxsize=10, ttl=60)
+        cache.set(1, "value", ttl=0)
+        assert len(cache) == 0
@@ -0,0 +1,67 @@
+"""Module for testing 'api' app password hashing pool."""
+import threading
+import time
+from typing import List
+
+import pytest
+from django.contrib.auth.hashers import check_password, make_password
+from faker import Faker
+
+from api.services.hashing import HashingPoolSaturated, PasswordHashingPool
+
+
+class TestPasswordHashingPool:
+    """Class for testing PasswordHashingPool."""
+
+    def test_hashing(self, faker: Faker) -> None:
+        """Test pool hashes and checks passwords."""
+        pool: PasswordHashingPool = PasswordHashingPool(0, 1, 1)
+        password: str = faker.password()
+        encoded: str = pool.make_password(password)
+        assert check_password(password, encoded)
+        assert pool.check_password(password, encoded) is True
+        assert pool.check_password(faker.password(), encoded) is False
+        assert pool.get_stats()["completed"] == 3
+
+    def test_queued_and_saturated(self, faker: Faker) -> None:
+        """Test calls over workers wait in queue and calls over queue fail."""
+        pool: PasswordHashingPool = PasswordHashingPool(1, 1, 5)
+        release: threading.Event = threading.Event()
+        started: List[int] = []
+
+        def hash_slowly(number: int) -> None:
+            """Record hashing start and wait for release."""
+            started.append(number)
+            release.wait(5)
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=pool.run, args=(hash_slowly, number))
+            for number in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        while pool.get_stats()["in_flight"] < 2:
+            time.sleep(0.01)
+        assert len(started) == 1
+        with pytest.raises(HashingPoolSaturated) as error:
+            pool.check_password(faker.password(), make_password("password"))
+        assert error.value.wait == 5
+        assert error.value.status_code == 503
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert sorted(started) == [0, 1]
+        assert pool.get_stats()["rejected"] == 1
+
+    def test_get_stats(self) -> None:
+        """Test get_stats with idle pool."""
+        pool: PasswordHashingPool = PasswordHashingPool(2, 6, 1)
+        assert pool.get_stats() == {
+            "workers": 2,
+            "capacity": 8,
+            "in_flight": 0,
+            "peak_in_flight": 0,
+            "utilisation": 0.0,
+            "completed": 0,
+            "rejected": 0,
+        }
@@ -0,0 +1,107 @@
+"""Module for testing 'api' app request metrics services."""
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Dict
+
+from api.services.metrics import BUCKETS, MetricsRegistry, MmapCounters
+
+
+def observe_requests(directory: str) -> None:
+    """Record request in new process."""
+    MetricsRegistry(directory).observe_request("like", 201, 0.02, 3, 0.01)
+
+
+class TestMmapCounters:
+    """Class for testing MmapCounters."""
+
+    def test_add(self, tmp_path: Path) -> None:
+        """Test counters are written to file and read from it."""
+        path: str = str(tmp_path / "metrics_1.db")
+        counters: MmapCounters = MmapCounters(path)
+        counters.add("a", 1)
+        counters.add("bbbbbbbbb", 2.5)
+        counters.add("a", 1)
+        assert dict(MmapCounters.read(path)) == {"a": 2.0, "bbbbbbbbb": 2.5}
+        counters.close()
+        counters = MmapCounters(path)
+        counters.add("a", 1)
+        assert dict(MmapCounters.read(path))["a"] == 3.0
+
+    def test_add_resize(self, tmp_path: Path) -> None:
+        """Test file grows, when entries do not fit in it."""
+        path: str = str(tmp_path / "metrics_1.db")
+        counters: MmapCounters = MmapCounters(path)
+        keys: Dict[str, float] = {f"key_{index}": float(index) for index in range(3000)}
+        for key, value in keys.items():
+            counters.add(key, value)
+        assert os.path.getsize(path) > MmapCounters.initial_size
+        assert dict(MmapCounters.read(path)) == keys
+
+
+class TestMetricsRegistry:
+    """Class for testing MetricsRegistry."""
+
+    def test_collect_processes(self, tmp_path: Path) -> None:
+        """Test metrics are summed over processes."""
+        registry: MetricsRegistry = MetricsRegistry(str(tmp_path))
+        registry.observe_request("like", 200, 0.02, 2, 0.005)
+        process = multiprocessing.get_context("fork").Process(
+            target=observe_requests, args=(str(tmp_path),)
+        )
+        process.start()
+        process.join()
+        assert len(os.listdir(tmp_path)) == 2
+        samples = registry.collect()
+        assert (
+            samples[("api_requests_total", (("status", "2xx"), ("view", "like")))] == 2
+        )
+        assert samples[("api_db_queries_total", (("view", "like"),))] == 5
+
+    def test_mark_process_dead(self, tmp_path: Path) -> None:
+        """Test counters of exited processes are folded into aggregate file."""
+        registry: MetricsRegistry = MetricsRegistry(str(tmp_path))
+        registry.observe_request("like", 200, 0.02, 2, 0.005)
+        for _ in range(2):
+            process = multiprocessing.get_context("fork").Process(
+                target=observe_requests, args=(str(tmp_path),)
+            )
+            process.start()
+            process.join()
+            registry.mark_process_dead(process.pid)
+        registry.mark_process_dead(process.pid)
+        assert set(os.listdir(tmp_path)) == {
+            MetricsRegistry.aggregate_filename,
+            f"metrics_{os.getpid()}.db",
+        }
+        samples = registry.collect()
+        assert (
+            samples[("api_requests_total", (("status", "2xx"), ("view", "like")))] == 3
+        )
+        assert samples[("api_db_queries_total", (("view", "like"),))] == 8
+
+    def test_render_histogram(self, tmp_path: Path) -> None:
+        """Test latency histogram buckets are cumulative."""
+        registry: MetricsRegistry = MetricsRegistry(str(tmp_path))
+        for seconds in (0.001, 0.3, 100):
+            registry.observe_request("analitics", 500, seconds, 1, 0.0)
+        lines = registry.render().splitlines()
+        buckets = [
+            line.rsplit(" ", 1)[1]
+            for line in lines
+            if line.startswith("api_request_duration_seconds_bucket")
+        ]
+        assert len(buckets) == len(BUCKETS) + 1
+        assert buckets[0] == "1.0"
+        assert buckets[-2:] == ["2.0", "3.0"]
+        assert 'api_requests_total{status="5xx",view="analitics"} 3.0' in lines
+        assert 'api_request_duration_seconds_count{view="analitics"} 3.0' in lines
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """Test clear deletes counters files."""
+        registry: MetricsRegistry = MetricsRegistry(str(tmp_path))
+        registry.observe_request("like", 200, 0.02, 2, 0.005)
+        registry.clear()
+        assert not registry.collect()
+        registry.observe_request("like", 200, 0.02, 2, 0.005)
+        assert len(registry.collect()) == 5
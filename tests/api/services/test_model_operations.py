@@ -1,22 +1,42 @@
 """Module fot testing services model_operations."""
+import threading
+import time
 from datetime import date, datetime, timedelta
-from typing import List, Tuple
+from typing import List, Set, Tuple
 
 import freezegun
 import pytest
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from faker import Faker
+from pytest_mock import MockerFixture
 
-from api.models import Like, Post, User
+from api.models import Like, LikeDailyStat, Post, StatisticCounter, User
 from api.services.model_operations import (
+    apply_like_changes,
+    create_posts,
+    delete_like,
     get_analitic_like_queryset,
+    get_estimated_statistic_numbers,
+    get_like_counters_delta,
+    get_like_daily_stats,
     get_like_instance,
     get_likes_number,
     get_likes_queryset,
     get_post_queryset,
     get_posts_number,
+    get_statistic_numbers,
     get_user_instance_data,
     get_users_number,
+    rebuild_like_daily_stats,
+    rebuild_statistic_counter,
+    reconcile_post_like_counters,
+    update_statistic_counter,
+    upsert_like,
+    upsert_likes,
 )
 from tests.api.factories import LikeFactory, PostFactory, UserFactory
 
@@ -38,6 +58,258 @@ class TestGetLikeInstance:
             assert like.message == post
 
 
+@pytest.mark.django_db
+class TestUpsertLike:
+    """Class for testing model_operations upsert_like function."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_upsert_like_create(self, django_assert_num_queries) -> None:
+        """Test upsert_like creates Like instance and updates statistic."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        rebuild_statistic_counter()
+        with django_assert_num_queries(2):
+            like, created = upsert_like(user.pk, post.pk, True)
+        assert created is True
+        assert Like.objects.get(pk=like.pk).eval is True
+        assert get_like_daily_stats().get()["likes"] == 1
+        assert get_statistic_numbers()["likes"] == 1
+
+    def test_upsert_like_daily_stat_shards(self, mocker: MockerFixture) -> None:
+        """Test upsert_like adds created Like to random daily rollup shard."""
+        user: User = UserFactory()
+        posts: List[Post] = PostFactory.create_batch(size=3)
+        mocker.patch(
+            "api.services.model_operations.get_counter_shard",
+            side_effect=[1, 1, 2, 2, 2, 2],
+        )
+        for post in posts:
+            upsert_like(user.pk, post.pk, True)
+        assert sorted(LikeDailyStat.objects.values_list("shard", "likes")) == [
+            (1, 1),
+            (2, 2),
+        ]
+        assert get_like_daily_stats().get()["likes"] == 3
+
+    def test_upsert_like_switch(self, django_assert_num_queries) -> None:
+        """Test upsert_like switches and restores eval with Post lock and upsert."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        like, _ = upsert_like(user.pk, post.pk, True)
+        for value in (False, True):
+            with django_assert_num_queries(2):
+                result, created = upsert_like(user.pk, post.pk, value)
+            assert created is False
+            assert result.pk == like.pk
+            assert Like.objects.get().eval is value
+            post.refresh_from_db()
+            assert (post.likes_count, post.dislikes_count) == (value, not value)
+        assert get_like_daily_stats().get()["likes"] == 1
+
+    def test_upsert_like_repeated(self) -> None:
+        """Test upsert_like does not change post counters for same eval."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        for _ in range(2):
+            upsert_like(user.pk, post.pk, False)
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+
+    def test_upsert_like_post_does_not_exist(self, faker: Faker) -> None:
+        """Test upsert_like. Post does not exist."""
+        user: User = UserFactory()
+        assert upsert_like(user.pk, faker.random_int(min=1), True) is None
+        assert not Like.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestUpsertLikeConcurrency:
+    """Class for testing upsert_like with concurrent transactions."""
+
+    pytestmark = pytest.mark.django_db(transaction=True)
+
+    def test_concurrent_upsert_like(self) -> None:
+        """Test upsert_like waits for concurrent one and counts its Like."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        rebuild_statistic_counter()
+        liked: threading.Event = threading.Event()
+
+        def like_in_open_transaction() -> None:
+            """Like Post and keep transaction open for a while."""
+            with transaction.atomic():
+                upsert_like(user.pk, post.pk, True)
+                liked.set()
+                time.sleep(0.5)
+            connection.close()
+
+        def dislike() -> None:
+            """Dislike Post, while it is liked by open transaction."""
+            liked.wait()
+            upsert_like(user.pk, post.pk, False)
+            connection.close()
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=target)
+            for target in (like_in_open_transaction, dislike)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+        assert Like.objects.get().eval is False
+        assert get_like_daily_stats().get()["likes"] == 1
+        assert get_statistic_numbers()["likes"] == 1
+
+
+@pytest.mark.django_db
+class TestDeleteLike:
+    """Class for testing model_operations delete_like function."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_delete_like(self, django_assert_num_queries) -> None:
+        """Test delete_like deletes Like and decrements counters."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        upsert_like(user.pk, post.pk, False)
+        rebuild_statistic_counter()
+        with django_assert_num_queries(2):
+            assert delete_like(user.pk, post.pk) is True
+        post.refresh_from_db()
+        assert not Like.objects.exists()
+        assert (post.likes_count, post.dislikes_count) == (0, 0)
+        assert get_like_daily_stats().get()["likes"] == 0
+        assert get_statistic_numbers()["likes"] == 0
+
+    def test_delete_like_does_not_exist(self) -> None:
+        """Test delete_like. Like does not exist."""
+        post: Post = PostFactory()
+        rebuild_statistic_counter()
+        assert delete_like(post.user_id, post.pk) is False
+        assert get_statistic_numbers()["likes"] == 0
+
+
+@pytest.mark.django_db
+class TestUpsertLikes:
+    """Class for testing model_operations upsert_likes function."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_upsert_likes(self, faker: Faker) -> None:
+        """Test upsert_likes creates and updates Like instances."""
+        user: User = UserFactory()
+        posts: List[Post] = PostFactory.create_batch(size=3)
+        LikeFactory(user=user, message=posts[0], eval=True)
+        rebuild_statistic_counter()
+        likes = {post.pk: False for post in posts}
+        likes[faker.random_int(min=posts[-1].pk + 1, max=posts[-1].pk + 1000)] = True
+        result = upsert_likes(user.pk, likes)
+        assert result == {posts[0].pk: False, posts[1].pk: True, posts[2].pk: True}
+        assert Like.objects.filter(user=user, eval=False).count() == 3
+        assert get_like_daily_stats().get()["likes"] == 3
+        assert get_statistic_numbers()["likes"] == 3
+
+    def test_upsert_likes_locks_posts(self) -> None:
+        """Test upsert_likes locks posts before previous Likes are read."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        with CaptureQueriesContext(connection) as context:
+            upsert_likes(user.pk, {post.pk: True})
+        queries: List[str] = [query["sql"] for query in context.captured_queries]
+        lock_index: int = next(
+            index for index, sql in enumerate(queries) if "FOR NO KEY UPDATE" in sql
+        )
+        assert all(
+            Like._meta.db_table not in sql.split("FROM")[-1]
+            for sql in queries[:lock_index]
+        )
+
+    def test_upsert_likes_rollup_by_created_at(self, freezer: freezegun) -> None:
+        """Test upsert_likes counts created Likes by their created_at dates."""
+        user: User = UserFactory()
+        posts: List[Post] = PostFactory.create_batch(size=2)
+        freezer.move_to("2023-05-10 23:59:59")
+        upsert_likes(user.pk, {posts[0].pk: True})
+        freezer.move_to("2023-05-11 00:00:01")
+        upsert_likes(user.pk, {posts[0].pk: False, posts[1].pk: True})
+        rollup: List[Tuple] = list(get_like_daily_stats().values_list("date", "likes"))
+        assert rollup == [(date(2023, 5, 10), 1), (date(2023, 5, 11), 1)]
+        assert [
+            like.created_at.date() for like in Like.objects.order_by("message_id")
+        ] == [date(2023, 5, 10), date(2023, 5, 11)]
+
+    def test_upsert_likes_posts_do_not_exist(self, faker: Faker) -> None:
+        """Test upsert_likes. Posts do not exist."""
+        user: User = UserFactory()
+        assert upsert_likes(user.pk, {faker.random_int(min=1): True}) == {}
+        assert not Like.objects.exists()
+
+
+@pytest.mark.django_db
+class TestUpdatePostLikeCounters:
+    """Class for testing model_operations post like counters functions."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_get_like_counters_delta(self) -> None:
+        """Test get_like_counters_delta for all eval changes."""
+        assert get_like_counters_delta(None, True) == (1, 0)
+        assert get_like_counters_delta(True, False) == (-1, 1)
+        assert get_like_counters_delta(False, None) == (0, -1)
+        assert get_like_counters_delta(True, True) == (0, 0)
+
+    def test_apply_like_changes(self, django_assert_num_queries) -> None:
+        """Test apply_like_changes updates posts and statistic with one query."""
+        posts: List[Post] = PostFactory.create_batch(size=3)
+        rebuild_statistic_counter()
+        now: datetime = timezone.now()
+        with django_assert_num_queries(1):
+            apply_like_changes(
+                [
+                    (posts[0].pk, now, 2, 1, 3),
+                    (posts[1].pk, now - timedelta(days=1), -1, 3, 2),
+                    (posts[2].pk, now, 0, 0, 0),
+                    (posts[0].pk, now, 1, 0, 1),
+                ]
+            )
+        counters: List[Tuple] = [
+            (post.likes_count, post.dislikes_count)
+            for post in Post.objects.order_by("id")
+        ]
+        assert counters == [(3, 1), (-1, 3), (0, 0)]
+        rollup: List[Tuple] = list(get_like_daily_stats().values_list("date", "likes"))
+        assert rollup == [
+            (timezone.localdate(now) - timedelta(days=1), 2),
+            (timezone.localdate(now), 4),
+        ]
+        assert get_statistic_numbers()["likes"] == 6
+
+    def test_apply_like_changes_empty(self, django_assert_num_queries) -> None:
+        """Test apply_like_changes with empty changes."""
+        with django_assert_num_queries(0):
+            apply_like_changes([])
+
+    def test_reconcile_post_like_counters(self, faker: Faker) -> None:
+        """Test reconcile_post_like_counters fixes drifted posts by chunks."""
+        posts: List[Post] = PostFactory.create_batch(size=5)
+        for post in posts[:3]:
+            LikeFactory(message=post, eval=True)
+            LikeFactory(message=post, eval=False)
+        Post.objects.filter(pk__in=[posts[0].pk, posts[4].pk]).update(
+            likes_count=faker.random_int(min=5), dislikes_count=0
+        )
+        assert reconcile_post_like_counters(chunk_size=2) == 2
+        counters: List[Tuple] = [
+            (post.likes_count, post.dislikes_count)
+            for post in Post.objects.order_by("id")
+        ]
+        assert counters == [(1, 1)] * 3 + [(0, 0)] * 2
+
+
 @pytest.mark.django_db
 class TestGetAnaliticLikeQuerySet:
     """Class for testing model_operations get_analitic_like_queryset."""
@@ -71,6 +343,44 @@ class TestGetAnaliticLikeQuerySet:
             assert item.get("date") == dates[number - i - 1]
             assert item.get("likes") == numbers[number - i - 1]
 
+    def test_get_analitic_like_queryset_skips_empty_days(self) -> None:
+        """Test get_analitic_like_queryset. Days without likes are skipped."""
+        like: Like = LikeFactory()
+        like.delete()
+        result: List = get_analitic_like_queryset(
+            (datetime.today() - timedelta(days=1), datetime.today() + timedelta(days=1))
+        )
+        assert result == []
+
+
+@pytest.mark.django_db
+class TestRebuildLikeDailyStats:
+    """Class for testing model_operations rebuild_like_daily_stats."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_rebuild_like_daily_stats(self, faker: Faker) -> None:
+        """Test rebuild_like_daily_stats fixes drifted rows."""
+        number: int = faker.random_int(min=3, max=10)
+        LikeFactory.create_batch(size=number)
+        LikeDailyStat.objects.update(likes=0)
+        LikeDailyStat.objects.create(date=date(2000, 1, 1), likes=5)
+        result: int = rebuild_like_daily_stats()
+        assert result == 1
+        assert get_like_daily_stats().get()["likes"] == number
+
+    def test_rebuild_like_daily_stats_locks_table(self) -> None:
+        """Test rebuild_like_daily_stats locks rollup table till commit."""
+        rebuild_like_daily_stats()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT mode FROM pg_locks WHERE pid = pg_backend_pid() "
+                "AND relation = %s::regclass",
+                [LikeDailyStat._meta.db_table],
+            )
+            modes: Set[str] = {row[0] for row in cursor.fetchall()}
+        assert "ExclusiveLock" in modes
+
 
 @pytest.mark.django_db
 class TestGetUserInstanceData:
@@ -102,6 +412,28 @@ class TestGetPostQueryset:
             assert post == result[i]
 
 
+@pytest.mark.django_db
+class TestCreatePosts:
+    """Class for testing model_operations create_posts."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_create_posts(self, faker: Faker, django_assert_num_queries) -> None:
+        """Test create_posts creates posts with one INSERT."""
+        user: User = UserFactory()
+        rebuild_statistic_counter()
+        messages: List[str] = [faker.pystr(min_chars=1) for _ in range(5)]
+        with django_assert_num_queries(4):
+            result: List[int] = create_posts(
+                user, [{"message": message} for message in messages]
+            )
+        posts: List[Post] = list(Post.objects.order_by("id"))
+        assert result == [post.pk for post in posts]
+        assert [post.message for post in posts] == messages
+        assert all(post.user == user for post in posts)
+        assert get_statistic_numbers()["posts"] == 5
+
+
 @pytest.mark.django_db
 class TestGetUserNumber:
     """Class for testing model_operations get_users_number."""
@@ -159,3 +491,94 @@ class TestGetLikesQueryset:
         result: QuerySet = get_likes_queryset()
         for i, post in enumerate(likes):
             assert post == result[i]
+
+
+@pytest.mark.django_db
+class TestGetStatisticNumbers:
+    """Class for testing model_operations get_statistic_numbers."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_get_statistic_numbers_initializes_counter(self, faker: Faker) -> None:
+        """Test get_statistic_numbers. Counter shards are absent."""
+        size: int = faker.random_int(min=3, max=5)
+        LikeFactory.create_batch(size=size)
+        StatisticCounter.objects.all().delete()
+        result = get_statistic_numbers()
+        assert result == {"users": 2 * size, "posts": size, "likes": size}
+        assert get_statistic_numbers()["likes"] == size
+
+    def test_get_statistic_numbers_one_query(self, django_assert_num_queries) -> None:
+        """Test get_statistic_numbers sums initialized shards with one query."""
+        rebuild_statistic_counter()
+        LikeFactory()
+        with django_assert_num_queries(1):
+            result = get_statistic_numbers()
+        assert result == {"users": 2, "posts": 1, "likes": 1}
+
+
+@pytest.mark.django_db
+class TestUpdateStatisticCounter:
+    """Class for testing model_operations update_statistic_counter."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_update_statistic_counter(self) -> None:
+        """Test update_statistic_counter adds deltas."""
+        rebuild_statistic_counter()
+        update_statistic_counter(users=2, likes=-1)
+        assert get_statistic_numbers() == {"users": 2, "posts": 0, "likes": -1}
+        assert StatisticCounter.objects.count() == settings.STATISTIC_COUNTER_SHARDS
+
+    def test_update_statistic_counter_not_initialized(self) -> None:
+        """Test update_statistic_counter does not create counter shards."""
+        update_statistic_counter(users=2)
+        assert not StatisticCounter.objects.exists()
+
+
+class TestRebuildStatisticCounterConcurrency:
+    """Class for testing rebuild_statistic_counter with concurrent writes."""
+
+    pytestmark = pytest.mark.django_db(transaction=True)
+
+    def test_rebuild_with_post_in_flight(self, mocker: MockerFixture) -> None:
+        """Test Post saved, but not counted yet, is counted once after rebuild."""
+        user: User = UserFactory()
+        rebuild_statistic_counter()
+        saved: threading.Event = threading.Event()
+        rebuilt: threading.Event = threading.Event()
+
+        def update_after_rebuild(**deltas: int) -> None:
+            """Add Post delta only after counter is rebuilt."""
+            saved.set()
+            rebuilt.wait(5)
+            update_statistic_counter(**deltas)
+
+        def create_post() -> None:
+            """Create Post, adding its delta after rebuild."""
+            Post.objects.create(user=user, message="message")
+            connection.close()
+
+        mocker.patch(
+            "api.signals.update_statistic_counter", side_effect=update_after_rebuild
+        )
+        thread: threading.Thread = threading.Thread(target=create_post)
+        thread.start()
+        saved.wait(5)
+        rebuild_statistic_counter()
+        rebuilt.set()
+        thread.join()
+        assert get_statistic_numbers()["posts"] == 1
+
+
+@pytest.mark.django_db
+class TestGetEstimatedStatisticNumbers:
+    """Class for testing model_operations get_estimated_statistic_numbers."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_get_estimated_statistic_numbers(self) -> None:
+        """Test get_estimated_statistic_numbers returns all numbers."""
+        result = get_estimated_statistic_numbers()
+        assert set(result) == {"users", "posts", "likes"}
+        assert all(number >= 0 for number in result.values())
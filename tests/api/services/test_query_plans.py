@@ -0,0 +1,240 @@
+"""Module for testing 'api' app model_operations query plans."""
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.models import Like, Post, User
+from api.services.model_operations import (
+    apply_like_changes,
+    delete_like,
+    get_analitic_like_queryset,
+    get_like_instance,
+    get_likes_queryset,
+    get_post_queryset,
+    get_statistic_numbers,
+    get_user_instance_data,
+    rebuild_statistic_counter,
+    reconcile_post_like_counters,
+    upsert_like,
+    upsert_likes,
+)
+
+USERS_NUMBER: int = 200
+POSTS_NUMBER: int = 1000
+LIKES_PER_USER: int = 20
+LARGE_TABLES: Set[str] = {
+    User._meta.db_table,
+    Post._meta.db_table,
+    Like._meta.db_table,
+}
+
+
+@pytest.fixture
+def seeded_data() -> Dict[str, int]:
+    """Seed users, posts and likes with bulk inserts and refresh statistics."""
+    users: List[User] = User.objects.bulk_create(
+        [User(username=f"plan_user_{number}") for number in range(USERS_NUMBER)]
+    )
+    posts: List[Post] = Post.objects.bulk_create(
+        [
+            Post(user=users[number % USERS_NUMBER], message="message")
+            for number in range(POSTS_NUMBER)
+        ]
+    )
+    Like.objects.bulk_create(
+        [
+            Like(
+                user=user,
+                message=posts[(index * LIKES_PER_USER + number) % POSTS_NUMBER],
+                eval=bool(number % 2),
+            )
+            for index, user in enumerate(users)
+            for number in range(LIKES_PER_USER)
+        ]
+    )
+    rebuild_statistic_counter()
+    with connection.cursor() as cursor:
+        for table in LARGE_TABLES:
+            cursor.execute(f"ANALYZE {table}")
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return {
+        "user": users[-1].pk,
+        "post": posts[-1].pk,
+        "liker": users[0].pk,
+        "liked_post": posts[0].pk,
+    }
+
+
+def is_blocking(node: Dict) -> bool:
+    """Check whether plan node reads all rows of its children before output."""
+    if node["Node Type"] == "Aggregate":
+        return node.get("Strategy") != "Sorted"
+    return node["Node Type"] in ("Sort", "Incremental Sort", "Hash", "Materialize")
+
+
+def iter_plan_nodes(node: Dict, limited: bool = False) -> Iterator[Tuple[Dict, bool]]:
+    """
+    Iterate over EXPLAIN (FORMAT JSON) plan node and its children.
+
+    Every node is yielded with flag, whether it is read under Limit
+    without blocking nodes between, so it is stopped with Limit.
+    """
+    yield node, limited
+    limited = (limited or node["Node Type"] == "Limit") and not is_blocking(node)
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child, limited)
+
+
+def get_condition_columns(condition: str) -> Set[str]:
+    """Get names of columns compared by index condition."""
+    return set(re.findall(r'"?(\w+)"?\s*(?:=|<>|<=|>=|<|>)', condition))
+
+
+def get_index_leading_column(index: str) -> str:
+    """Get first column name of index."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT a.attname FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0] "
+            "WHERE c.relname = %s",
+            [index],
+        )
+        return cursor.fetchone()[0]
+
+
+def is_full_scan(node: Dict, limited: bool = False) -> bool:
+    """
+    Check whether plan node reads the whole large table or its index.
+
+    Index scan without condition or with condition not on index leading
+    column walks the whole index, so it is not better than sequential
+    scan, unless it is stopped by Limit.
+    """
+    if node.get("Relation Name") not in LARGE_TABLES:
+        return False
+    if node["Node Type"] == "Seq Scan":
+        return True
+    if node["Node Type"] not in ("Index Scan", "Index Only Scan"):
+        return False
+    condition: Optional[str] = node.get("Index Cond")
+    if condition is None:
+        return not limited
+    return get_index_leading_column(node["Index Name"]) not in get_condition_columns(
+        condition
+    )
+
+
+def get_full_scanned_tables(sql: str) -> Set[str]:
+    """Get large tables fully read by query plan."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+        plan: Dict = cursor.fetchone()[0][0]["Plan"]
+    return {
+        node["Relation Name"]
+        for node, limited in iter_plan_nodes(plan)
+        if is_full_scan(node, limited)
+    }
+
+
+def get_like_instance_call(data: Dict[str, int]) -> None:
+    """Evaluate get_like_instance queryset."""
+    list(get_like_instance(User(pk=data["liker"]), data["liked_post"]))
+
+
+def get_analitic_like_queryset_call(data: Dict[str, int]) -> None:
+    """Call get_analitic_like_queryset for last week."""
+    now: datetime = timezone.now()
+    get_analitic_like_queryset((now - timedelta(days=7), now))
+
+
+HOT_QUERIES: Dict[str, Callable[[Dict[str, int]], None]] = {
+    "get_like_instance": get_like_instance_call,
+    "upsert_like": lambda data: upsert_like(data["user"], data["post"], True),
+    "upsert_likes": lambda data: upsert_likes(
+        data["user"], {data["post"]: True, data["liked_post"]: False}
+    ),
+    "delete_like": lambda data: delete_like(data["liker"], data["liked_post"]),
+    "apply_like_changes": lambda data: apply_like_changes(
+        [(data["post"], timezone.now(), 1, 0, 1)]
+    ),
+    "reconcile_post_like_counters": lambda data: reconcile_post_like_counters(100),
+    "get_analitic_like_queryset": get_analitic_like_queryset_call,
+    "get_user_instance_data": lambda data: get_user_instance_data(data["user"]),
+    "get_statistic_numbers": lambda data: get_statistic_numbers(),
+    "last_posts": lambda data: list(get_post_queryset().order_by("-id")[:10]),
+    "last_likes": lambda data: list(get_likes_queryset().order_by("-id")[:10]),
+}
+
+
+@pytest.mark.django_db
+class TestQueryPlans:
+    """
+    Class for testing hot model_operations queries do not scan large tables.
+
+    Sequential scans are disabled for the planner, so a Seq Scan node
+    or a whole index walk in plan means that no index can serve the query.
+    Counting and rebuild functions read whole tables by design and
+    are not checked.
+    """
+
+    pytestmark = pytest.mark.django_db
+
+    @pytest.mark.parametrize("name", list(HOT_QUERIES))
+    def test_query_plan(self, name: str, seeded_data: Dict[str, int]) -> None:
+        """Test every query of model_operations function uses indexes."""
+        with CaptureQueriesContext(connection) as context:
+            HOT_QUERIES[name](seeded_data)
+        queries: List[str] = [
+            query["sql"]
+            for query in context.captured_queries
+            if not query["sql"].startswith(("SAVEPOINT", "RELEASE", "ROLLBACK", "LOCK"))
+        ]
+        assert queries
+        for sql in queries:
+            assert not get_full_scanned_tables(sql), sql
+
+
+class TestPlanHelpers:
+    """Class for testing query plan checking helpers."""
+
+    def test_get_condition_columns(self) -> None:
+        """Test get_condition_columns does not match column name parts."""
+        condition: str = (
+            "((api_like.user_id = 1) AND (message_id = ANY ('{1,2}'::bigint[])))"
+        )
+        assert get_condition_columns(condition) == {"user_id", "message_id"}
+        assert "id" not in get_condition_columns(condition)
+
+    def test_is_full_scan_without_condition(self) -> None:
+        """Test index scan without condition is full one, unless limited."""
+        node: Dict = {
+            "Node Type": "Index Only Scan",
+            "Relation Name": Like._meta.db_table,
+            "Index Name": "api_like_pkey",
+        }
+        assert is_full_scan(node) is True
+        assert is_full_scan(node, limited=True) is False
+
+    def test_iter_plan_nodes_limited(self) -> None:
+        """Test nodes under Limit are not limited below blocking node."""
+        scan: Dict = {"Node Type": "Index Scan"}
+        plan: Dict = {
+            "Node Type": "Limit",
+            "Plans": [
+                {"Node Type": "Aggregate", "Strategy": "Sorted", "Plans": [scan]},
+                {"Node Type": "Sort", "Plans": [scan]},
+            ],
+        }
+        assert [limited for node, limited in iter_plan_nodes(plan)] == [
+            False,
+            True,
+            True,
+            True,
+            False,
+        ]
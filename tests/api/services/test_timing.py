@@ -0,0 +1,45 @@
+"""Module for testing 'api' app request timing services."""
+from api.services.timing import RequestTimings, current_timings, measure
+
+
+class TestRequestTimings:
+    """Class for testing RequestTimings."""
+
+    def test_measure_nested(self) -> None:
+        """Test nested measurement of the same stage is counted once."""
+        timings: RequestTimings = RequestTimings()
+        with timings.measure("serializer"):
+            with timings.measure("serializer"):
+                pass
+        assert list(timings.durations) == ["serializer"]
+        timings.durations["serializer"] = 0.0015
+        timings.finish()
+        assert "serializer;dur=1.5" in timings.get_server_timing()
+
+    def test_measure_current_request(self) -> None:
+        """Test measure adds duration only to current request timings."""
+        timings: RequestTimings = RequestTimings()
+        with measure("serializer"):
+            pass
+        token = current_timings.set(timings)
+        try:
+            with measure("serializer"):
+                pass
+        finally:
+            current_timings.reset(token)
+        assert "serializer" in timings.durations
+
+    def test_get_server_timing(self) -> None:
+        """Test Server-Timing header value has all stages and queries number."""
+        timings: RequestTimings = RequestTimings()
+        timings.db_queries = 2
+        timings.finish()
+        value: str = timings.get_server_timing()
+        assert [metric.split(";")[0] for metric in value.split(", ")] == [
+            "total",
+            "view",
+            "db",
+            "serializer",
+            "render",
+        ]
+        assert 'desc="2 queries"' in value
@@ -1,12 +1,22 @@
 """Module for testing 'api' app services utils."""
+import json
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from django.test import RequestFactory
 from django.utils.timezone import make_aware
 from faker import Faker
 from pytz import utc
 
-from api.services.utils import get_like, process_date_input
+from api.services.utils import (
+    get_like,
+    get_positive_int,
+    get_request_data,
+    is_flag_set,
+    process_date_input,
+    stream_json_array,
+    to_positive_int,
+)
 
 
 class TestGetLike:
@@ -28,6 +38,21 @@ class TestGetLike:
         assert result is False
 
 
+class TestIsFlagSet:
+    """Class for testing utils is_flag_set function."""
+
+    def test_is_flag_set_true(self) -> None:
+        """Test is_flag_set function true-like values."""
+        for value in ("1", "true", "True", "yes"):
+            assert is_flag_set({"flag": value}, "flag") is True
+
+    def test_is_flag_set_false(self, faker: Faker) -> None:
+        """Test is_flag_set function other values."""
+        assert is_flag_set({}, "flag") is False
+        assert is_flag_set({"flag": "0"}, "flag") is False
+        assert is_flag_set({"flag": faker.pystr(min_chars=5)}, "flag") is False
+
+
 class TestProcessDateInput:
     """Class for testing utils process_date_input."""
 
@@ -57,3 +82,76 @@ class TestProcessDateInput:
         }
         result: Optional[Tuple[datetime, datetime]] = process_date_input(query_params)
         assert result is None
+
+
+class TestToPositiveInt:
+    """Class for testing utils to_positive_int."""
+
+    def test_to_positive_int(self, faker: Faker) -> None:
+        """Test utils to_positive_int."""
+        number: int = faker.random_int(min=1)
+        assert to_positive_int(str(number)) == number
+        assert to_positive_int(number) == number
+
+    def test_to_positive_int_none(self, faker: Faker) -> None:
+        """Test utils to_positive_int invalid values."""
+        for value in (None, "0", -3, faker.pystr(min_chars=1)):
+            assert to_positive_int(value) is None
+
+
+class TestGetPositiveInt:
+    """Class for testing utils get_positive_int."""
+
+    def test_get_positive_int(self, faker: Faker) -> None:
+        """Test utils get_positive_int."""
+        number: int = faker.random_int(min=1)
+        assert get_positive_int({"number": str(number)}, "number", 5) == number
+
+    def test_get_positive_int_default(self, faker: Faker) -> None:
+        """Test utils get_positive_int invalid values."""
+        for value in (None, "0", "-3", faker.pystr(min_chars=1)):
+            assert get_positive_int({"number": value}, "number", 5) == 5
+
+
+class TestStreamJsonArray:
+    """Class for testing utils stream_json_array."""
+
+    def test_stream_json_array(self, faker: Faker) -> None:
+        """Test utils stream_json_array yields valid JSON by chunks."""
+        items: List[Dict] = [
+            {"id": i, "created_at": faker.date_time()}
+            for i in range(faker.random_int(min=5, max=10))
+        ]
+        chunks: List[bytes] = list(stream_json_array(items, chunk_size=2))
+        result = json.loads(b"".join(chunks))
+        assert len(chunks) == (len(items) + 1) // 2 + 1
+        assert [item.get("id") for item in result] == [item["id"] for item in items]
+
+    def test_stream_json_array_empty(self) -> None:
+        """Test utils stream_json_array empty input."""
+        assert b"".join(stream_json_array([], chunk_size=2)) == b"[]"
+
+
+class TestGetRequestData:
+    """Class for testing utils get_request_data function."""
+
+    def test_get_request_data_json(self, faker: Faker) -> None:
+        """Test get_request_data with JSON body."""
+        data: Dict = {"message": faker.word()}
+        request = RequestFactory().delete(
+            "/", data=json.dumps(data), content_type="application/json"
+        )
+        assert get_request_data(request) == data
+
+    def test_get_request_data_form(self, faker: Faker) -> None:
+        """Test get_request_data with form encoded POST body."""
+        data: Dict = {"message": faker.word()}
+        assert get_request_data(RequestFactory().post("/", data=data)) == data
+
+    def test_get_request_data_invalid_json(self) -> None:
+        """Test get_request_data with invalid or not object JSON body."""
+        for body in ("{", "[1, 2]"):
+            request = RequestFactory().post(
+                "/", data=body, content_type="application/json"
+            )
+            assert get_request_data(request) == {}
@@ -0,0 +1,176 @@
+"""Module for testing 'api' app async views."""
+import json
+from datetime import date, timedelta
+from typing import Dict, Tuple
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from faker import Faker
+
+from api.models import Like, LikeDailyStat, Post, User
+from tests.api.factories import LikeFactory, PostFactory
+
+
+@pytest.mark.django_db
+class TestAsyncPostCreateView:
+    """Class for testing AsyncPostCreateView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_async_post_create_view(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncPostCreateView."""
+        user, headers = get_authorized_admin_user_data
+        message: str = faker.text(max_nb_chars=100)
+        url: str = reverse("async_create_post")
+        response = client.post(url, headers=headers, data={"message": message})
+        result: Dict = response.json()
+        assert response.status_code == 201
+        assert result.get("message") == message
+        assert result.get("user") == user.pk
+        assert Post.objects.get().message == message
+
+    def test_async_post_create_view_invalid_input(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncPostCreateView. Message is missing."""
+        _, headers = get_authorized_admin_user_data
+        response = client.post(reverse("async_create_post"), headers=headers)
+        assert response.status_code == 400
+        assert "message" in response.json()
+
+    def test_async_post_create_view_unauthorized(self, client: Client) -> None:
+        """Test AsyncPostCreateView. Unauthorized."""
+        response = client.post(reverse("async_create_post"), data={"message": "a"})
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db
+class TestAsyncLikeView:
+    """Class for testing AsyncLikeView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_async_like_view_post_method(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncLikeView post method creates and switches Like."""
+        user, headers = get_authorized_admin_user_data
+        url: str = reverse("async_like")
+        post: Post = PostFactory()
+        for value in ("like", "dislike"):
+            response = client.post(
+                url, headers=headers, data={"message_id": post.pk, "eval": value}
+            )
+        result: Dict = response.json()
+        assert response.status_code == 200
+        assert result.get("eval") is False
+        assert result.get("user") == user.pk
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+
+    def test_async_like_view_post_method_invalid_input(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncLikeView post method. Invalid eval and missing post."""
+        _, headers = get_authorized_admin_user_data
+        url: str = reverse("async_like")
+        post: Post = PostFactory()
+        response = client.post(
+            url, headers=headers, data={"message_id": post.pk, "eval": "likee"}
+        )
+        assert response.status_code == 406
+        response = client.post(
+            url,
+            headers=headers,
+            data={"message_id": post.pk + faker.random_int(min=1), "eval": "like"},
+        )
+        assert response.status_code == 400
+
+    def test_async_like_view_delete_method(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncLikeView delete method."""
+        user, headers = get_authorized_admin_user_data
+        headers.update({"content-type": "application/json"})
+        url: str = reverse("async_like")
+        post: Post = PostFactory()
+        LikeFactory(message=post, user=user, eval=True)
+        data: str = json.dumps({"message_id": post.pk})
+        response = client.delete(url, headers=headers, data=data)
+        assert response.status_code == 200
+        assert response.json().get("result") == "Like was successfully deleted."
+        assert not Like.objects.exists()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 0)
+        response = client.delete(url, headers=headers, data=data)
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestAsyncAnaliticView:
+    """Class for testing AsyncAnaliticView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_async_analitic_view(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncAnaliticView."""
+        _, headers = get_authorized_admin_user_data
+        day: date = date(2023, 8, 1)
+        LikeDailyStat.objects.bulk_create(
+            [
+                LikeDailyStat(date=day, likes=3),
+                LikeDailyStat(date=day + timedelta(days=1), likes=5),
+            ]
+        )
+        response = client.get(
+            reverse("async_analitics"),
+            headers=headers,
+            data={"date_from": "2023-08-01", "date_to": "2023-08-02"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"analitics": [{"date": "2023-08-01", "likes": 3}]}
+
+    def test_async_analitic_view_invalid_input(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncAnaliticView. Invalid input."""
+        _, headers = get_authorized_admin_user_data
+        response = client.get(
+            reverse("async_analitics"),
+            headers=headers,
+            data={"date_from": "134443", "date_to": "13334"},
+        )
+        assert response.status_code == 406
+        assert response.json().get("result") == "Invalid input format."
+
+    def test_async_analitic_view_invalid_token(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test AsyncAnaliticView. Invalid token."""
+        _, headers = get_authorized_admin_user_data
+        headers["Authorization"] += "1"
+        response = client.get(reverse("async_analitics"), headers=headers)
+        assert response.status_code == 401
@@ -0,0 +1,103 @@
+"""Module for testing 'api' app authentication classes."""
+from datetime import timedelta
+from typing import Dict, List, Tuple
+
+import freezegun
+import pytest
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+from pytest_mock import MockerFixture
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken, Token
+
+from api.authentication import CachedJWTAuthentication, token_cache, user_cache
+from api.models import User
+from tests.api.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Class for testing CachedJWTAuthentication."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_get_user_cached(self, django_assert_num_queries) -> None:
+        """Test get_user loads user once and then serves it from cache."""
+        user: User = UserFactory(is_active=True, is_staff=True)
+        token: AccessToken = AccessToken.for_user(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        with django_assert_num_queries(1):
+            authentication.get_user(token)
+        with django_assert_num_queries(0):
+            result: User = authentication.get_user(token)
+        assert result.pk == user.pk
+        assert result.is_staff is True
+        assert result.is_active is True
+
+    def test_get_user_deferred_fields(self) -> None:
+        """Test get_user loads not cached fields on access."""
+        user: User = UserFactory(is_active=True)
+        result: User = CachedJWTAuthentication().get_user(AccessToken.for_user(user))
+        assert result.username == user.username
+
+    def test_get_user_invalidated_on_save(self) -> None:
+        """Test User saving drops cached state."""
+        user: User = UserFactory(is_active=True)
+        token: AccessToken = AccessToken.for_user(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        authentication.get_user(token)
+        user.is_active = False
+        user.save()
+        assert user_cache.get(user.pk) is None
+        with pytest.raises(AuthenticationFailed):
+            authentication.get_user(token)
+
+    def test_get_user_invalidated_on_delete(self) -> None:
+        """Test User deletion drops cached state."""
+        user: User = UserFactory(is_active=True)
+        token: AccessToken = AccessToken.for_user(user)
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        authentication.get_user(token)
+        user.delete()
+        with pytest.raises(AuthenticationFailed):
+            authentication.get_user(token)
+
+    def test_get_validated_token_cached(self, mocker: MockerFixture) -> None:
+        """Test get_validated_token verifies repeated raw token once."""
+        raw_token: bytes = str(AccessToken.for_user(UserFactory())).encode()
+        spy = mocker.spy(JWTAuthentication, "get_validated_token")
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        tokens: List[Token] = [
+            authentication.get_validated_token(raw_token) for _ in range(3)
+        ]
+        assert spy.call_count == 1
+        assert tokens[0] is tokens[2]
+        assert token_cache.get_stats()["hits"] == 2
+
+    def test_get_validated_token_expired(self, freezer: freezegun) -> None:
+        """Test get_validated_token does not serve expired token from cache."""
+        raw_token: bytes = str(AccessToken.for_user(UserFactory())).encode()
+        authentication: CachedJWTAuthentication = CachedJWTAuthentication()
+        authentication.get_validated_token(raw_token)
+        freezer.tick(
+            settings.SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"] + timedelta(seconds=1)
+        )
+        with pytest.raises(InvalidToken):
+            authentication.get_validated_token(raw_token)
+
+    def test_authenticated_request_no_queries(
+        self,
+        client: Client,
+        django_assert_num_queries,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test steady state authenticated request makes no auth queries."""
+        user, headers = get_authorized_admin_user_data
+        url: str = reverse("activity", kwargs={"pk": user.pk})
+        client.get(url, headers=headers)
+        with django_assert_num_queries(1):
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
@@ -0,0 +1,80 @@
+"""Module for testing 'api' app authentication backends."""
+import pytest
+from django.contrib.admin.forms import AdminAuthenticationForm
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.test import RequestFactory
+from faker import Faker
+from pytest_mock import MockerFixture
+from rest_framework.request import Request
+
+from api.backends import PooledModelBackend
+from api.models import User
+from api.services.hashing import HashingPoolSaturated, password_hashing_pool
+from tests.api.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestPooledModelBackend:
+    """Class for testing PooledModelBackend."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_authenticate(self, faker: Faker) -> None:
+        """Test authenticate with valid and invalid password."""
+        password: str = faker.password()
+        user: User = UserFactory(is_active=True)
+        user.set_password(password)
+        user.save()
+        backend: PooledModelBackend = PooledModelBackend()
+        assert backend.authenticate(None, user.username, password) == user
+        assert backend.authenticate(None, user.username, faker.password()) is None
+
+    def test_authenticate_inactive(self, faker: Faker) -> None:
+        """Test authenticate with inactive user."""
+        password: str = faker.password()
+        user: User = UserFactory(is_active=False)
+        user.set_password(password)
+        user.save()
+        assert PooledModelBackend().authenticate(None, user.username, password) is None
+
+    def test_authenticate_unknown_user(
+        self, faker: Faker, mocker: MockerFixture
+    ) -> None:
+        """Test authenticate hashes password for unknown user."""
+        spy = mocker.spy(password_hashing_pool, "make_password")
+        result = PooledModelBackend().authenticate(
+            None, faker.user_name(), faker.password()
+        )
+        assert result is None
+        assert spy.call_count == 1
+
+    def test_authenticate_upgrades_hash(self, faker: Faker) -> None:
+        """Test authenticate rehashes password hashed with outdated iterations."""
+        password: str = faker.password()
+        hasher: PBKDF2PasswordHasher = PBKDF2PasswordHasher()
+        user: User = UserFactory(is_active=True)
+        user.password = hasher.encode(password, hasher.salt(), iterations=1000)
+        user.save()
+        assert PooledModelBackend().authenticate(None, user.username, password) == user
+        user.refresh_from_db()
+        assert not hasher.must_update(user.password)
+
+    def test_authenticate_hashing_pool_saturated(
+        self, faker: Faker, mocker: MockerFixture
+    ) -> None:
+        """Test saturated hashing pool fails admin login without server error."""
+        user: User = UserFactory(is_active=True)
+        mocker.patch.object(
+            password_hashing_pool,
+            "check_password",
+            side_effect=HashingPoolSaturated(wait=1),
+        )
+        form: AdminAuthenticationForm = AdminAuthenticationForm(
+            RequestFactory().post("/admin/login/"),
+            data={"username": user.username, "password": faker.password()},
+        )
+        assert form.is_valid() is False
+        with pytest.raises(HashingPoolSaturated):
+            PooledModelBackend().authenticate(
+                Request(RequestFactory().post("/")), user.username, faker.password()
+            )
@@ -0,0 +1,146 @@
+"""Module for testing 'api' app management commands."""
+from datetime import timedelta
+from typing import List
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from faker import Faker
+
+from api.models import (
+    BlacklistedToken,
+    Like,
+    LikeDailyStat,
+    Post,
+    StatisticCounter,
+)
+from api.services.model_operations import get_like_daily_stats, get_statistic_numbers
+from tests.api.factories import LikeFactory
+
+
+@pytest.mark.django_db
+class TestRebuildLikeDailyStatsCommand:
+    """Class for testing rebuild_like_daily_stats command."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_rebuild_like_daily_stats(self, faker: Faker, capsys) -> None:
+        """Test rebuild_like_daily_stats command."""
+        number: int = faker.random_int(min=3, max=10)
+        LikeFactory.create_batch(size=number)
+        LikeDailyStat.objects.all().delete()
+        call_command("rebuild_like_daily_stats")
+        assert get_like_daily_stats().get()["likes"] == number
+        assert "rebuilt for 1 days" in capsys.readouterr().out
+
+    def test_rebuild_like_daily_stats_if_missing(self, capsys) -> None:
+        """Test rebuild_like_daily_stats command backfills only empty rollup."""
+        LikeFactory.create_batch(size=2)
+        LikeDailyStat.objects.update(likes=0)
+        call_command("rebuild_like_daily_stats", "--if-missing")
+        assert get_like_daily_stats().get()["likes"] == 0
+        assert "backfill is skipped" in capsys.readouterr().out
+        LikeDailyStat.objects.all().delete()
+        call_command("rebuild_like_daily_stats", "--if-missing")
+        assert get_like_daily_stats().get()["likes"] == 2
+        assert "rebuilt for 1 days" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+class TestRebuildStatisticCounterCommand:
+    """Class for testing rebuild_statistic_counter command."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_rebuild_statistic_counter(self, capsys) -> None:
+        """Test rebuild_statistic_counter command."""
+        LikeFactory()
+        StatisticCounter.objects.create(users=10, posts=10, likes=10)
+        call_command("rebuild_statistic_counter")
+        assert tuple(get_statistic_numbers().values()) == (2, 1, 1)
+        assert "users - 2, posts - 1, likes - 1" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+class TestReconcilePostLikeCountersCommand:
+    """Class for testing reconcile_post_like_counters command."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_reconcile_post_like_counters(self, capsys) -> None:
+        """Test reconcile_post_like_counters command."""
+        LikeFactory(eval=True)
+        Post.objects.update(likes_count=0, dislikes_count=3)
+        call_command("reconcile_post_like_counters", "--chunk-size", "10")
+        post: Post = Post.objects.get()
+        assert (post.likes_count, post.dislikes_count) == (1, 0)
+        assert "1 posts fixed" in capsys.readouterr().out
+
+    def test_reconcile_post_like_counters_if_missing(self, capsys) -> None:
+        """Test reconcile_post_like_counters command backfills only zero counters."""
+        LikeFactory(eval=False)
+        Post.objects.update(dislikes_count=3)
+        call_command("reconcile_post_like_counters", "--if-missing")
+        assert Post.objects.get().dislikes_count == 3
+        assert "backfill is skipped" in capsys.readouterr().out
+        Post.objects.update(dislikes_count=0)
+        call_command("reconcile_post_like_counters", "--if-missing")
+        assert Post.objects.get().dislikes_count == 1
+        assert "1 posts fixed" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+class TestPurgeBlacklistedTokensCommand:
+    """Class for testing purge_blacklisted_tokens command."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_purge_blacklisted_tokens(self, faker: Faker, capsys) -> None:
+        """Test purge_blacklisted_tokens command."""
+        BlacklistedToken.objects.create(
+            jti=faker.uuid4(), expires_at=timezone.now() - timedelta(days=1)
+        )
+        call_command("purge_blacklisted_tokens")
+        assert not BlacklistedToken.objects.exists()
+        assert "1 expired blacklisted tokens were purged" in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+class TestDeduplicateLikesCommand:
+    """Class for testing deduplicate_likes command."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_deduplicate_likes(self, capsys) -> None:
+        """Test deduplicate_likes command keeps the latest Like of each pair."""
+        like: Like = LikeFactory()
+        other: Like = LikeFactory()
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute(
+                f"ALTER TABLE {Like._meta.db_table} "
+                "DROP CONSTRAINT unique_like_user_message"
+            )
+        duplicates: List[Like] = Like.objects.bulk_create(
+            [
+                Like(user=like.user, message=like.message, eval=not like.eval)
+                for _ in range(2)
+            ]
+        )
+        call_command("deduplicate_likes")
+        assert set(Like.objects.values_list("id", flat=True)) == {
+            other.pk,
+            max(duplicate.pk for duplicate in duplicates),
+        }
+        assert "2 duplicated likes were deleted" in capsys.readouterr().out
+
+    def test_deduplicate_likes_with_constraint(
+        self, capsys, django_assert_num_queries
+    ) -> None:
+        """Test deduplicate_likes command skips deletion, if constraint exists."""
+        LikeFactory()
+        with django_assert_num_queries(1):
+            call_command("deduplicate_likes")
+        assert Like.objects.count() == 1
+        assert "deduplication is skipped" in capsys.readouterr().out
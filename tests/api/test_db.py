@@ -0,0 +1,77 @@
+"""Module for testing 'api' app database backend."""
+import gc
+from typing import Dict, Generator
+
+import pytest
+from django.db import OperationalError, connection
+
+from api.db.base import ConnectionPool, DatabaseWrapper, pools
+
+ALIAS: str = "pool_testing"
+
+
+@pytest.fixture
+def get_wrapper() -> Generator[DatabaseWrapper, None, None]:
+    """Get database wrapper with single connection pool."""
+    settings_dict: Dict = {
+        **connection.settings_dict,
+        "POOL": {"MAX_SIZE": 1, "TIMEOUT": 0.1},
+    }
+    wrapper: DatabaseWrapper = DatabaseWrapper(settings_dict, alias=ALIAS)
+    yield wrapper
+    wrapper.close()
+    pools.pop(ALIAS, None)
+
+
+@pytest.mark.django_db
+class TestDatabaseWrapper:
+    """Class for testing DatabaseWrapper."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_connection_stats(self, get_wrapper: DatabaseWrapper) -> None:
+        """Test connection is counted as open, in use and then closed."""
+        get_wrapper.cursor().close()
+        stats: Dict = get_wrapper.pool.get_stats()
+        assert (stats["open"], stats["in_use"], stats["idle"]) == (1, 1, 0)
+        assert stats["acquire_latency_ms"]["count"] == 1
+        get_wrapper.in_use = False
+        assert get_wrapper.pool.get_stats()["idle"] == 1
+        get_wrapper.close()
+        stats = get_wrapper.pool.get_stats()
+        assert (stats["open"], stats["opened"], stats["closed"]) == (0, 1, 1)
+
+    def test_connection_pool_exhausted(self, get_wrapper: DatabaseWrapper) -> None:
+        """Test connection over pool size fails after timeout."""
+        get_wrapper.ensure_connection()
+        other: DatabaseWrapper = DatabaseWrapper(get_wrapper.settings_dict, ALIAS)
+        with pytest.raises(OperationalError):
+            other.ensure_connection()
+        assert get_wrapper.pool.get_stats()["timeouts"] == 1
+        get_wrapper.close()
+        other.ensure_connection()
+        other.close()
+
+    def test_connection_slot_released_on_collect(
+        self, get_wrapper: DatabaseWrapper
+    ) -> None:
+        """Test garbage collected wrapper releases its connection slot."""
+        other: DatabaseWrapper = DatabaseWrapper(get_wrapper.settings_dict, ALIAS)
+        other.ensure_connection()
+        del other
+        gc.collect()
+        get_wrapper.ensure_connection()
+        assert get_wrapper.pool.get_stats()["open"] == 1
+
+
+class TestConnectionPool:
+    """Class for testing ConnectionPool."""
+
+    def test_health_check_failure(self) -> None:
+        """Test unusable connections are counted."""
+        pool: ConnectionPool = ConnectionPool(1, 0.1)
+        pool.record_health_check_failure()
+        pool.record_connect(0.002)
+        stats: Dict = pool.get_stats()
+        assert stats["health_check_failures"] == 1
+        assert stats["acquire_latency_ms"] == {"count": 1, "avg": 2.0, "max": 2.0}
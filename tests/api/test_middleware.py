@@ -0,0 +1,129 @@
+"""Module for testing 'api' app middleware."""
+import json
+import logging
+from typing import Dict, List, Tuple
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.models import Post, User
+from tests.api.factories import PostFactory
+from tests.api.test_views import read_streaming_content
+
+
+def get_server_timing(header: str) -> Dict[str, str]:
+    """Get Server-Timing header metrics by names."""
+    metrics: List[Tuple[str, str]] = [
+        tuple(metric.strip().split(";", 1)) for metric in header.split(",")
+    ]
+    return dict(metrics)
+
+
+@pytest.mark.django_db
+class TestServerTimingMiddleware:
+    """Class for testing ServerTimingMiddleware."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_server_timing_header(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test response has stage durations and queries number."""
+        _, headers = get_authorized_admin_user_data
+        post: Post = PostFactory()
+        with CaptureQueriesContext(connection) as context:
+            response = client.post(
+                reverse("like"),
+                headers=headers,
+                data={"message_id": post.pk, "eval": "like"},
+            )
+        assert response.status_code == 200
+        metrics: Dict[str, str] = get_server_timing(response["Server-Timing"])
+        assert set(metrics) == {"total", "view", "db", "serializer", "render"}
+        assert metrics["db"].endswith(f'desc="{len(context.captured_queries)} queries"')
+
+    def test_server_timing_log(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test timings are logged with URL name."""
+        _, headers = get_authorized_admin_user_data
+        caplog.set_level(logging.INFO, logger="api.timing")
+        client.get(
+            reverse("analitics"),
+            headers=headers,
+            data={"date_from": "134443", "date_to": "13334"},
+        )
+        (record,) = [
+            json.loads(log.getMessage())
+            for log in caplog.records
+            if log.name == "api.timing"
+        ]
+        assert record["url_name"] == "analitics"
+        assert record["status"] == 406
+        assert record["total_ms"] >= record["view_ms"] >= record["db_ms"]
+        assert record["db_queries"] >= 1
+
+    def test_server_timing_streaming(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test streamed response is logged after its last chunk."""
+        _, headers = get_authorized_admin_user_data
+        caplog.set_level(logging.INFO, logger="api.timing")
+        PostFactory.create_batch(size=3)
+        response = client.get(
+            reverse("last_posts"), headers=headers, data={"stream": "true"}
+        )
+        assert "Server-Timing" in response
+        assert not caplog.records
+        assert len(json.loads(b"".join(response.streaming_content))) == 3
+        record: Dict = json.loads(caplog.records[-1].getMessage())
+        assert record["url_name"] == "last_posts"
+        assert record["streaming"] is True
+        assert record["db_queries"] >= 1
+
+    def test_server_timing_streaming_asgi(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        async_client: AsyncClient,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test async streamed response is logged after its last chunk."""
+        _, headers = get_authorized_admin_user_data
+        caplog.set_level(logging.INFO, logger="api.timing")
+        PostFactory.create_batch(size=3)
+        response = async_to_sync(async_client.get)(
+            reverse("last_posts"), headers=headers, data={"stream": "true"}
+        )
+        assert response.is_async
+        assert not caplog.records
+        chunks: List[bytes] = async_to_sync(read_streaming_content)(response)
+        assert len(json.loads(b"".join(chunks))) == 3
+        record: Dict = json.loads(caplog.records[-1].getMessage())
+        assert record["streaming"] is True
+        assert record["db_queries"] >= 1
+
+    def test_server_timing_async_view(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test queries of async view run in executor thread are counted."""
+        _, headers = get_authorized_admin_user_data
+        response = client.post(
+            reverse("async_create_post"), headers=headers, data={"message": "a"}
+        )
+        assert response.status_code == 201
+        metrics: Dict[str, str] = get_server_timing(response["Server-Timing"])
+        assert 'desc="0 queries"' not in metrics["db"]
@@ -0,0 +1,208 @@
+"""
+Module for testing database queries budgets of 'api' app endpoints.
+
+Every endpoint has maximum number of queries, checked with small and big
+dataset, number of queries must not grow with dataset size.
+"""
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from api.models import BlacklistedToken, Like, LikeDailyStat, Post, User
+from api.urls import urlpatterns
+from tests.api.endpoints import ENDPOINT_REQUESTS, Dataset, like_dataset_post
+
+SIZES: Tuple[int, ...] = (10, 1000)
+
+
+def get_routes() -> Set[Tuple[str, str]]:
+    """Get names and methods of 'api' app routes."""
+    routes: Set[Tuple[str, str]] = set()
+    for pattern in urlpatterns:
+        view_class: Any = pattern.callback.view_class
+        routes.update(
+            (pattern.name, method.upper())
+            for method in view_class.http_method_names
+            if method not in ("head", "options") and hasattr(view_class, method)
+        )
+    return routes
+
+
+def seed_dataset(size: int) -> None:
+    """Create size users, posts, likes, daily stats and blacklisted tokens."""
+    start: int = User.objects.count()
+    users: List[User] = User.objects.bulk_create(
+        [
+            User(username=f"budget_{index}", email=f"budget_{index}@gmail.com")
+            for index in range(start, size)
+        ]
+    )
+    posts: List[Post] = Post.objects.bulk_create(
+        [Post(user=user, message=f"message {user.pk}") for user in users]
+    )
+    Like.objects.bulk_create(
+        [
+            Like(user=user, message=post, eval=bool(user.pk % 2))
+            for user, post in zip(users, posts)
+        ]
+    )
+    today = timezone.now().date()
+    LikeDailyStat.objects.bulk_create(
+        [
+            LikeDailyStat(date=today - timezone.timedelta(days=index), likes=index)
+            for index in range(start + 1, size + 1)
+        ]
+    )
+    BlacklistedToken.objects.bulk_create(
+        [
+            BlacklistedToken(
+                jti=f"budget_{index}",
+                expires_at=timezone.now() + timezone.timedelta(days=1),
+            )
+            for index in range(start, size)
+        ]
+    )
+
+
+QUERY_BUDGETS: Dict[str, int] = {
+    "token": 1,
+    "token_refresh": 1,
+    "sign_up": 3,
+    "create_post": 2,
+    "create_posts_bulk": 4,
+    "last_posts": 1,
+    "last_posts_stream": 1,
+    "like": 2,
+    "like_delete": 2,
+    "like_batch": 6,
+    "last_likes": 1,
+    "last_likes_stream": 1,
+    "analitics": 1,
+    "activity": 1,
+    "statistic": 1,
+    "statistic_estimated": 1,
+    "diagnostics_hashing": 0,
+    "diagnostics_database": 0,
+    "metrics": 0,
+    "async_create_post": 2,
+    "async_like": 2,
+    "async_like_delete": 2,
+    "async_analitics": 1,
+}
+
+ADMIN_MODELS: Dict[str, int] = {
+    "user": 6,
+    "post": 5,
+    "like": 5,
+    "likedailystat": 5,
+    "statisticcounter": 5,
+    "blacklistedtoken": 5,
+}
+
+
+@contextmanager
+def assert_query_budget(budget: int, info: str) -> Iterator[CaptureQueriesContext]:
+    """Fail with executed SQL, if more than budget queries were executed."""
+    with CaptureQueriesContext(connection) as context:
+        yield context
+    if len(context) > budget:
+        queries: str = "\n\n".join(query["sql"] for query in context.captured_queries)
+        pytest.fail(
+            f"{info}: expected at most {budget} queries, "
+            f"but {len(context)} were done.\n\nQueries:\n========\n\n{queries}"
+        )
+
+
+def get_queries_numbers(
+    client: Client, dataset: Dataset, budget: int, name: str, request: Callable
+) -> List[int]:
+    """
+    Get queries numbers of request made with datasets of all sizes.
+
+    Request is made once before measuring, so authenticated user is cached,
+    as it is in steady state. Post of dataset is liked before measured
+    request, so like deletion requests find it.
+    """
+    numbers: List[int] = []
+    for index, size in enumerate(SIZES):
+        seed_dataset(size)
+        dataset.posts[:] = list(Post.objects.order_by("id")[:10])
+        if not index:
+            request(client, dataset)
+        like_dataset_post(dataset)
+        with assert_query_budget(budget, f"{name} with {size} rows") as context:
+            response = request(client, dataset)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        assert response.status_code < 400, response.content
+        numbers.append(len(context))
+    return numbers
+
+
+@pytest.mark.django_db
+class TestQueryBudgets:
+    """Class for testing queries number of endpoints."""
+
+    pytestmark = pytest.mark.django_db
+
+    @pytest.mark.parametrize("name", ENDPOINT_REQUESTS)
+    def test_endpoint_query_budget(
+        self,
+        name: str,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test endpoint queries number is in budget and does not grow."""
+        user, headers = get_authorized_admin_user_data
+        dataset: Dataset = Dataset(user, headers, [])
+        numbers: List[int] = get_queries_numbers(
+            client, dataset, QUERY_BUDGETS[name], name, ENDPOINT_REQUESTS[name]
+        )
+        assert len(set(numbers)) == 1, f"{name} queries grow with rows: {numbers}"
+
+    def test_every_route_has_query_budget(
+        self, client: Client, get_authorized_admin_user_data: Tuple[User, Dict]
+    ) -> None:
+        """Test every route and method of 'api' app is requested with budget."""
+        user, headers = get_authorized_admin_user_data
+        seed_dataset(SIZES[0])
+        dataset: Dataset = Dataset(
+            user, headers, list(Post.objects.order_by("id")[:10])
+        )
+        requested: Set[Tuple[str, str]] = set()
+        for request in ENDPOINT_REQUESTS.values():
+            like_dataset_post(dataset)
+            response = request(client, dataset)
+            requested.add(
+                (response.resolver_match.url_name, response.request["REQUEST_METHOD"])
+            )
+        assert set(QUERY_BUDGETS) == set(ENDPOINT_REQUESTS)
+        assert not get_routes() - requested, "Routes without query budget."
+
+    @pytest.mark.parametrize("model", ADMIN_MODELS)
+    def test_admin_changelist_query_budget(
+        self,
+        model: str,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test admin changelist queries number is in budget and does not grow."""
+        user, headers = get_authorized_admin_user_data
+        client.force_login(user)
+        dataset: Dataset = Dataset(user, headers, [])
+        numbers: List[int] = get_queries_numbers(
+            client,
+            dataset,
+            ADMIN_MODELS[model],
+            f"{model} changelist",
+            lambda client, dataset: client.get(
+                reverse(f"admin:api_{model}_changelist")
+            ),
+        )
+        assert len(set(numbers)) == 1, f"{model} queries grow with rows: {numbers}"
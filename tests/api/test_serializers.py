@@ -1,11 +1,11 @@
 """Module for testing custom serializers method."""
-from typing import Dict
+from typing import Dict, List
 
 import pytest
 from faker import Faker
 
 from api.models import User
-from api.serializers import UserSerializer
+from api.serializers import LikeBatchItemSerializer, UserSerializer
 
 
 @pytest.mark.django_db
@@ -38,3 +38,24 @@ class TestUserSerializerCreateMethod:
         user = User.objects.last()
         assert user.username == validate_data.get("username")
         assert user.email == validate_data.get("email", "")
+
+
+class TestLikeBatchItemSerializer:
+    """Class for testing LikeBatchItemSerializer."""
+
+    def test_duplicated_message_id(self, faker: Faker) -> None:
+        """Test item with message_id of earlier valid item is invalid."""
+        message_id: int = faker.random_int(min=1)
+        context: Dict = {"message_ids": set()}
+        serializers: List[LikeBatchItemSerializer] = [
+            LikeBatchItemSerializer(
+                data={"message_id": message_id, "eval": value}, context=context
+            )
+            for value in ("likee", "Like", "Dislike")
+        ]
+        assert [serializer.is_valid() for serializer in serializers] == [
+            False,
+            True,
+            False,
+        ]
+        assert "message_id" in serializers[2].errors
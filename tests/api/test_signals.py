@@ -0,0 +1,137 @@
+"""Module for testing 'api' app signal receivers."""
+from typing import Dict, List
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.deletion import Collector
+from django.utils.timezone import localdate
+from faker import Faker
+
+from api.models import Like, Post, User
+from api.services.model_operations import (
+    get_like_daily_stats,
+    get_statistic_numbers,
+    rebuild_statistic_counter,
+)
+from tests.api.factories import LikeFactory, PostFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestLikeDailyStatReceivers:
+    """Class for testing daily likes rollup receivers."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_like_creation(self, faker: Faker) -> None:
+        """Test Like creation increments daily likes rollup."""
+        number: int = faker.random_int(min=3, max=10)
+        likes = LikeFactory.create_batch(size=number)
+        stat: Dict = get_like_daily_stats().get()
+        assert stat["date"] == localdate(likes[0].created_at)
+        assert stat["likes"] == number
+
+    def test_like_deletion(self, faker: Faker) -> None:
+        """Test Like deletion decrements daily likes rollup."""
+        number: int = faker.random_int(min=3, max=10)
+        LikeFactory.create_batch(size=number)
+        Like.objects.first().delete()
+        assert get_like_daily_stats().get()["likes"] == number - 1
+
+    def test_like_update(self) -> None:
+        """Test Like update does not change daily likes rollup."""
+        like: Like = LikeFactory()
+        like.eval = not like.eval
+        like.save()
+        assert get_like_daily_stats().get()["likes"] == 1
+
+
+@pytest.mark.django_db
+class TestPostLikeCountersReceivers:
+    """Class for testing Post like counters receivers."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_like_creation_and_deletion(self) -> None:
+        """Test Like creation and deletion change Post counters."""
+        post: Post = PostFactory()
+        like: Like = LikeFactory(message=post, eval=True)
+        LikeFactory(message=post, eval=False)
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (1, 1)
+        like.delete()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+
+    def test_like_update(self) -> None:
+        """Test Like eval and Post change move counts between Post counters."""
+        post: Post = PostFactory()
+        like: Like = LikeFactory(message=post, eval=True)
+        like.eval = False
+        like.save()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+        other_post: Post = PostFactory()
+        like.message = other_post
+        like.save()
+        post.refresh_from_db()
+        other_post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 0)
+        assert (other_post.likes_count, other_post.dislikes_count) == (0, 1)
+        like.save()
+        other_post.refresh_from_db()
+        assert (other_post.likes_count, other_post.dislikes_count) == (0, 1)
+        assert get_like_daily_stats().get()["likes"] == 1
+
+    def test_likes_are_fast_deleted(self) -> None:
+        """Test Like model has no delete receivers, so cascade does not load it."""
+        assert Collector(using=DEFAULT_DB_ALIAS).can_fast_delete(Like.objects.all())
+
+    def test_user_deletion(self) -> None:
+        """Test user deletion decrements counters of other users Posts."""
+        user: User = UserFactory()
+        post: Post = PostFactory()
+        LikeFactory(user=user, message=post, eval=True)
+        LikeFactory(user=user, message=PostFactory(user=user), eval=False)
+        LikeFactory(message=post, eval=False)
+        rebuild_statistic_counter()
+        user.delete()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+        assert get_like_daily_stats().get()["likes"] == 1
+        assert get_statistic_numbers()["likes"] == 1
+
+    def test_users_with_mutual_likes_deletion(self) -> None:
+        """Test Likes of users liking Posts of each other are counted once."""
+        users: List[User] = UserFactory.create_batch(size=2, is_active=True)
+        first_post: Post = PostFactory(user=users[0])
+        second_post: Post = PostFactory(user=users[1])
+        LikeFactory(user=users[0], message=second_post)
+        LikeFactory(user=users[1], message=first_post)
+        rebuild_statistic_counter()
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
+        assert get_like_daily_stats().get()["likes"] == 0
+        assert tuple(get_statistic_numbers().values()) == (0, 0, 0)
+
+
+@pytest.mark.django_db
+class TestStatisticCounterReceivers:
+    """Class for testing statistic counter receivers."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_instances_creation(self) -> None:
+        """Test users, posts and likes creation increments counter."""
+        rebuild_statistic_counter()
+        LikeFactory()
+        PostFactory()
+        assert tuple(get_statistic_numbers().values()) == (3, 2, 1)
+
+    def test_instances_deletion(self) -> None:
+        """Test user deletion decrements counter with cascaded instances."""
+        user: User = UserFactory()
+        post: Post = PostFactory(user=user)
+        LikeFactory(user=user, message=post)
+        rebuild_statistic_counter()
+        user.delete()
+        assert tuple(get_statistic_numbers().values()) == (0, 0, 0)
+        assert not Like.objects.exists()
@@ -1,7 +1,10 @@
 """Module for testing 'api' app tables."""
 import pytest
+from django.db import IntegrityError
+from django.utils import timezone
+from faker import Faker
 
-from api.models import Like, Post, User
+from api.models import BlacklistedToken, Like, LikeDailyStat, Post, User
 from tests.api.factories import LikeFactory, PostFactory, UserFactory
 from tests.bases import BaseModelFactory
 
@@ -55,3 +58,44 @@ class TestLike:
         obj: Like = LikeFactory()
         expected_result = f"Like by {obj.user} {obj.created_at}"
         assert expected_result == obj.__str__()
+
+    def test_unique_user_message(self) -> None:
+        """Test only one Like per user and post is allowed."""
+        obj: Like = LikeFactory()
+        with pytest.raises(IntegrityError):
+            Like.objects.create(user=obj.user, message=obj.message, eval=obj.eval)
+
+
+@pytest.mark.django_db
+class TestLikeDailyStat:
+    """Class for testing LikeDailyStat model."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test__str__(self) -> None:
+        """Test LikeDailyStat __str__ method."""
+        obj: Like = LikeFactory()
+        stat: LikeDailyStat = LikeDailyStat.objects.get()
+        expected_result = f"1 likes at {obj.created_at.date()}"
+        assert expected_result == stat.__str__()
+
+
+@pytest.mark.django_db
+class TestBlacklistedToken:
+    """Class for testing BlacklistedToken model."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test__str__(self, faker: Faker) -> None:
+        """Test BlacklistedToken __str__ method."""
+        obj: BlacklistedToken = BlacklistedToken.objects.create(
+            jti=faker.uuid4(), expires_at=timezone.now()
+        )
+        assert obj.__str__() == f"Token {obj.jti} till {obj.expires_at}"
+
+    def test_jti_unique(self, faker: Faker) -> None:
+        """Test BlacklistedToken jti is unique."""
+        jti: str = faker.uuid4()
+        BlacklistedToken.objects.create(jti=jti, expires_at=timezone.now())
+        with pytest.raises(IntegrityError):
+            BlacklistedToken.objects.create(jti=jti, expires_at=timezone.now())
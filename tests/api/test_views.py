@@ -1,22 +1,34 @@
 """Module for testing 'api' app views."""
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
-from django.test import Client
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.test import AsyncClient, Client
 from django.urls import reverse
 from faker import Faker
+from pytest_mock import MockerFixture
 
 from api.models import Like, Post, User
+from api.services.hashing import HashingPoolSaturated, password_hashing_pool
 from api.services.model_operations import (
     get_likes_number,
     get_posts_number,
     get_users_number,
 )
+from api.services.pagination import LastPostsPagination
+from api.tokens import RefreshToken
 from tests.api.factories import LikeFactory, PostFactory, UserFactory
 
 
+async def read_streaming_content(response: StreamingHttpResponse) -> List[bytes]:
+    """Read chunks of async streaming response."""
+    return [chunk async for chunk in response.streaming_content]
+
+
 @pytest.mark.django_db
 class TestRegisterView:
     """Class for testing RegisterView."""
@@ -50,6 +62,77 @@ class TestRegisterView:
         assert result.get("username") == username
         assert result.get("email") == email
 
+    def test_register_view_hashing_pool_saturated(
+        self, faker: Faker, client: Client, mocker: MockerFixture
+    ) -> None:
+        """Test RegisterView. Password hashing pool is saturated."""
+        mocker.patch.object(
+            password_hashing_pool,
+            "make_password",
+            side_effect=HashingPoolSaturated(wait=3),
+        )
+        data: Dict = {"username": faker.first_name(), "password": faker.password()}
+        response = client.post(reverse("sign_up"), data=data)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert not User.objects.exists()
+
+
+@pytest.mark.django_db
+class TestTokenObtainPairView:
+    """Class for testing TokenObtainPairView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_token_obtain_pair_view(self, faker: Faker, client: Client) -> None:
+        """Test TokenObtainPairView with password checked on hashing pool."""
+        password: str = faker.password()
+        user: User = UserFactory(is_active=True)
+        user.set_password(password)
+        user.save()
+        data: Dict = {"username": user.username, "password": password}
+        response = client.post(reverse("token"), data=data)
+        assert response.status_code == 200
+        assert {"access", "refresh"} <= set(response.json())
+        data["password"] = faker.password()
+        assert client.post(reverse("token"), data=data).status_code == 401
+
+    def test_token_obtain_pair_view_hashing_pool_saturated(
+        self, faker: Faker, client: Client, mocker: MockerFixture
+    ) -> None:
+        """Test TokenObtainPairView. Password hashing pool is saturated."""
+        user: User = UserFactory(is_active=True)
+        mocker.patch.object(
+            password_hashing_pool,
+            "check_password",
+            side_effect=HashingPoolSaturated(wait=1),
+        )
+        data: Dict = {"username": user.username, "password": faker.password()}
+        response = client.post(reverse("token"), data=data)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.django_db
+class TestTokenRefreshView:
+    """Class for testing TokenRefreshView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_token_refresh_view_rotation(self, client: Client) -> None:
+        """Test TokenRefreshView rotates token and rejects its reuse."""
+        user: User = UserFactory(is_active=True)
+        refresh: str = str(RefreshToken.for_user(user))
+        url: str = reverse("token_refresh")
+        response = client.post(url, data={"refresh": refresh})
+        result: Dict = response.json()
+        assert response.status_code == 200
+        assert result.get("refresh") not in (None, refresh)
+        assert "access" in result
+        response = client.post(url, data={"refresh": refresh})
+        assert response.status_code == 401
+        assert client.post(url, data={"refresh": result["refresh"]}).status_code == 200
+
 
 @pytest.mark.django_db
 class TestPostCreateView:
@@ -109,6 +192,67 @@ class TestPostCreateView:
         assert response.status_code == 401
 
 
+@pytest.mark.django_db
+class TestPostBulkCreateView:
+    """Class for testing PostBulkCreateView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_post_bulk_create_view(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test PostBulkCreateView."""
+        user, headers = get_authorized_admin_user_data
+        messages: List[str] = [faker.pystr(min_chars=1, max_chars=255) for _ in "abc"]
+        response = client.post(
+            reverse("create_posts_bulk"),
+            headers=headers,
+            data=json.dumps([{"message": message} for message in messages]),
+            content_type="application/json",
+        )
+        result: List[int] = response.json().get("ids")
+        assert response.status_code == 201
+        assert [Post.objects.get(pk=pk).message for pk in result] == messages
+
+    def test_post_bulk_create_view_invalid_item(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test PostBulkCreateView. One message is empty."""
+        user, headers = get_authorized_admin_user_data
+        response = client.post(
+            reverse("create_posts_bulk"),
+            headers=headers,
+            data=json.dumps([{"message": faker.pystr(min_chars=1)}, {"message": ""}]),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        assert not Post.objects.exists()
+
+    def test_post_bulk_create_view_too_many_items(
+        self,
+        client: Client,
+        settings,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test PostBulkCreateView. Input list is too long."""
+        user, headers = get_authorized_admin_user_data
+        settings.POST_BULK_MAX_SIZE = 1
+        response = client.post(
+            reverse("create_posts_bulk"),
+            headers=headers,
+            data=json.dumps([{"message": "a"}, {"message": "b"}]),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        assert not Post.objects.exists()
+
+
 @pytest.mark.django_db
 class TestLikeView:
     """Class for testing LikeView."""
@@ -136,6 +280,27 @@ class TestLikeView:
         assert result.get("user") == user.pk
         assert result.get("message") == post.pk
 
+    def test_like_view_post_method_switch(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LikeView post method. Like is switched to dislike."""
+        user, headers = get_authorized_admin_user_data
+        url: str = reverse("like")
+        post: Post = PostFactory()
+        for value in ("like", "dislike"):
+            response = client.post(
+                url, headers=headers, data={"message_id": post.pk, "eval": value}
+            )
+        result: Dict = response.json()
+        assert response.status_code == 200
+        assert result.get("eval") is False
+        assert Like.objects.get().eval is False
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 1)
+
     def test_like_view_post_method_message_id_not_exist(
         self,
         client: Client,
@@ -211,6 +376,8 @@ class TestLikeView:
         assert response.status_code == 200
         assert result.get("result") == "Like was successfully deleted."
         assert not Like.objects.all()
+        post.refresh_from_db()
+        assert (post.likes_count, post.dislikes_count) == (0, 0)
 
     def test_like_view_delete_method_like_not_exist(
         self,
@@ -235,6 +402,69 @@ class TestLikeView:
         assert result.get("result") == "Like was not found"
 
 
+@pytest.mark.django_db
+class TestLikeBatchView:
+    """Class for testing LikeBatchView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_like_batch_view(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LikeBatchView post method."""
+        user, headers = get_authorized_admin_user_data
+        posts: List[Post] = PostFactory.create_batch(size=2)
+        LikeFactory(user=user, message=posts[1], eval=True)
+        missing_id: int = faker.random_int(
+            min=posts[-1].pk + 1, max=posts[-1].pk + 1000
+        )
+        data: List[Dict] = [
+            {"message_id": posts[0].pk, "eval": "Like"},
+            {"message_id": posts[1].pk, "eval": "Dislike"},
+            {"message_id": missing_id, "eval": "Like"},
+            {"message_id": posts[0].pk, "eval": "likee"},
+            {"message_id": posts[0].pk, "eval": "Dislike"},
+        ]
+        response = client.post(
+            reverse("like_batch"),
+            headers=headers,
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        assert response.json().get("results") == [
+            {"message_id": posts[0].pk, "eval": True, "result": "created"},
+            {"message_id": posts[1].pk, "eval": False, "result": "updated"},
+            {"message_id": missing_id, "eval": True, "result": "Post was not found"},
+            {"result": "Invalid input data."},
+            {"result": "Invalid input data."},
+        ]
+        assert Like.objects.get(message=posts[0]).eval is True
+        assert Like.objects.get(message=posts[1]).eval is False
+
+    def test_like_batch_view_too_many_items(
+        self,
+        client: Client,
+        settings,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LikeBatchView post method. Input list is too long."""
+        user, headers = get_authorized_admin_user_data
+        settings.LIKE_BATCH_MAX_SIZE = 1
+        data: List[Dict] = [{"message_id": 1, "eval": "Like"}] * 2
+        response = client.post(
+            reverse("like_batch"),
+            headers=headers,
+            data=json.dumps(data),
+            content_type="application/json",
+        )
+        assert response.status_code == 400
+        assert response.json().get("result") == "Input must be a list of 1 to 1 items."
+
+
 @pytest.mark.django_db
 class TestAnaliticView:
     """Class for testing AnaliticView."""
@@ -327,6 +557,30 @@ class TestUserActivityView:
             == test_user.last_request_at.isoformat()[:-6] + "Z"
         )
 
+    def test_user_activity_view_pending_activity(
+        self,
+        client: Client,
+        faker: Faker,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test UserActivityView. Not yet flushed activity is reported."""
+        user, headers = get_authorized_admin_user_data
+        saved_user: User = User.objects.get(pk=user.pk)
+        client.post(
+            reverse("create_post"),
+            headers=headers,
+            data={"message": faker.pystr(min_chars=1, max_chars=255)},
+        )
+        url = reverse("activity", kwargs={"pk": user.pk})
+        response = client.get(url, headers=headers)
+        result = response.json().get("activity")
+        assert response.status_code == 200
+        assert saved_user.last_login is None
+        assert result.get("last_login") is not None
+        assert result.get("last_request_at") > (
+            saved_user.last_request_at.isoformat()[:-6] + "Z"
+        )
+
     def test_user_activity_view_does_not_exist(
         self,
         client: Client,
@@ -372,6 +626,123 @@ class TestStatisticView:
             == f"Users - {users_number}, posts - {posts_number}, likes - {likes_number}"
         )
 
+    def test_statistic_view_estimated(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test StatisticView. Estimated numbers."""
+        user, headers = get_authorized_admin_user_data
+        url = reverse("statistic")
+        response = client.get(url, headers=headers, data={"estimated": "true"})
+        result = response.json().get("statistic data")
+        assert response.status_code == 200
+        assert result.startswith("Users - ")
+
+
+@pytest.mark.django_db
+class TestHashingPoolStatsView:
+    """Class for testing HashingPoolStatsView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_hashing_pool_stats_view(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test HashingPoolStatsView."""
+        _, headers = get_authorized_admin_user_data
+        response = client.get(reverse("diagnostics_hashing"), headers=headers)
+        assert response.status_code == 200
+        assert response.json()["hashing_pool"] == password_hashing_pool.get_stats()
+
+    def test_hashing_pool_stats_view_not_admin(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test HashingPoolStatsView. User is not admin."""
+        user, headers = get_authorized_admin_user_data
+        user.is_staff = False
+        user.save()
+        response = client.get(reverse("diagnostics_hashing"), headers=headers)
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestDatabasePoolStatsView:
+    """Class for testing DatabasePoolStatsView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_database_pool_stats_view(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test DatabasePoolStatsView."""
+        _, headers = get_authorized_admin_user_data
+        response = client.get(reverse("diagnostics_database"), headers=headers)
+        result: Dict = response.json()["database_pool"]
+        assert response.status_code == 200
+        assert result["max_size"] == settings.DATABASES["default"]["POOL"]["MAX_SIZE"]
+        assert result["open"] == result["idle"] + result["in_use"] >= 1
+        assert {"count", "avg", "max"} == set(result["acquire_latency_ms"])
+
+    def test_database_pool_stats_view_not_admin(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test DatabasePoolStatsView. User is not admin."""
+        user, headers = get_authorized_admin_user_data
+        user.is_staff = False
+        user.save()
+        response = client.get(reverse("diagnostics_database"), headers=headers)
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    """Class for testing MetricsView."""
+
+    pytestmark = pytest.mark.django_db
+
+    def test_metrics_view(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test MetricsView reports requests of views."""
+        _, headers = get_authorized_admin_user_data
+        post: Post = PostFactory()
+        for _ in range(2):
+            client.post(
+                reverse("like"),
+                headers=headers,
+                data={"message_id": post.pk, "eval": "like"},
+            )
+        response = client.get(reverse("metrics"), headers=headers)
+        result: str = response.content.decode()
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert 'api_requests_total{status="2xx",view="like"} 2.0' in result
+        assert 'api_request_duration_seconds_count{view="like"} 2.0' in result
+        assert 'api_request_duration_seconds_bucket{view="token",le="+Inf"}' in result
+
+    def test_metrics_view_not_admin(
+        self,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test MetricsView. User is not admin."""
+        user, headers = get_authorized_admin_user_data
+        user.is_staff = False
+        user.save()
+        response = client.get(reverse("metrics"), headers=headers)
+        assert response.status_code == 403
+
 
 @pytest.mark.django_db
 class TestLastPostsView:
@@ -391,8 +762,9 @@ class TestLastPostsView:
         number: int = faker.random_int(min=5, max=10)
         posts: List[Post] = PostFactory.create_batch(size=number)
         response = client.get(url, headers=headers, data={"posts_number": number - 2})
-        result = response.json()
+        result = response.json().get("results")
         assert response.status_code == 200
+        assert len(result) == number - 2
         for i, item in enumerate(result):
             assert item.get("id") == posts[number - i - 1].pk
             assert item.get("user") == posts[number - i - 1].user.pk
@@ -406,6 +778,89 @@ class TestLastPostsView:
                 == posts[number - i - 1].updated_at.isoformat()[:-6] + "Z"
             )
 
+    def test_last_posts_view_max_page_size(
+        self,
+        faker: Faker,
+        client: Client,
+        mocker: MockerFixture,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LastPostView. Page size is capped."""
+        user, headers = get_authorized_admin_user_data
+        mocker.patch.object(LastPostsPagination, "max_page_size", 3)
+        PostFactory.create_batch(size=5)
+        url = reverse("last_posts")
+        response = client.get(url, headers=headers, data={"posts_number": 10000000})
+        assert response.status_code == 200
+        assert len(response.json().get("results")) == 3
+
+    def test_last_posts_view_next_cursor(
+        self,
+        faker: Faker,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LastPostView. Pages are traversed by next cursor."""
+        user, headers = get_authorized_admin_user_data
+        number: int = faker.random_int(min=5, max=10)
+        posts: List[Post] = PostFactory.create_batch(size=number)
+        url: Optional[str] = reverse("last_posts") + "?posts_number=2"
+        ids: List[int] = []
+        while url:
+            result: Dict = client.get(url, headers=headers).json()
+            ids.extend(item.get("id") for item in result.get("results"))
+            url = result.get("next")
+        assert ids == [post.pk for post in reversed(posts)]
+
+    def test_last_posts_view_stream(
+        self,
+        faker: Faker,
+        client: Client,
+        mocker: MockerFixture,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LastPostView. Streaming output is not capped."""
+        user, headers = get_authorized_admin_user_data
+        mocker.patch.object(LastPostsPagination, "max_page_size", 3)
+        number: int = faker.random_int(min=5, max=10)
+        posts: List[Post] = PostFactory.create_batch(size=number)
+        url = reverse("last_posts")
+        response = client.get(
+            url, headers=headers, data={"posts_number": number - 1, "stream": "true"}
+        )
+        result = json.loads(b"".join(response.streaming_content))
+        assert response.status_code == 200
+        assert response.streaming
+        assert [item.get("id") for item in result] == [
+            post.pk for post in reversed(posts[1:])
+        ]
+        assert result[0].get("message") == posts[-1].message
+
+    def test_last_posts_view_stream_asgi(
+        self,
+        faker: Faker,
+        settings: Any,
+        async_client: AsyncClient,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LastPostView. Under ASGI posts are streamed by async chunks."""
+        user, headers = get_authorized_admin_user_data
+        settings.STREAM_CHUNK_SIZE = 2
+        number: int = faker.random_int(min=5, max=10)
+        posts: List[Post] = PostFactory.create_batch(size=number)
+        response = async_to_sync(async_client.get)(
+            reverse("last_posts"),
+            headers=headers,
+            data={"posts_number": number, "stream": "true"},
+        )
+        chunks: List[bytes] = async_to_sync(read_streaming_content)(response)
+        assert response.status_code == 200
+        assert response.is_async
+        assert len(chunks) == (number + 1) // 2 + 1
+        assert [item.get("id") for item in json.loads(b"".join(chunks))] == [
+            post.pk for post in reversed(posts)
+        ]
+
 
 @pytest.mark.django_db
 class TestLastLikesView:
@@ -426,8 +881,9 @@ class TestLastLikesView:
         user: User = UserFactory()
         likes: List[Like] = LikeFactory.create_batch(size=number, user=user)
         response = client.get(url, headers=headers, data={"likes_number": number - 2})
-        result = response.json()
+        result = response.json().get("results")
         assert response.status_code == 200
+        assert len(result) == number - 2
         for i, item in enumerate(result):
             assert item.get("user") == likes[number - i - 1].user.pk
             assert item.get("message") == likes[number - i - 1].message.pk
@@ -436,3 +892,22 @@ class TestLastLikesView:
                 item.get("created_at")
                 == likes[number - i - 1].created_at.isoformat()[:-6] + "Z"
             )
+
+    def test_last_likes_view_stream_accept_header(
+        self,
+        faker: Faker,
+        client: Client,
+        get_authorized_admin_user_data: Tuple[User, Dict],
+    ) -> None:
+        """Test LastLikesView. Streaming is selected by Accept header."""
+        user, headers = get_authorized_admin_user_data
+        headers.update({"Accept": "application/stream+json"})
+        number: int = faker.random_int(min=5, max=10)
+        likes: List[Like] = LikeFactory.create_batch(size=number)
+        url = reverse("last_likes")
+        response = client.get(url, headers=headers, data={"likes_number": number})
+        result = json.loads(b"".join(response.streaming_content))
+        assert response.status_code == 200
+        assert len(result) == number
+        assert result[0].get("message") == likes[-1].message.pk
+        assert result[0].get("eval") == likes[-1].eval
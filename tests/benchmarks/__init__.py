@@ -0,0 +1 @@
+"""Init module for 'network' project benchmarks."""
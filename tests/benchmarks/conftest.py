@@ -0,0 +1,13 @@
+"""Module for benchmarks pytest hooks."""
+from typing import Any
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Report results of benchmarks run in terminal summary."""
+    from tests.benchmarks.test_endpoints import format_result, results
+
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    for result in results:
+        terminalreporter.write_line(format_result(result))
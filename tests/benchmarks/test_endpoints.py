@@ -0,0 +1,159 @@
+"""
+Module for benchmarking 'api' app endpoints on seeded datasets.
+
+Benchmarks are skipped unless BENCHMARK_SCALES environment variable sets
+likes numbers of datasets, for example:
+
+    BENCHMARK_SCALES=1000,100000,1000000 pytest tests/benchmarks
+
+Every endpoint is requested BENCHMARK_ITERATIONS (at least 2, as latency
+percentiles need two values) times after warm-up. Results are reported in
+terminal summary and written as JSON to BENCHMARK_OUTPUT file, so runs
+made before and after change can be compared.
+"""
+import json
+import math
+import os
+import statistics
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Like, Post, User
+from api.services.model_operations import (
+    rebuild_like_daily_stats,
+    rebuild_statistic_counter,
+    reconcile_post_like_counters,
+)
+from tests.api.endpoints import ENDPOINT_REQUESTS, Dataset, like_dataset_post
+
+SCALES: List[int] = [
+    int(scale) for scale in os.getenv("BENCHMARK_SCALES", "").split(",") if scale
+]
+ITERATIONS: int = max(int(os.getenv("BENCHMARK_ITERATIONS", 50)), 2)
+OUTPUT: str = os.getenv("BENCHMARK_OUTPUT", "benchmark_results.json")
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(not SCALES, reason="BENCHMARK_SCALES is not set."),
+]
+
+results: List[Dict] = []
+
+
+def seed_likes(scale: int) -> List[Post]:
+    """
+    Create scale likes of square root of scale users and posts.
+
+    Likes are inserted by one INSERT ... SELECT, derived post counters, daily
+    statistic and statistic counter are rebuilt after it. Return posts.
+    """
+    side: int = math.ceil(math.sqrt(scale))
+    users: List[User] = User.objects.bulk_create(
+        [
+            User(username=f"bench_{index}", email=f"bench_{index}@gmail.com")
+            for index in range(side)
+        ],
+        batch_size=1000,
+    )
+    posts: List[Post] = Post.objects.bulk_create(
+        [Post(user=user, message=f"Benchmark message {user.pk}") for user in users],
+        batch_size=1000,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {Like._meta.db_table} "
+            "(user_id, message_id, eval, created_at) "
+            "SELECT u.id, p.id, random() < 0.7, now() - random() * interval '365 days' "
+            "FROM unnest(%s::bigint[]) AS u(id) "
+            "CROSS JOIN unnest(%s::bigint[]) AS p(id) LIMIT %s",
+            [[user.pk for user in users], [post.pk for post in posts], scale],
+        )
+        reconcile_post_like_counters(chunk_size=1000)
+        rebuild_like_daily_stats()
+        rebuild_statistic_counter()
+        cursor.execute("ANALYZE")
+    return posts
+
+
+def get_percentile(latencies: List[float], percentile: int) -> float:
+    """Get latency percentile in milliseconds."""
+    return round(1000 * statistics.quantiles(latencies, n=100)[percentile - 1], 3)
+
+
+def make_request(client: Client, dataset: Dataset, name: str) -> None:
+    """Request endpoint and read streamed response content."""
+    response = ENDPOINT_REQUESTS[name](client, dataset)
+    if response.streaming:
+        b"".join(response.streaming_content)
+    assert response.status_code < 400, response.content
+
+
+def run_benchmark(client: Client, dataset: Dataset, name: str) -> Dict:
+    """
+    Request endpoint ITERATIONS times and get its throughput and latency.
+
+    Queries are counted for one request after warm-up one, as debug cursor
+    slows queries down, latencies are measured without it. Post of dataset
+    is liked before every request out of measurement, so like deletion
+    requests find it.
+    """
+    like_dataset_post(dataset)
+    make_request(client, dataset, name)
+    like_dataset_post(dataset)
+    with CaptureQueriesContext(connection) as context:
+        make_request(client, dataset, name)
+        queries: int = len(context)
+    latencies: List[float] = []
+    for _ in range(ITERATIONS):
+        like_dataset_post(dataset)
+        started_at: float = time.perf_counter()
+        make_request(client, dataset, name)
+        latencies.append(time.perf_counter() - started_at)
+    return {
+        "endpoint": name,
+        "iterations": ITERATIONS,
+        "ops_per_sec": round(ITERATIONS / sum(latencies), 1),
+        "p50_ms": get_percentile(latencies, 50),
+        "p99_ms": get_percentile(latencies, 99),
+        "queries": queries,
+    }
+
+
+def format_result(result: Dict) -> str:
+    """Format benchmark result as line of report."""
+    return (
+        f"{result['scale']:>9} {result['endpoint']:<22} "
+        f"{result['ops_per_sec']:>9} ops/s p50 {result['p50_ms']:>8} ms "
+        f"p99 {result['p99_ms']:>8} ms {result['queries']} queries"
+    )
+
+
+def write_results() -> None:
+    """Write results of benchmarks run so far to output file."""
+    with open(OUTPUT, "w") as output:
+        json.dump(
+            {"created_at": datetime.now().isoformat(), "results": results},
+            output,
+            indent=2,
+        )
+
+
+@pytest.mark.parametrize("scale", SCALES)
+def test_endpoints_benchmark(
+    scale: int,
+    client: Client,
+    get_authorized_admin_user_data: Tuple[User, Dict],
+) -> None:
+    """Benchmark all endpoints on dataset with scale likes."""
+    user, headers = get_authorized_admin_user_data
+    dataset: Dataset = Dataset(user, headers, seed_likes(scale)[:10])
+    for name in ENDPOINT_REQUESTS:
+        result: Dict = run_benchmark(client, dataset, name)
+        results.append({"scale": scale, **result})
+    write_results()
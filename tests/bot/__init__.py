@@ -0,0 +1 @@
+"""Init module for tests of bot."""
@@ -0,0 +1,51 @@
+"""Module for testing bot."""
+from typing import Dict
+
+import pytest
+
+from bot.services.bot import RateBot
+from bot.services.config import Config
+from bot.services.utils import http_client
+
+LOAD: Dict = {
+    "target_rps": 20,
+    "ramp_up_steps": 1,
+    "step_duration": 1,
+    "hold_duration": 1,
+    "like_share": 0.5,
+}
+
+
+class TestRateBot:
+    """Class for testing RateBot."""
+
+    @pytest.mark.parametrize(
+        "option, value",
+        [
+            ("target_rps", 0),
+            ("target_rps", -1),
+            ("ramp_up_steps", -1),
+            ("step_duration", 0),
+            ("hold_duration", 0),
+            ("like_share", 1.5),
+        ],
+    )
+    def test_invalid_load(
+        self, monkeypatch: pytest.MonkeyPatch, option: str, value: float
+    ) -> None:
+        """Test invalid load option is rejected before load starts."""
+        monkeypatch.setitem(Config().__dict__, "load", {**LOAD, option: value})
+        with pytest.raises(ValueError, match=option):
+            RateBot()
+
+    def test_sizing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test threads and connections cover requests in flight within timeout."""
+        monkeypatch.setitem(Config().__dict__, "load", LOAD)
+        monkeypatch.setitem(Config().__dict__, "concurrency", 2)
+        monkeypatch.setitem(Config().__dict__, "pool_size", 2)
+        monkeypatch.setitem(Config().__dict__, "timeout", 1.5)
+        bot: RateBot = RateBot()
+        assert bot.max_in_flight == 30
+        assert bot.dispatch_executor._max_workers == 30
+        adapter = http_client.session.get_adapter("http://127.0.0.1:8000")
+        assert adapter._pool_maxsize == 30
@@ -0,0 +1,57 @@
+"""Module for testing bot requests statistics."""
+from typing import Dict
+
+import pytest
+
+from bot.services.stats import Histogram, RequestStats
+
+
+class TestHistogram:
+    """Class for testing Histogram."""
+
+    @pytest.mark.parametrize("value", [0, 1, 255, 256, 1000, 123_456, 10**9])
+    def test_bucket_round_trip(self, value: int) -> None:
+        """Test bucket value reproduces value with bounded relative error."""
+        histogram: Histogram = Histogram()
+        bucket_value: int = histogram.get_bucket_value(histogram.get_bucket(value))
+        assert value <= bucket_value
+        assert bucket_value - value <= value * 2 ** (1 - histogram.precision_bits)
+
+    def test_buckets_grow_with_values(self) -> None:
+        """Test bucket indexes do not decrease with values."""
+        histogram: Histogram = Histogram()
+        buckets = [histogram.get_bucket(value) for value in range(0, 100_000, 7)]
+        assert buckets == sorted(buckets)
+
+    def test_get_value_at_percentile(self) -> None:
+        """Test percentiles of recorded values."""
+        histogram: Histogram = Histogram()
+        for value in range(1, 1001):
+            histogram.record(value * 1000)
+        assert histogram.total == 1000
+        assert histogram.max == 1_000_000
+        for percentile, expected in ((50, 500_000), (90, 900_000), (99, 990_000)):
+            value: int = histogram.get_value_at_percentile(percentile)
+            assert expected <= value <= expected * (1 + 2**-7)
+        assert histogram.get_value_at_percentile(100) == 1_000_000
+
+    def test_get_value_at_percentile_empty(self) -> None:
+        """Test empty histogram percentile is zero."""
+        assert Histogram().get_value_at_percentile(99) == 0
+
+
+class TestRequestStats:
+    """Class for testing RequestStats."""
+
+    def test_dispatch_lag(self) -> None:
+        """Test dispatch lag is summarized apart from endpoints requests."""
+        stats: RequestStats = RequestStats()
+        stats.record("like", 0.2, 201)
+        assert "dispatch_lag" not in stats.get_summary()
+        stats.record_dispatch_lag(0.1)
+        stats.record_dispatch_lag(-0.001)
+        summary: Dict = stats.get_summary()
+        assert summary["requests"] == 1
+        assert list(summary["endpoints"]) == ["like"]
+        assert summary["dispatch_lag"]["p50_ms"] == 0
+        assert summary["dispatch_lag"]["max_ms"] == 100
@@ -0,0 +1,43 @@
+"""Module for testing bot utils."""
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from bot.services.utils import HttpClient
+
+
+def get_new_connection_error() -> requests.exceptions.ConnectionError:
+    """Get requests connection error, raised when connection was refused."""
+    reason: NewConnectionError = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/api/like/", reason=reason)
+    )
+
+
+class TestHttpClient:
+    """Class for testing HttpClient."""
+
+    @pytest.mark.parametrize(
+        "method, status_code, error, expected",
+        [
+            ("POST", None, get_new_connection_error(), True),
+            ("POST", None, requests.exceptions.ConnectTimeout(), True),
+            ("POST", None, requests.exceptions.ReadTimeout(), False),
+            ("GET", None, requests.exceptions.ReadTimeout(), True),
+            ("POST", None, requests.exceptions.ConnectionError(), False),
+            ("POST", 503, None, True),
+            ("POST", 502, None, False),
+            ("POST", 504, None, False),
+            ("GET", 502, None, True),
+            ("DELETE", 504, None, True),
+        ],
+    )
+    def test_is_retry_safe(
+        self,
+        method: str,
+        status_code: int,
+        error: requests.RequestException,
+        expected: bool,
+    ) -> None:
+        """Test only requests, which server did not process, are retried for POST."""
+        assert HttpClient().is_retry_safe(method, status_code, error) is expected
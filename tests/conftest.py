@@ -1,10 +1,32 @@
 """Pytest fixtures for 'network' project."""
 import random
+from typing import Dict, Tuple
 
 import pytest
+from django.test import Client
+from django.urls import reverse
+from faker import Faker
+
+from api.models import User
 
 
 @pytest.fixture(scope="function", autouse=True)
 def faker_seed() -> None:
     """Generate random seed for Faker instance."""
     return random.seed(version=3)
+
+
+@pytest.fixture
+def get_authorized_admin_user_data(
+    faker: Faker, django_user_model: User, client: Client
+) -> Tuple[User, Dict]:
+    """Create and get authorized user data for testing."""
+    user = django_user_model.objects.create_superuser(
+        username="test", email="test@gmail.com", password="password"
+    )
+    token_url: str = reverse("token")
+    token_data: Dict = {"username": user.username, "password": "password"}
+    response = client.post(token_url, data=token_data)
+    access_token = response.json().get("access")
+    headers: Dict = {"Authorization": f"Bearer {access_token}"}
+    return user, headers
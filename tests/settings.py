@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 import os
+import tempfile
 from datetime import timedelta
 from pathlib import Path
 
@@ -43,12 +44,11 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.coreapi.AutoSchema",
     "DATE_FORMAT": "%Y-%m-%d",
     "DATE_INPUT_FORMAT": ["%Y-%m-%d"],
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("api.authentication.CachedJWTAuthentication",),
 }
 
 MIDDLEWARE = [
+    "api.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -104,22 +104,60 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",
     "SLIDING_TOKEN_LIFETIME": timedelta(minutes=5),
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
-    "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    "TOKEN_OBTAIN_SERIALIZER": "api.serializers.TokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "api.serializers.TokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework_simplejwt.serializers.TokenVerifySerializer",
     "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
 
+ACTIVITY_FLUSH_INTERVAL = 30
+
+ACTIVITY_BACKGROUND_FLUSH = False
+
+LAST_ITEMS_PAGE_SIZE = 100
+
+LAST_ITEMS_MAX_PAGE_SIZE = 1000
+
+STATISTIC_COUNTER_SHARDS = 4
+
+STREAM_CHUNK_SIZE = 2000
+
+LIKE_BATCH_MAX_SIZE = 500
+
+POST_BULK_MAX_SIZE = 500
+
+AUTH_USER_CACHE_SIZE = 10000
+
+AUTH_USER_CACHE_TTL = 60
+
+AUTH_TOKEN_CACHE_SIZE = 10000
+
+TOKEN_BLACKLIST_REBUILD_INTERVAL = 60
+
+PASSWORD_HASHING_WORKERS = 0
+
+PASSWORD_HASHING_QUEUE_SIZE = 32
+
+PASSWORD_HASHING_RETRY_AFTER = 1
+
+METRICS_DIR = os.path.join(tempfile.gettempdir(), "api_metrics_testing")
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": "api.db",
         "NAME": "db_for_testing",
         "USER": str(os.getenv("POSTGRES_USER")),
         "PASSWORD": str(os.getenv("POSTGRES_PASSWORD")),
         "HOST": str(os.getenv("POSTGRES_HOST")),
         "PORT": str(os.getenv("POSTGRES_PORT")),
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "POOL": {
+            "MAX_SIZE": 10,
+            "TIMEOUT": 1,
+        },
     }
 }
 
@@ -154,3 +192,5 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "api.User"
+
+AUTHENTICATION_BACKENDS = ["api.backends.PooledModelBackend"]